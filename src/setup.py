@@ -26,6 +26,13 @@ setup(
     author_email="admin@spaceone.dev",
     license="Apache License 2.0",
     packages=find_packages(),
-    install_requires=["spaceone-core", "spaceone-api", "langcodes", "fakeredis"],
+    install_requires=[
+        "spaceone-core",
+        "spaceone-api",
+        "langcodes",
+        "fakeredis",
+        "cryptography",
+        "numpy",
+    ],
     zip_safe=False,
 )
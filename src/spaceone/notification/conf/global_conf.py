@@ -20,6 +20,76 @@ CACHES = {
     },
 }
 
+# In-process caches (spaceone.notification.lib.local_cache)
+LOCAL_CACHES = {
+    "plugin_session": {
+        "max_size": 256,
+        "ttl": 300,
+    },
+    "dispatch_reference": {
+        "max_size": 1024,
+        "ttl": 60,
+    },
+    "protocol": {
+        "max_size": 1024,
+        "ttl": 60,
+    },
+    # Identity caches are not invalidated by identity changes (IdentityManager.invalidate_cache
+    # is manual only), so a disabled domain or a membership change is applied after the TTL
+    "identity_domain": {
+        "max_size": 1024,
+        "ttl": 60,
+    },
+    "identity_resource": {
+        "max_size": 4096,
+        "ttl": 300,
+    },
+    "identity_project": {
+        "max_size": 4096,
+        "ttl": 60,
+    },
+    "identity_workspace_users": {
+        "max_size": 1024,
+        "ttl": 60,
+    },
+    # Expanded user IDs of projects ("*" of INTERNAL project channels)
+    "identity_project_users": {
+        "max_size": 4096,
+        "ttl": 60,
+    },
+    # Missing identity resources (ERROR_NOT_FOUND)
+    "identity_not_found": {
+        "max_size": 4096,
+        "ttl": 30,
+    },
+    # Secret data, encrypted with a per-process key (spaceone.notification.lib.secret_cache)
+    "secret_data": {
+        "max_size": 256,
+        "ttl": 60,
+    },
+    "user_secret_data": {
+        "max_size": 1024,
+        "ttl": 60,
+    },
+    # Enabled channels of users and projects (spaceone.notification.lib.delivery_plan)
+    "user_delivery_plan": {
+        "max_size": 16384,
+        "ttl": 60,
+    },
+    "project_delivery_plan": {
+        "max_size": 4096,
+        "ttl": 60,
+    },
+    # Compiled channel subscriptions, keyed by the subscriptions themselves
+    "topic_matcher": {
+        "max_size": 4096,
+        "ttl": 3600,
+    },
+}
+
+# TTL of protocols in the default cache (invalidated on change)
+PROTOCOL_CACHE_TTL = 300
+
 IDENTITY = {
     "token": {
         "token_timeout": 1800,
@@ -57,6 +127,13 @@ LOG = {
 
 CONNECTORS = {
     "PluginServiceConnector": {},
+    "NotificationPluginConnector": {
+        # 'endpoint': 'grpc://<static plugin endpoint>',
+        "max_channels": 32,
+        "idle_timeout": 600,
+        "keepalive_time_ms": 30000,
+        "keepalive_timeout_ms": 10000,
+    },
     "SpaceConnector": {
         "backend": "spaceone.core.connector.space_connector:SpaceConnector",
         "endpoints": {
@@ -69,6 +146,73 @@ CONNECTORS = {
     },
 }
 
+# Fan-out of Notification.create
+# SYNC: resolve channels in the request
+# ASYNC: persist a NotificationEvent and resolve channels in the worker
+# Domain broadcasts run as a broadcast job in the worker whenever notification_q is configured
+NOTIFICATION_FANOUT = "SYNC"
+# Users per page of a domain broadcast job
+NOTIFICATION_FANOUT_CHUNK_SIZE = 100
+# Pages of a domain broadcast job processed in parallel
+NOTIFICATION_BROADCAST_PARALLEL = 4
+# Seconds without progress before a broadcast job is resumed
+NOTIFICATION_BROADCAST_STALE_TIMEOUT = 600
+# Users of a broadcast page dispatched between progress records of the page
+# (a resumed page skips the users recorded as dispatched)
+NOTIFICATION_BROADCAST_CHECKPOINT_SIZE = 20
+
+# Deadline in seconds of the concurrent identity lookups of Notification.create
+IDENTITY_LOOKUP_TIMEOUT = 10
+
+# Max users resolved by one user channel query
+USER_CHANNEL_LOOKUP_CHUNK_SIZE = 500
+
+# Dispatch from delivery plans (enabled channels per user and project) rebuilt on channel changes,
+# instead of querying the channels of every notification
+DELIVERY_PLAN_CACHE = True
+DELIVERY_PLAN_CACHE_TTL = 3600
+
+# Exclude scheduled channels out of the current week hour in channel queries
+# (uses $bitsAllSet, which is not supported by some MongoDB compatible databases like DocumentDB)
+SCHEDULE_QUERY_FILTER = True
+
+# Match '*' (one segment) and '#' (zero or more segments) in channel subscriptions as wildcards
+# False: subscriptions match topics literally (default)
+TOPIC_WILDCARD_SUBSCRIPTIONS = False
+
+# Max concurrent secret service calls when resolving secrets of multiple channels
+SECRET_RESOLVE_PARALLEL = 8
+
+# Max notifications written by one insert_many
+NOTIFICATION_INSERT_CHUNK_SIZE = 1000
+
+# Max channels grouped into one dispatch task per protocol
+# 1: a dispatch task per channel (default), > 1: batch dispatch of channels
+DISPATCH_BATCH_SIZE = 1
+
+# Payload of dispatch tasks
+# INLINE: channel data, secret data and message are embedded in every task
+# REFERENCE: tasks carry protocol_id, channel reference and message_id only.
+#            The message is stored once in the default cache (requires a shared cache like redis)
+#            and the worker resolves references through the 'dispatch_reference' local cache.
+NOTIFICATION_QUEUE_PAYLOAD = "INLINE"
+NOTIFICATION_MESSAGE_TTL = 3600
+
+# Coalesce notification usage counters in the worker before writing them to the database
+NOTIFICATION_USAGE_AGGREGATOR = {
+    "enabled": False,
+    "flush_interval_ms": 1000,
+    "flush_events": 100,
+}
+
+# Asynchronous dispatch engine of workers (NotificationWorkerSupervisor, engine: ASYNC)
+# Plugin calls are made with grpc.aio channels, the other stages of a task in threads
+ASYNC_DISPATCH = {
+    "max_tasks": 256,  # tasks in progress per worker process
+    "protocol_concurrency": 32,  # concurrent plugin calls per protocol
+    "max_threads": 32,  # threads for database, cache and secret calls
+}
+
 # Scheduler Settings
 QUEUES = {}
 SCHEDULERS = {}
@@ -100,6 +244,9 @@ INSTALLED_PROTOCOL_PLUGINS = [
     # }
 ]
 
+# Dispatch notifications when quota counters can not be checked (False: skip them)
+QUOTA_FAIL_OPEN = True
+
 DEFAULT_QUOTA = {
     # ex: 'PROTOCOL_PLUGIN_ID': {'month': QUOTA, 'day': QUOTA},
     # 'plugin-slack-noti-protocol': {'month': -1, 'day': -1},
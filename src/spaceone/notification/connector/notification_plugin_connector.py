@@ -1,16 +1,290 @@
+import asyncio
 import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, List, Tuple
+
+import grpc
+from google.protobuf.descriptor_pool import DescriptorPool
+from google.protobuf.json_format import MessageToDict, ParseDict
+from google.protobuf.message_factory import MessageFactory
+from grpc_reflection.v1alpha.proto_reflection_descriptor_database import (
+    ProtoReflectionDescriptorDatabase,
+)
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind
+from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
 from spaceone.core.connector import BaseConnector
-from spaceone.core.connector.space_connector import SpaceConnector
+from spaceone.core.error import *
+from spaceone.core.pygrpc.client import GRPCClient
+from spaceone.core.utils import parse_grpc_endpoint
+
+from spaceone.notification.error import *
 
 __all__ = ["NotificationPluginConnector"]
 _LOGGER = logging.getLogger(__name__)
+_TRACER = trace.get_tracer(__name__)
+
+_MAX_MESSAGE_LENGTH = 1024 * 1024 * 256
+_AIO_CLOSE_GRACE = 30
+_DEFAULT_CHANNEL_POOL_CONF = {
+    "max_channels": 32,
+    "idle_timeout": 600,
+    "keepalive_time_ms": 30000,
+    "keepalive_timeout_ms": 10000,
+    "timeout": None,
+}
+
+
+class _PluginChannelPool(object):
+    """Process-wide pool of long-lived gRPC channels keyed by plugin endpoint"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._channels = OrderedDict()
+        self._stats = {"hits": 0, "creates": 0, "evictions": 0}
+
+    @contextmanager
+    def connect(self, endpoint: str, pool_conf: dict) -> GRPCClient:
+        entry = self._acquire(endpoint, pool_conf)
+        try:
+            yield entry["client"]
+        finally:
+            self._release(entry)
+
+    def evict(self, endpoint: str) -> None:
+        with self._lock:
+            if entry := self._channels.pop(endpoint, None):
+                self._evict_entry(entry)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {**self._stats, "channels": len(self._channels)}
+
+    def _acquire(self, endpoint: str, pool_conf: dict) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle_channels(now, pool_conf["idle_timeout"])
+
+            if entry := self._channels.get(endpoint):
+                self._channels.move_to_end(endpoint)
+                entry["last_used"] = now
+                entry["in_use"] += 1
+                self._stats["hits"] += 1
+                return entry
+
+        channel, client = self._create_client(endpoint, pool_conf)
+
+        with self._lock:
+            if entry := self._channels.get(endpoint):
+                # Another thread created the channel in the meantime
+                channel.close()
+                self._stats["hits"] += 1
+            else:
+                entry = {
+                    "endpoint": endpoint,
+                    "channel": channel,
+                    "client": client,
+                    "last_used": now,
+                    "in_use": 0,
+                    "evicted": False,
+                }
+                self._channels[endpoint] = entry
+                self._stats["creates"] += 1
+                _LOGGER.debug(f"[_PluginChannelPool] create channel: {endpoint}")
+
+                while len(self._channels) > pool_conf["max_channels"]:
+                    _, lru_entry = self._channels.popitem(last=False)
+                    self._evict_entry(lru_entry)
+
+            entry["last_used"] = now
+            entry["in_use"] += 1
+            return entry
+
+    def _release(self, entry: dict) -> None:
+        with self._lock:
+            entry["in_use"] -= 1
+            entry["last_used"] = time.monotonic()
+
+            if entry["evicted"] and entry["in_use"] == 0:
+                entry["channel"].close()
+
+    def _evict_idle_channels(self, now: float, idle_timeout: int) -> None:
+        for endpoint, entry in list(self._channels.items()):
+            if entry["in_use"] == 0 and now - entry["last_used"] > idle_timeout:
+                del self._channels[endpoint]
+                self._evict_entry(entry)
+
+    def _evict_entry(self, entry: dict) -> None:
+        _LOGGER.debug(f'[_PluginChannelPool] evict channel: {entry["endpoint"]}')
+        entry["evicted"] = True
+        self._stats["evictions"] += 1
+
+        if entry["in_use"] == 0:
+            entry["channel"].close()
+
+    @staticmethod
+    def _create_client(endpoint: str, pool_conf: dict) -> Tuple[grpc.Channel, Any]:
+        channel = _create_channel(grpc, endpoint, pool_conf)
+
+        try:
+            grpc.channel_ready_future(channel).result(timeout=3)
+            client = GRPCClient(channel, {}, endpoint, pool_conf["timeout"])
+        except Exception as e:
+            channel.close()
+            raise ERROR_GRPC_CONNECTION(channel=endpoint, message=str(e))
+
+        return channel, client
+
+
+class _AioPluginChannelPool(object):
+    """Pool of grpc.aio channels keyed by plugin endpoint, bound to one event loop
+
+    Stubs are bound from the reflection service of the plugin,
+    which is read once per endpoint with a blocking channel in a thread.
+    """
+
+    def __init__(self):
+        self._channels = OrderedDict()
+        self._locks = {}
+        self._stats = {"hits": 0, "creates": 0, "evictions": 0}
+
+    async def get_methods(self, endpoint: str, pool_conf: dict) -> dict:
+        now = time.monotonic()
+        self._evict_idle_channels(now, pool_conf["idle_timeout"])
+
+        lock = self._locks.setdefault(endpoint, asyncio.Lock())
+        async with lock:
+            if entry := self._channels.get(endpoint):
+                self._channels.move_to_end(endpoint)
+                self._stats["hits"] += 1
+            else:
+                entry = await self._create_entry(endpoint, pool_conf)
+                self._channels[endpoint] = entry
+                self._stats["creates"] += 1
+                _LOGGER.debug(f"[_AioPluginChannelPool] create channel: {endpoint}")
+
+                while len(self._channels) > pool_conf["max_channels"]:
+                    _, lru_entry = self._channels.popitem(last=False)
+                    self._evict_entry(lru_entry)
+
+        entry["last_used"] = now
+        return entry["methods"]
+
+    def evict(self, endpoint: str) -> None:
+        if entry := self._channels.pop(endpoint, None):
+            self._evict_entry(entry)
+
+    async def close(self) -> None:
+        for entry in self._channels.values():
+            await entry["channel"].close()
+
+        # Channels and locks are bound to the event loop
+        self._channels.clear()
+        self._locks.clear()
+
+    def get_stats(self) -> dict:
+        return {**self._stats, "channels": len(self._channels)}
+
+    def _evict_idle_channels(self, now: float, idle_timeout: int) -> None:
+        for endpoint, entry in list(self._channels.items()):
+            if now - entry["last_used"] > idle_timeout:
+                del self._channels[endpoint]
+                self._evict_entry(entry)
+
+    def _evict_entry(self, entry: dict) -> None:
+        _LOGGER.debug(f'[_AioPluginChannelPool] evict channel: {entry["endpoint"]}')
+        self._stats["evictions"] += 1
+
+        # Calls in progress finish within the grace period
+        asyncio.ensure_future(entry["channel"].close(grace=_AIO_CLOSE_GRACE))
+
+    async def _create_entry(self, endpoint: str, pool_conf: dict) -> dict:
+        method_descs = await asyncio.to_thread(
+            self._load_method_descs, endpoint, pool_conf
+        )
+        channel = _create_channel(grpc.aio, endpoint, pool_conf)
+
+        methods = {}
+        for method_name, (
+            method_key,
+            request_cls,
+            response_cls,
+        ) in method_descs.items():
+            methods[method_name] = (
+                request_cls,
+                channel.unary_unary(
+                    method_key,
+                    request_serializer=request_cls.SerializeToString,
+                    response_deserializer=response_cls.FromString,
+                ),
+            )
+
+        return {
+            "endpoint": endpoint,
+            "channel": channel,
+            "methods": methods,
+            "last_used": time.monotonic(),
+        }
+
+    @staticmethod
+    def _load_method_descs(endpoint: str, pool_conf: dict) -> dict:
+        channel = _create_channel(grpc, endpoint, pool_conf)
+
+        try:
+            grpc.channel_ready_future(channel).result(timeout=3)
+            reflection_db = ProtoReflectionDescriptorDatabase(channel)
+            desc_pool = DescriptorPool(reflection_db)
+            message_factory = MessageFactory(desc_pool)
+
+            method_descs = {}
+            for service in reflection_db.get_services():
+                service_desc = desc_pool.FindServiceByName(service)
+                for method_desc in service_desc.methods:
+                    method_descs[f"{service_desc.name}.{method_desc.name}"] = (
+                        f"/{service}/{method_desc.name}",
+                        message_factory.GetPrototype(method_desc.input_type),
+                        message_factory.GetPrototype(method_desc.output_type),
+                    )
+
+            return method_descs
+        except Exception as e:
+            raise ERROR_GRPC_CONNECTION(channel=endpoint, message=str(e))
+        finally:
+            channel.close()
+
+
+def _create_channel(grpc_module, endpoint: str, pool_conf: dict):
+    e = parse_grpc_endpoint(endpoint)
+    options = [
+        ("grpc.max_send_message_length", _MAX_MESSAGE_LENGTH),
+        ("grpc.max_receive_message_length", _MAX_MESSAGE_LENGTH),
+        ("grpc.keepalive_time_ms", pool_conf["keepalive_time_ms"]),
+        ("grpc.keepalive_timeout_ms", pool_conf["keepalive_timeout_ms"]),
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.max_pings_without_data", 0),
+    ]
+
+    if e["ssl_enabled"]:
+        return grpc_module.secure_channel(
+            e["endpoint"], grpc.ssl_channel_credentials(), options=options
+        )
+    else:
+        return grpc_module.insecure_channel(e["endpoint"], options=options)
+
+
+_CHANNEL_POOL = _PluginChannelPool()
+_AIO_CHANNEL_POOL = _AioPluginChannelPool()
 
 
 class NotificationPluginConnector(BaseConnector):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.noti_plugin_connector = None
+        self.endpoint = None
+        self.pool_conf = {**_DEFAULT_CHANNEL_POOL_CONF, **self.config}
 
     def initialize(self, endpoint: str):
         static_endpoint = self.config.get("endpoint")
@@ -18,22 +292,27 @@ class NotificationPluginConnector(BaseConnector):
         if static_endpoint:
             endpoint = static_endpoint
 
-        self.noti_plugin_connector: SpaceConnector = self.locator.get_connector(
-            "SpaceConnector", endpoint=endpoint, token="NO_TOKEN"
-        )
+        self.endpoint = endpoint
+
+        with _CHANNEL_POOL.connect(self.endpoint, self.pool_conf):
+            pass
 
     def init(self, options, domain_id=None):
-        return self.noti_plugin_connector.dispatch(
-            "Protocol.init", {"options": options}
-        )
+        return self._dispatch("Protocol.init", {"options": options})
 
     def verify(self, options, secret_data):
         params = {"options": options, "secret_data": secret_data}
 
-        self.noti_plugin_connector.dispatch("Protocol.verify", params)
+        self._dispatch("Protocol.verify", params)
 
     def dispatch_notification(
-            self, secret_data: dict, channel_data, notification_type, message, options={}, domain_id=None
+        self,
+        secret_data: dict,
+        channel_data,
+        notification_type,
+        message,
+        options={},
+        domain_id=None,
     ):
         params = {
             "secret_data": secret_data,
@@ -43,4 +322,151 @@ class NotificationPluginConnector(BaseConnector):
             "options": options,
         }
 
-        return self.noti_plugin_connector.dispatch("Notification.dispatch", params)
+        return self._dispatch("Notification.dispatch", params)
+
+    def dispatch_notification_batch(
+        self,
+        secret_data: dict,
+        items: list,
+        notification_type: str,
+        options: dict = None,
+        domain_id: str = None,
+    ) -> dict:
+        params = {
+            "secret_data": secret_data,
+            "items": items,
+            "notification_type": notification_type,
+            "options": options or {},
+        }
+
+        return self._dispatch("Notification.dispatch_batch", params)
+
+    async def async_dispatch_notification(
+        self,
+        endpoint: str,
+        secret_data: dict,
+        channel_data,
+        notification_type: str,
+        message: dict,
+        options: dict = None,
+    ) -> dict:
+        params = {
+            "secret_data": secret_data,
+            "channel_data": channel_data,
+            "notification_type": notification_type,
+            "message": message,
+            "options": options or {},
+        }
+
+        return await self._async_dispatch(endpoint, "Notification.dispatch", params)
+
+    async def async_dispatch_notification_batch(
+        self,
+        endpoint: str,
+        secret_data: dict,
+        items: list,
+        notification_type: str,
+        options: dict = None,
+    ) -> dict:
+        params = {
+            "secret_data": secret_data,
+            "items": items,
+            "notification_type": notification_type,
+            "options": options or {},
+        }
+
+        return await self._async_dispatch(
+            endpoint, "Notification.dispatch_batch", params
+        )
+
+    @staticmethod
+    def get_channel_pool_stats() -> dict:
+        return _CHANNEL_POOL.get_stats()
+
+    @staticmethod
+    def get_aio_channel_pool_stats() -> dict:
+        return _AIO_CHANNEL_POOL.get_stats()
+
+    @staticmethod
+    async def close_aio_channels() -> None:
+        await _AIO_CHANNEL_POOL.close()
+
+    def _dispatch(self, method: str, params: dict) -> dict:
+        resource, verb = method.split(".")
+
+        with _TRACER.start_as_current_span(method, kind=SpanKind.CLIENT):
+            try:
+                with _CHANNEL_POOL.connect(self.endpoint, self.pool_conf) as client:
+                    if not hasattr(getattr(client, resource, None), verb):
+                        raise ERROR_UNSUPPORTED_PLUGIN_METHOD(method=method)
+
+                    response = getattr(getattr(client, resource), verb)(
+                        params, metadata=self._get_connection_metadata()
+                    )
+            except ERROR_GRPC_CONNECTION:
+                _CHANNEL_POOL.evict(self.endpoint)
+                raise
+            except ERROR_INTERNAL_API as e:
+                if getattr(e, "status_code", None) == "UNIMPLEMENTED":
+                    raise ERROR_UNSUPPORTED_PLUGIN_METHOD(method=method)
+
+                raise
+
+        return MessageToDict(response, preserving_proto_field_name=True)
+
+    async def _async_dispatch(self, endpoint: str, method: str, params: dict) -> dict:
+        """Call a plugin method with a grpc.aio channel of the event loop
+
+        Errors are raised as the blocking client of spaceone.core does.
+        """
+
+        endpoint = self.config.get("endpoint") or endpoint
+
+        with _TRACER.start_as_current_span(method, kind=SpanKind.CLIENT):
+            try:
+                methods = await _AIO_CHANNEL_POOL.get_methods(endpoint, self.pool_conf)
+            except ERROR_GRPC_CONNECTION:
+                _AIO_CHANNEL_POOL.evict(endpoint)
+                raise
+
+            if method not in methods:
+                raise ERROR_UNSUPPORTED_PLUGIN_METHOD(method=method)
+
+            request_cls, multi_callable = methods[method]
+
+            try:
+                response = await multi_callable(
+                    ParseDict(params, request_cls()),
+                    metadata=self._get_connection_metadata(),
+                    timeout=self.pool_conf["timeout"],
+                )
+            except grpc.aio.AioRpcError as e:
+                if e.code() == grpc.StatusCode.UNAVAILABLE:
+                    _AIO_CHANNEL_POOL.evict(endpoint)
+                    raise ERROR_GRPC_CONNECTION(channel=endpoint, message=e.details())
+                elif e.code() == grpc.StatusCode.UNAUTHENTICATED:
+                    raise ERROR_AUTHENTICATE_FAILURE(message=e.details())
+                elif e.code() == grpc.StatusCode.PERMISSION_DENIED:
+                    raise ERROR_PERMISSION_DENIED()
+                elif e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                    raise ERROR_UNSUPPORTED_PLUGIN_METHOD(method=method)
+
+                error = ERROR_INTERNAL_API(message=e.details())
+                if e.details() and e.details().startswith("ERROR_"):
+                    error.error_code = e.details().split(":", 1)[0]
+
+                raise error
+
+        return MessageToDict(response, preserving_proto_field_name=True)
+
+    @staticmethod
+    def _get_connection_metadata() -> List[Tuple]:
+        metadata = [("token", "NO_TOKEN")]
+
+        carrier = {}
+        TraceContextTextMapPropagator().inject(carrier)
+
+        if traceparent := carrier.get("traceparent"):
+            metadata.append(("traceparent", traceparent))
+
+        return metadata
@@ -20,3 +20,9 @@ class ERROR_WRONG_SCHEDULE_DAY(ERROR_BASE):
 
 class ERROR_INVALID_DOMAIN(ERROR_BASE):
     _message = "Invalid resource_id (domain_id={resource_id})"
+
+class ERROR_QUEUE_MESSAGE_NOT_FOUND(ERROR_BASE):
+    _message = "Queued notification message is expired or not found. (message_id = {message_id})"
+
+class ERROR_IDENTITY_LOOKUP_TIMEOUT(ERROR_BASE):
+    _message = "Identity lookups are not finished in {timeout} seconds. (lookups = {lookups})"
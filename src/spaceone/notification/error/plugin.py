@@ -90,4 +90,8 @@ class ERROR_TOO_MANY_MATCH(ERROR_BASE):
 
 
 class ERROR_UNSUPPORTED_SCHEDULE(ERROR_BASE):
-    _message = "supported schedules: {supported}, requested: {requested}"
\ No newline at end of file
+    _message = "supported schedules: {supported}, requested: {requested}"
+
+
+class ERROR_UNSUPPORTED_PLUGIN_METHOD(ERROR_BASE):
+    _message = "Plugin does not support the method. (method = {method})"
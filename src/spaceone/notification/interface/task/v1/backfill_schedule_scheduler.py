@@ -0,0 +1,45 @@
+import logging
+
+from spaceone.core import config
+from spaceone.core.locator import Locator
+from spaceone.core.scheduler import IntervalScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BackfillScheduleScheduler(IntervalScheduler):
+
+    def __init__(self, queue, interval):
+        super().__init__(queue, interval)
+        self.locator = Locator()
+        self._init_config()
+        self._create_metadata()
+
+    def _init_config(self):
+        self._token = config.get_global('TOKEN')
+
+    def _create_metadata(self):
+        self._metadata = {
+            'token': self._token,
+            'service': 'notification',
+            'resource': 'Notification',
+            'verb': 'backfill_schedule_week_hours'
+        }
+
+    def create_task(self):
+        task = {
+            'name': 'backfill_schedule_scheduler',
+            'version': 'v1',
+            'executionEngine': 'BaseWorker',
+            'stages': [{
+                'locator': 'SERVICE',
+                'name': 'NotificationService',
+                'metadata': self._metadata,
+                'method': 'backfill_schedule_week_hours',
+                'params': {
+                    'params': {}
+                }
+            }]
+        }
+
+        return [task]
@@ -0,0 +1,386 @@
+import asyncio
+import json
+import logging
+import os
+import signal
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Process
+from multiprocessing.connection import wait
+
+from spaceone.core import config, queue
+from spaceone.core.locator import Locator
+from spaceone.core.logger import set_logger
+from spaceone.core.scheduler.worker import BaseWorker, SpaceoneTask
+
+from spaceone.notification.lib.reliable_queue import ack
+
+_LOGGER = logging.getLogger(__name__)
+_SUPERVISORS = []
+
+_ASYNC_DISPATCH_METHODS = ["dispatch_notification", "dispatch_notification_batch"]
+_DEFAULT_ASYNC_DISPATCH_CONF = {
+    "max_tasks": 256,
+    "protocol_concurrency": 32,
+    "max_threads": 32,
+}
+
+# Restart delay of workers which exited soon after start (crash loop)
+_MIN_WORKER_UPTIME = 5
+_RESTART_DELAY = 1
+
+
+class NotificationWorker(BaseWorker):
+    """Dispatch process of a queue which drains its current task on SIGTERM"""
+
+    def __init__(self, queue, **kwargs):
+        super().__init__(queue, **kwargs)
+        self._is_busy = False
+        self._is_stopping = False
+
+    def run(self):
+        config.set_global_force(**self.global_config)
+        set_logger()
+
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+
+        try:
+            while not self._is_stopping:
+                binary_task = queue.get(self.queue)
+                self._is_busy = True
+
+                try:
+                    self._execute(binary_task)
+                finally:
+                    self._is_busy = False
+        except SystemExit:
+            pass
+
+        self._stop_usage_aggregator()
+        _LOGGER.info(f"[{self._name_}] worker is stopped: {os.getpid()}")
+
+    def _execute(self, binary_task: bytes) -> None:
+        if binary_task is None:
+            return
+
+        try:
+            task = SpaceoneTask(json.loads(binary_task.decode()))
+            task.execute()
+        except Exception as e:
+            _LOGGER.error(f"[{self._name_}] failed to decode task: {binary_task}, {e}")
+        finally:
+            ack(self.queue, binary_task)
+
+    def _handle_stop(self, signum, frame):
+        self._is_stopping = True
+
+        # Waiting for the queue, so there is no task to drain
+        if not self._is_busy:
+            raise SystemExit(0)
+
+    @staticmethod
+    def _stop_usage_aggregator():
+        from spaceone.notification.manager.notification_usage_manager import (
+            NotificationUsageManager,
+        )
+
+        NotificationUsageManager.stop_usage_aggregator()
+
+
+class NotificationAsyncWorker(NotificationWorker):
+    """Dispatch process which runs the plugin calls of many tasks on an event loop
+
+    dispatch_notification(_batch) tasks are resolved and completed by NotificationService
+    in threads (database, cache and secret calls are blocking), while plugin calls are made
+    with grpc.aio channels, up to protocol_concurrency calls per protocol.
+    Other tasks are executed in threads. Tasks are acknowledged as they finish.
+
+    ASYNC_DISPATCH = {
+        'max_tasks': 256,               # tasks in progress
+        'protocol_concurrency': 32,     # concurrent plugin calls per protocol
+        'max_threads': 32,              # threads of blocking stages
+    }
+    """
+
+    def __init__(self, queue, **kwargs):
+        super().__init__(queue, **kwargs)
+        self._tasks = set()
+
+    def run(self):
+        config.set_global_force(**self.global_config)
+        set_logger()
+
+        asyncio.run(self._run_engine())
+
+        self._stop_usage_aggregator()
+        _LOGGER.info(f"[{self._name_}] worker is stopped: {os.getpid()}")
+
+    async def _run_engine(self):
+        from spaceone.notification.connector.notification_plugin_connector import (
+            NotificationPluginConnector,
+        )
+
+        engine_conf = {
+            **_DEFAULT_ASYNC_DISPATCH_CONF,
+            **config.get_global("ASYNC_DISPATCH", {}),
+        }
+
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=engine_conf["max_threads"])
+        )
+
+        stop_event = asyncio.Event()
+        for signum in [signal.SIGTERM, signal.SIGINT]:
+            loop.add_signal_handler(signum, self._handle_async_stop, stop_event)
+
+        self._locator = Locator()
+        self._plugin_mgr = None
+        self._protocol_limiters = defaultdict(
+            lambda: asyncio.Semaphore(engine_conf["protocol_concurrency"])
+        )
+        self._task_slots = threading.BoundedSemaphore(engine_conf["max_tasks"])
+
+        # Tasks are fetched by a daemon thread, since a queue backend may block without timeout
+        threading.Thread(
+            target=self._fetch_tasks, args=(loop,), name="fetcher", daemon=True
+        ).start()
+
+        await stop_event.wait()
+
+        _LOGGER.info(f"[{self._name_}] drain {len(self._tasks)} tasks")
+        while self._tasks:
+            await asyncio.wait(self._tasks)
+
+        await NotificationPluginConnector.close_aio_channels()
+
+    def _handle_async_stop(self, stop_event: asyncio.Event) -> None:
+        self._is_stopping = True
+        stop_event.set()
+
+    def _fetch_tasks(self, loop: asyncio.AbstractEventLoop) -> None:
+        while not self._is_stopping:
+            if not self._task_slots.acquire(timeout=1):
+                continue
+
+            binary_task = queue.get(self.queue)
+
+            if binary_task is None:
+                self._task_slots.release()
+                continue
+
+            if not self._is_stopping:
+                try:
+                    loop.call_soon_threadsafe(self._start_task, binary_task)
+                    continue
+                except RuntimeError:
+                    # Event loop is closed
+                    pass
+
+            # Fetched during drain, give it back to other workers
+            queue.put(self.queue, binary_task)
+            ack(self.queue, binary_task)
+            self._task_slots.release()
+
+    def _start_task(self, binary_task: bytes) -> None:
+        task = asyncio.ensure_future(self._execute_async(binary_task))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _execute_async(self, binary_task: bytes) -> None:
+        try:
+            task = json.loads(binary_task.decode())
+            stages = task.get("stages", [])
+
+            if len(stages) == 1 and self._is_async_dispatch(stages[0]):
+                await self._dispatch(stages[0])
+            else:
+                await asyncio.to_thread(SpaceoneTask(task).execute)
+        except Exception as e:
+            _LOGGER.error(
+                f"[{self._name_}] failed to execute task: {binary_task}, {e}",
+                exc_info=True,
+            )
+        finally:
+            await asyncio.to_thread(ack, self.queue, binary_task)
+            self._task_slots.release()
+
+    async def _dispatch(self, stage: dict) -> None:
+        dispatch = await asyncio.to_thread(
+            self._call_service,
+            stage,
+            "prepare_dispatch",
+            stage["method"],
+            stage["params"],
+        )
+
+        if dispatch is None:
+            return
+
+        if dispatch["endpoint"]:
+            plugin_mgr = await self._get_plugin_manager()
+            results = await plugin_mgr.async_dispatch_notification_batch(
+                dispatch["endpoint"],
+                dispatch["secret_data"],
+                dispatch["channels"],
+                dispatch["notification_type"],
+                dispatch["message"],
+                dispatch["options"],
+                dispatch["plugin_metadata"],
+                self._protocol_limiters[dispatch["protocol_id"]],
+            )
+        else:
+            # Plugin session is not initialized, retried with a refreshed session
+            results = [None] * len(dispatch["channels"])
+
+        await asyncio.to_thread(
+            self._call_service, stage, "complete_dispatch", dispatch, results
+        )
+
+    async def _get_plugin_manager(self):
+        from spaceone.notification.manager.plugin_manager import PluginManager
+
+        # Connectors of the manager are blocking to create
+        if self._plugin_mgr is None:
+            self._plugin_mgr = await asyncio.to_thread(
+                self._locator.get_manager, PluginManager
+            )
+
+        return self._plugin_mgr
+
+    def _call_service(self, stage: dict, method: str, *args):
+        service = self._locator.get_service(stage["name"], stage["metadata"])
+        return getattr(service, method)(*args)
+
+    @staticmethod
+    def _is_async_dispatch(stage: dict) -> bool:
+        return (
+            stage.get("locator") == "SERVICE"
+            and stage.get("name") == "NotificationService"
+            and stage.get("method") in _ASYNC_DISPATCH_METHODS
+        )
+
+
+class NotificationWorkerSupervisor(Process):
+    """Fork and supervise NotificationWorker processes of a queue
+
+    Workers share nothing but the queue. They are forked before any connection is made,
+    so each worker keeps its own database and cache connections, plugin channel pool
+    and local caches. Exited workers are restarted.
+    On SIGTERM, workers finish their current tasks and exit within drain_timeout.
+
+    Args:
+        queue (str): queue name
+        processes (int): number of workers (default: CPU count)
+        drain_timeout (int): seconds to wait for workers on SIGTERM before killing them
+        engine (str): 'SYNC (NotificationWorker) | ASYNC (NotificationAsyncWorker)'
+    """
+
+    def __init__(self, queue, processes=0, drain_timeout=25, engine="SYNC", **kwargs):
+        self._name_ = f"supervisor-{queue}"
+        self.queue = queue
+        self.processes = processes or _get_cpu_count()
+        self.worker_cls = (
+            NotificationAsyncWorker if engine == "ASYNC" else NotificationWorker
+        )
+        self.drain_timeout = drain_timeout
+        self.global_config = config.get_global()
+        self._workers = {}
+        self._is_stopping = False
+        super().__init__()
+
+    def start(self):
+        super().start()
+        _SUPERVISORS.append(self)
+
+        # The scheduler server has no SIGTERM handler (and ignores it as PID 1 of a container)
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, _forward_stop_signal)
+
+    def run(self):
+        config.set_global_force(**self.global_config)
+        set_logger()
+
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+
+        _LOGGER.info(
+            f"[{self._name_}] start {self.processes} {self.worker_cls.__name__}: "
+            f"queue = {self.queue}"
+        )
+
+        for index in range(self.processes):
+            self._start_worker(index)
+
+        while not self._is_stopping:
+            sentinels = {
+                worker.sentinel: index for index, worker in self._workers.items()
+            }
+
+            for sentinel in wait(list(sentinels), timeout=1):
+                if self._is_stopping:
+                    break
+
+                self._restart_worker(sentinels[sentinel])
+
+        self._drain_workers()
+
+    def _start_worker(self, index: int) -> None:
+        worker = self.worker_cls(self.queue)
+        worker.start()
+        worker.started_at = time.monotonic()
+        self._workers[index] = worker
+
+        _LOGGER.debug(f"[{self._name_}] worker {index} is started: {worker.pid}")
+
+    def _restart_worker(self, index: int) -> None:
+        worker = self._workers[index]
+        worker.join()
+
+        _LOGGER.error(
+            f"[{self._name_}] worker {index} is exited: "
+            f"pid = {worker.pid}, exitcode = {worker.exitcode}. restart worker."
+        )
+
+        if time.monotonic() - worker.started_at < _MIN_WORKER_UPTIME:
+            time.sleep(_RESTART_DELAY)
+
+        if not self._is_stopping:
+            self._start_worker(index)
+
+    def _drain_workers(self) -> None:
+        _LOGGER.info(f"[{self._name_}] drain workers: timeout = {self.drain_timeout}")
+
+        for worker in self._workers.values():
+            if worker.is_alive():
+                worker.terminate()
+
+        deadline = time.monotonic() + self.drain_timeout
+        for index, worker in self._workers.items():
+            worker.join(max(deadline - time.monotonic(), 0))
+
+            if worker.is_alive():
+                _LOGGER.error(
+                    f"[{self._name_}] worker {index} is not drained. kill worker: {worker.pid}"
+                )
+                worker.kill()
+                worker.join()
+
+    def _handle_stop(self, signum, frame):
+        self._is_stopping = True
+
+
+def _forward_stop_signal(signum, frame):
+    for supervisor in _SUPERVISORS:
+        if supervisor.is_alive():
+            os.kill(supervisor.pid, signal.SIGTERM)
+
+
+def _get_cpu_count() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+
+    return os.cpu_count() or 1
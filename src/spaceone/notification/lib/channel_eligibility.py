@@ -0,0 +1,83 @@
+import numpy as np
+
+from spaceone.notification.lib.schedule import make_week_hours
+from spaceone.notification.lib.topic_matcher import get_topic_matcher
+
+__all__ = ["evaluate_channel_eligibility"]
+
+_LEVEL_CODES = {"LV1": 1, "LV2": 2, "LV3": 3, "LV4": 4, "LV5": 5}
+_ELIGIBILITY_DTYPE = np.dtype(
+    [
+        ("enabled", np.bool_),
+        ("subscribe_off", np.bool_),
+        ("topic_match", np.bool_),
+        ("is_scheduled", np.bool_),
+        ("week_hours_byte", np.uint8),
+        ("level_code", np.uint8),
+    ]
+)
+
+
+def evaluate_channel_eligibility(
+    channels: list, topic: str, week_hour: int, notification_level: str = "ALL"
+) -> np.ndarray:
+    """Dispatch mask of channels for a notification
+
+    Applies the rules of check_subscribe_for_dispatch, check_schedule_for_dispatch
+    and check_notification_level_for_dispatch of NotificationService.
+    The eligibility fields of the channels are loaded into one structured array
+    and the mask is computed with vectorized operations.
+    Topic matches and masks of schedules saved before week hour masks
+    are computed once per distinct value.
+
+    User channels have no notification level, so they are evaluated with "ALL".
+    """
+
+    byte_index = week_hour >> 3
+    topic_matches = {}
+    legacy_week_hours = {}
+
+    def _match_topic(subscriptions) -> bool:
+        key = tuple(subscriptions)
+        if key not in topic_matches:
+            topic_matches[key] = get_topic_matcher(key).match(topic)
+
+        return topic_matches[key]
+
+    def _get_week_hours_byte(schedule) -> int:
+        if week_hours := schedule.week_hours:
+            return week_hours[byte_index]
+
+        key = (tuple(schedule.day_of_week), schedule.start_hour, schedule.end_hour)
+        if key not in legacy_week_hours:
+            legacy_week_hours[key] = make_week_hours(*key)
+
+        return legacy_week_hours[key][byte_index]
+
+    fields = np.array(
+        [
+            (
+                channel.state == "ENABLED",
+                channel.is_subscribe is False,
+                bool(channel.is_subscribe) and _match_topic(channel.subscriptions),
+                bool(channel.is_scheduled),
+                _get_week_hours_byte(channel.schedule) if channel.is_scheduled else 0,
+                _LEVEL_CODES.get(getattr(channel, "notification_level", None), 0),
+            )
+            for channel in channels
+        ],
+        dtype=_ELIGIBILITY_DTYPE,
+    )
+
+    dispatch_mask = fields["enabled"] & (
+        fields["subscribe_off"] | fields["topic_match"]
+    )
+    dispatch_mask &= ~fields["is_scheduled"] | (
+        (fields["week_hours_byte"] >> (week_hour & 7)) & 1
+    ).astype(np.bool_)
+
+    if notification_level != "ALL":
+        level_code = _LEVEL_CODES.get(notification_level, 0)
+        dispatch_mask &= (fields["level_code"] == level_code) & (level_code > 0)
+
+    return dispatch_mask
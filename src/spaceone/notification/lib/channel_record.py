@@ -0,0 +1,79 @@
+__all__ = ["ProjectChannelRecord", "UserChannelRecord", "ScheduleRecord"]
+
+
+class ScheduleRecord(object):
+    __slots__ = ("day_of_week", "start_hour", "end_hour", "week_hours")
+
+    def __init__(self, schedule: dict):
+        self.day_of_week = schedule.get("day_of_week", [])
+        self.start_hour = schedule.get("start_hour", 0)
+        self.end_hour = schedule.get("end_hour")
+        self.week_hours = schedule.get("week_hours")
+
+
+class ChannelRecord(object):
+    """Read-only channel fields used by the dispatch loop
+
+    Records are built from raw documents of a projected query,
+    which skips the document hydration and change tracking of mongoengine.
+    """
+
+    __slots__ = ()
+    _defaults = {
+        "state": "ENABLED",
+        "data": {},
+        "is_subscribe": False,
+        "subscriptions": [],
+        "is_scheduled": False,
+    }
+
+    @classmethod
+    def from_son(cls, son: dict):
+        record = cls.__new__(cls)
+
+        for field in cls.__slots__:
+            setattr(record, field, son.get(field, cls._defaults.get(field)))
+
+        if record.schedule is not None:
+            record.schedule = ScheduleRecord(record.schedule)
+
+        return record
+
+    @classmethod
+    def get_fields(cls) -> tuple:
+        return cls.__slots__
+
+
+class ProjectChannelRecord(ChannelRecord):
+    __slots__ = (
+        "project_channel_id",
+        "state",
+        "data",
+        "is_subscribe",
+        "subscriptions",
+        "notification_level",
+        "is_scheduled",
+        "schedule",
+        "secret_id",
+        "protocol_id",
+        "protocol_snapshot",
+        "project_id",
+        "workspace_id",
+    )
+    _defaults = {**ChannelRecord._defaults, "notification_level": "LV1"}
+
+
+class UserChannelRecord(ChannelRecord):
+    __slots__ = (
+        "user_channel_id",
+        "state",
+        "data",
+        "is_subscribe",
+        "subscriptions",
+        "is_scheduled",
+        "schedule",
+        "user_secret_id",
+        "protocol_id",
+        "protocol_snapshot",
+        "user_id",
+    )
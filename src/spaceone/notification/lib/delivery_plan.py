@@ -0,0 +1,174 @@
+import logging
+import threading
+from typing import Callable, Iterable
+
+from bson import json_util
+from spaceone.core import cache, config
+from spaceone.notification.lib import invalidation_bus
+from spaceone.notification.lib.local_cache import get_local_cache
+
+__all__ = ["DeliveryPlanCache", "get_delivery_plan_cache"]
+
+_LOGGER = logging.getLogger(__name__)
+_DELIVERY_PLAN_CACHES = {}
+_LOCK = threading.Lock()
+
+
+@cache.connect
+def _get_cache_connection(cache_cls):
+    return getattr(cache_cls, "conn", None)
+
+
+class DeliveryPlanCache(object):
+    """Materialized delivery plans of channel owners (users or projects)
+
+    A delivery plan is the list of dispatch fields of the enabled channels of an owner.
+    Plans are kept as channel records in a local cache and as raw documents
+    in the shared cache, so a dispatch needs a single key lookup per owner.
+    Channel managers rebuild the plan of an owner on every change of its channels.
+    """
+
+    def __init__(self, plan_type: str, record_cls):
+        self._plan_type = plan_type
+        self._record_cls = record_cls
+        self._topic = f"{plan_type}_delivery_plan"
+        self._local_cache = get_local_cache(self._topic)
+        invalidation_bus.subscribe(self._topic, self._delete_local_plan)
+
+    def get_many(
+        self,
+        owner_ids: Iterable[str],
+        domain_id: str,
+        load_func: Callable[[list, str], dict],
+    ) -> dict:
+        """Get the plans of owners and load the missing ones at once
+
+        load_func is called with the missing owner ids and the domain id and returns
+        a dict of owner id to raw channel documents. Returns a dict of owner id to
+        channel records, including empty plans of owners without channels.
+        """
+
+        plans = {}
+        missing_ids = []
+
+        for owner_id in dict.fromkeys(owner_ids):
+            if (plan := self._local_cache.get((domain_id, owner_id))) is not None:
+                plans[owner_id] = plan
+            else:
+                missing_ids.append(owner_id)
+
+        if missing_ids:
+            plan_docs = self._get_shared_plans(missing_ids, domain_id)
+
+            if load_ids := [
+                owner_id for owner_id in missing_ids if owner_id not in plan_docs
+            ]:
+                loaded_docs = load_func(load_ids, domain_id)
+                loaded_docs = {
+                    owner_id: loaded_docs.get(owner_id, []) for owner_id in load_ids
+                }
+
+                # A plan rebuilt by a channel change during the load is newer
+                if skipped_ids := self._set_shared_plans(
+                    loaded_docs, domain_id, nx=True
+                ):
+                    loaded_docs.update(self._get_shared_plans(skipped_ids, domain_id))
+
+                plan_docs.update(loaded_docs)
+
+            for owner_id, docs in plan_docs.items():
+                plan = [self._record_cls.from_son(doc) for doc in docs]
+                self._local_cache.set((domain_id, owner_id), plan)
+                plans[owner_id] = plan
+
+        return plans
+
+    def set(self, owner_id: str, domain_id: str, docs: list) -> None:
+        self._set_shared_plans({owner_id: docs}, domain_id)
+        invalidation_bus.publish(self._topic, [domain_id, owner_id])
+
+    def delete_many(self, owner_ids: Iterable[str], domain_id: str) -> None:
+        owner_ids = list(dict.fromkeys(owner_ids))
+
+        if conn := self._get_connection():
+            try:
+                if owner_ids:
+                    conn.delete(
+                        *[self._make_key(owner_id, domain_id) for owner_id in owner_ids]
+                    )
+            except Exception as e:
+                _LOGGER.error(f"[DeliveryPlanCache] failed to delete plans: {e}")
+
+        for owner_id in owner_ids:
+            invalidation_bus.publish(self._topic, [domain_id, owner_id])
+
+    def _get_shared_plans(self, owner_ids: list, domain_id: str) -> dict:
+        plan_docs = {}
+
+        if conn := self._get_connection():
+            try:
+                values = conn.mget(
+                    [self._make_key(owner_id, domain_id) for owner_id in owner_ids]
+                )
+                for owner_id, value in zip(owner_ids, values):
+                    if value is not None:
+                        plan_docs[owner_id] = json_util.loads(value)
+            except Exception as e:
+                _LOGGER.error(f"[DeliveryPlanCache] failed to get plans: {e}")
+
+        return plan_docs
+
+    def _set_shared_plans(
+        self, plan_docs: dict, domain_id: str, nx: bool = False
+    ) -> list:
+        """Set plans in the shared cache
+
+        With nx, existing plans are kept. Returns the owner ids of the plans not set.
+        """
+
+        skipped_ids = []
+
+        if conn := self._get_connection():
+            expire = config.get_global("DELIVERY_PLAN_CACHE_TTL", 3600)
+
+            try:
+                pipeline = conn.pipeline(transaction=False)
+                for owner_id, docs in plan_docs.items():
+                    pipeline.set(
+                        self._make_key(owner_id, domain_id),
+                        json_util.dumps(docs),
+                        ex=expire,
+                        nx=nx,
+                    )
+
+                for owner_id, result in zip(plan_docs, pipeline.execute()):
+                    if not result:
+                        skipped_ids.append(owner_id)
+            except Exception as e:
+                _LOGGER.error(f"[DeliveryPlanCache] failed to set plans: {e}")
+
+        return skipped_ids
+
+    def _make_key(self, owner_id: str, domain_id: str) -> str:
+        return f"delivery-plan:{self._plan_type}:{domain_id}:{owner_id}"
+
+    def _delete_local_plan(self, key: list) -> None:
+        self._local_cache.delete(tuple(key))
+
+    @staticmethod
+    def _get_connection():
+        if not cache.is_set():
+            return None
+
+        return _get_cache_connection()
+
+
+def get_delivery_plan_cache(plan_type: str, record_cls) -> DeliveryPlanCache:
+    if plan_type not in _DELIVERY_PLAN_CACHES:
+        with _LOCK:
+            if plan_type not in _DELIVERY_PLAN_CACHES:
+                _DELIVERY_PLAN_CACHES[plan_type] = DeliveryPlanCache(
+                    plan_type, record_cls
+                )
+
+    return _DELIVERY_PLAN_CACHES[plan_type]
@@ -0,0 +1,115 @@
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Any, Callable
+
+from spaceone.core import cache
+
+__all__ = ["publish", "subscribe"]
+
+_LOGGER = logging.getLogger(__name__)
+_CHANNEL = "notification:invalidation"
+_HANDLERS = {}
+_LOCK = threading.Lock()
+_LISTENER_PID = None
+_INSTANCE_ID = uuid.uuid4().hex
+
+
+@cache.connect
+def _get_cache_connection(cache_cls):
+    return getattr(cache_cls, "conn", None)
+
+
+def _get_connection():
+    if not cache.is_set():
+        return None
+
+    return _get_cache_connection()
+
+
+def subscribe(topic: str, handler: Callable[[Any], None]) -> None:
+    """Register a handler called with the key of every invalidation of the topic
+
+    Handlers run in the publishing process immediately and in the other processes
+    through the redis pub/sub listener thread.
+    """
+
+    with _LOCK:
+        handlers = _HANDLERS.setdefault(topic, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+    _start_listener()
+
+
+def publish(topic: str, key: Any) -> None:
+    _handle(topic, key)
+
+    try:
+        if conn := _get_connection():
+            conn.publish(
+                _CHANNEL,
+                json.dumps({"topic": topic, "key": key, "origin": _get_origin()}),
+            )
+    except Exception as e:
+        _LOGGER.error(f"[invalidation_bus] failed to publish: {topic} ({key}): {e}")
+
+
+def _get_origin() -> str:
+    return f"{_INSTANCE_ID}:{os.getpid()}"
+
+
+def _handle(topic: str, key: Any) -> None:
+    for handler in list(_HANDLERS.get(topic, [])):
+        try:
+            handler(key)
+        except Exception as e:
+            _LOGGER.error(f"[invalidation_bus] failed to handle: {topic} ({key}): {e}")
+
+
+def _start_listener() -> None:
+    global _LISTENER_PID
+
+    # Threads are not inherited by forked processes
+    if _LISTENER_PID == os.getpid():
+        return
+
+    with _LOCK:
+        if _LISTENER_PID == os.getpid():
+            return
+
+        try:
+            conn = _get_connection()
+        except Exception as e:
+            _LOGGER.error(f"[invalidation_bus] failed to connect cache: {e}")
+            return
+
+        if conn is None:
+            return
+
+        _LISTENER_PID = os.getpid()
+        threading.Thread(
+            target=_listen, args=(conn,), name="InvalidationBus", daemon=True
+        ).start()
+
+
+def _listen(conn) -> None:
+    while True:
+        try:
+            pubsub = conn.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(_CHANNEL)
+
+            for message in pubsub.listen():
+                data = json.loads(message["data"])
+
+                if data.get("origin") == _get_origin():
+                    continue
+
+                _handle(data["topic"], data["key"])
+
+        except Exception as e:
+            _LOGGER.error(f"[invalidation_bus] listener error: {e}")
+            time.sleep(1)
@@ -0,0 +1,58 @@
+import logging
+import threading
+from typing import Any, Callable
+
+from cachetools import TTLCache
+from spaceone.core import config
+
+__all__ = ["LocalCache", "get_local_cache"]
+
+_LOGGER = logging.getLogger(__name__)
+_LOCAL_CACHES = {}
+_LOCK = threading.Lock()
+
+
+class LocalCache(object):
+    """Thread-safe in-process cache with TTL and LRU eviction"""
+
+    def __init__(self, max_size: int = 128, ttl: int = 300):
+        self._cache = TTLCache(maxsize=max_size, ttl=ttl)
+        self._lock = threading.RLock()
+
+    def get(self, key, default=None) -> Any:
+        with self._lock:
+            return self._cache.get(key, default)
+
+    def set(self, key, value) -> None:
+        with self._lock:
+            self._cache[key] = value
+
+    def delete(self, key) -> None:
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def delete_by(self, func: Callable[[Any], bool]) -> None:
+        with self._lock:
+            for key in [key for key in self._cache.keys() if func(key)]:
+                self._cache.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+
+def get_local_cache(name: str) -> LocalCache:
+    if name not in _LOCAL_CACHES:
+        with _LOCK:
+            if name not in _LOCAL_CACHES:
+                cache_conf = config.get_global("LOCAL_CACHES", {}).get(name, {})
+                _LOGGER.debug(
+                    f"[get_local_cache] create local cache: {name} ({cache_conf})"
+                )
+                _LOCAL_CACHES[name] = LocalCache(**cache_conf)
+
+    return _LOCAL_CACHES[name]
@@ -0,0 +1,101 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable
+
+from opentelemetry import context
+from spaceone.core.transaction import LOCAL_STORAGE, get_transaction
+
+__all__ = ["run_in_threads", "run_concurrently"]
+
+
+def run_in_threads(
+    func: Callable[[Any], Any], items: Iterable, max_workers: int = 8
+) -> list:
+    """Call func for every item in a bounded thread pool and return the results in order
+
+    The transaction and trace context of the caller are propagated to the pool threads,
+    so managers and connectors behave as in the calling thread.
+    An exception of func is raised to the caller.
+    """
+
+    items = list(items)
+
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    _run = _propagate_context(func)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(_run, items))
+
+
+def run_concurrently(funcs: dict, timeout: float = None, max_workers: int = 8) -> tuple:
+    """Call independent functions concurrently with one shared deadline
+
+    Args:
+        funcs (dict): {name: func} of functions without arguments
+        timeout (float): seconds to wait for all functions
+
+    Returns:
+        futures (dict): {name: Future}. result() of a function not finished
+            in the deadline raises TimeoutError.
+        durations (dict): {name: seconds} of the finished functions
+    """
+
+    durations = {}
+
+    def _call(name: str) -> Any:
+        start = time.perf_counter()
+        try:
+            return funcs[name]()
+        finally:
+            durations[name] = time.perf_counter() - start
+
+    _run = _propagate_context(_call)
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(funcs))))
+
+    try:
+        futures = {name: executor.submit(_run, name) for name in funcs}
+        wait(futures.values(), timeout=timeout)
+    finally:
+        # Functions over the deadline keep running without blocking the caller
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    futures = {name: _detach_future(future) for name, future in futures.items()}
+    return futures, dict(durations)
+
+
+def _detach_future(future: Future) -> Future:
+    if future.done():
+        return future
+
+    # A pending future would block result() until the function returns
+    detached = Future()
+    detached.set_exception(TimeoutError())
+    return detached
+
+
+def _propagate_context(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    transaction = get_transaction(is_create=False)
+    trace_context = context.get_current()
+
+    def _run(item):
+        token = context.attach(trace_context)
+        storage_keys = []
+
+        if transaction:
+            storage_keys = [str(threading.current_thread().ident), transaction.id]
+            for key in storage_keys:
+                setattr(LOCAL_STORAGE, key, transaction)
+
+        try:
+            return func(item)
+        finally:
+            for key in storage_keys:
+                if hasattr(LOCAL_STORAGE, key):
+                    delattr(LOCAL_STORAGE, key)
+
+            context.detach(token)
+
+    return _run
@@ -0,0 +1,135 @@
+import logging
+import os
+import socket
+import threading
+import time
+
+import redis
+from spaceone.core import queue
+from spaceone.core.queue import BaseQueue
+
+__all__ = ["RedisReliableQueue", "ack"]
+
+_LOGGER = logging.getLogger(__name__)
+_RECONNECT_INTERVAL = 1
+
+
+class RedisReliableQueue(BaseQueue):
+    """Redis list queue which keeps tasks until they are acknowledged
+
+    get moves a task to the processing list of the consumer (BLMOVE)
+    and ack removes it (LREM). From its first get, a consumer refreshes its heartbeat key
+    every heartbeat_ttl / 3 seconds in a daemon thread, also while it executes a task.
+    Tasks left in processing lists of consumers without a heartbeat (crashed or killed)
+    are moved back to the head of the queue.
+
+    QUEUES = {
+        "notification_q": {
+            "backend": "spaceone.notification.lib.reliable_queue.RedisReliableQueue",
+            "host": "redis",
+            "port": 6379,
+            "db": 0,
+            "channel": "notification_job",
+            "heartbeat_ttl": 60,
+            "block_timeout": 1,
+        }
+    }
+    """
+
+    def __init__(self, conf: dict):
+        conf = dict(conf)
+        self.channel = conf.pop("channel")
+        self.heartbeat_ttl = conf.pop("heartbeat_ttl", 60)
+        self.block_timeout = conf.pop("block_timeout", 1)
+        self.conn = redis.Redis(connection_pool=redis.ConnectionPool(**conf))
+
+        # Queue connections are created in each worker process
+        self.consumer_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.processing_key = f"{self.channel}:processing:{self.consumer_id}"
+        self.heartbeat_key = f"{self.channel}:consumer:{self.consumer_id}"
+        self._heartbeat_thread = None
+        self._lock = threading.Lock()
+        self.initialized = True
+
+    def put(self, item) -> bool:
+        try:
+            self.conn.rpush(self.channel, item)
+            return True
+        except Exception as e:
+            _LOGGER.error(f"[RedisReliableQueue] failed to put task: {e}")
+            return False
+
+    def get(self):
+        """Returns a task or None if no task arrives within block_timeout"""
+
+        try:
+            self._start_heartbeat()
+            return self.conn.blmove(
+                self.channel, self.processing_key, self.block_timeout, "LEFT", "RIGHT"
+            )
+        except Exception as e:
+            _LOGGER.error(f"[RedisReliableQueue] failed to get task: {e}")
+            time.sleep(_RECONNECT_INTERVAL)
+            return None
+
+    def ack(self, item) -> None:
+        try:
+            self.conn.lrem(self.processing_key, 1, item)
+        except Exception as e:
+            _LOGGER.error(f"[RedisReliableQueue] failed to ack task: {e}")
+
+    def _start_heartbeat(self) -> None:
+        # Threads are not inherited by forked processes
+        if self._heartbeat_thread and self._heartbeat_thread.is_alive():
+            return
+
+        with self._lock:
+            if self._heartbeat_thread and self._heartbeat_thread.is_alive():
+                return
+
+            self._refresh_heartbeat()
+            self._heartbeat_thread = threading.Thread(
+                target=self._run_heartbeat, name="heartbeat", daemon=True
+            )
+            self._heartbeat_thread.start()
+
+    def _run_heartbeat(self) -> None:
+        while True:
+            time.sleep(self.heartbeat_ttl / 3)
+
+            try:
+                self._refresh_heartbeat()
+            except Exception as e:
+                _LOGGER.error(f"[RedisReliableQueue] failed to refresh heartbeat: {e}")
+
+    def _refresh_heartbeat(self) -> None:
+        self.conn.set(self.heartbeat_key, 1, ex=self.heartbeat_ttl)
+        self._requeue_orphan_tasks()
+
+    def _requeue_orphan_tasks(self) -> None:
+        prefix = f"{self.channel}:processing:"
+
+        for processing_key in self.conn.scan_iter(match=f"{prefix}*"):
+            consumer_id = processing_key.decode()[len(prefix) :]
+
+            if consumer_id == self.consumer_id or self.conn.exists(
+                f"{self.channel}:consumer:{consumer_id}"
+            ):
+                continue
+
+            count = 0
+            while self.conn.lmove(processing_key, self.channel, "RIGHT", "LEFT"):
+                count += 1
+
+            if count:
+                _LOGGER.warning(
+                    f"[RedisReliableQueue] requeue {count} tasks of consumer: {consumer_id}"
+                )
+
+
+@queue.connection
+def ack(queue_cls, item) -> None:
+    """Acknowledge a task of a queue backend which keeps tasks until they are done"""
+
+    if hasattr(queue_cls, "ack"):
+        queue_cls.ack(item)
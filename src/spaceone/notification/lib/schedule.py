@@ -1,5 +1,9 @@
 from spaceone.notification.error import *
 
+DAYS = ['MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN']
+# Hours of a week (MON 00:00 UTC = 0)
+WEEK_HOURS = 168
+
 def validate_schedule(schedule):
     if 'day_of_week' not in schedule:
         raise ERROR_REQUIRED_PARAMETER(key='schedule.day_of_week')
@@ -16,9 +20,9 @@ def validate_schedule(schedule):
     if schedule['start_hour'] == schedule['end_hour']:
         raise ERROR_WRONG_SCHEDULE_SETTINGS(key='schedule.start_hour')
 
-def check_weekday_schedule(now_time, day_of_week):
-    DAYS = ['MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN']
+    schedule['week_hours'] = make_week_hours(schedule['day_of_week'], schedule['start_hour'], schedule['end_hour'])
 
+def check_weekday_schedule(now_time, day_of_week):
     week_day = now_time.weekday()
 
     if DAYS[week_day] in day_of_week:
@@ -27,8 +31,9 @@ def check_weekday_schedule(now_time, day_of_week):
     return False
 
 def check_time_schedule(now_time, start_hour, end_hour):
-    hour = now_time.hour
+    return _check_hour(now_time.hour, start_hour, end_hour)
 
+def _check_hour(hour, start_hour, end_hour):
     if start_hour < end_hour:
         if start_hour <= hour < end_hour:
             return True
@@ -39,3 +44,38 @@ def check_time_schedule(now_time, start_hour, end_hour):
             return True
         else:
             return False
+
+def make_week_hours(day_of_week, start_hour, end_hour):
+    """Bitmask of the schedule over the hours of a week (bit n = week hour n, LSB first)
+
+    The byte order matches $bitsAllSet of MongoDB for BinData.
+    """
+    week_hours = bytearray(WEEK_HOURS // 8)
+
+    for day, day_name in enumerate(DAYS):
+        if day_name in day_of_week:
+            for hour in range(24):
+                if _check_hour(hour, start_hour, end_hour):
+                    week_hour = day * 24 + hour
+                    week_hours[week_hour >> 3] |= 1 << (week_hour & 7)
+
+    return bytes(week_hours)
+
+def get_week_hour(now_time):
+    return now_time.weekday() * 24 + now_time.hour
+
+def check_week_hours(week_hours, week_hour):
+    return bool(week_hours[week_hour >> 3] >> (week_hour & 7) & 1)
+
+def make_week_hour_query(week_hour):
+    """Raw query which excludes scheduled channels out of the week hour
+
+    Channels without week_hours (not backfilled yet) are kept.
+    """
+    return {
+        '$or': [
+            {'is_scheduled': {'$ne': True}},
+            {'schedule.week_hours': None},
+            {'schedule.week_hours': {'$bitsAllSet': [week_hour]}}
+        ]
+    }
@@ -0,0 +1,143 @@
+import json
+import logging
+import os
+import threading
+from typing import Callable, Hashable, Iterable, Union
+
+from cryptography.fernet import Fernet, InvalidToken
+from spaceone.notification.lib.local_cache import LocalCache, get_local_cache
+from spaceone.notification.lib.parallel import run_in_threads
+
+__all__ = ["SecretCache", "get_secret_cache"]
+
+_LOGGER = logging.getLogger(__name__)
+_SECRET_CACHES = {}
+_LOCK = threading.Lock()
+
+# Generated on first use in each process and never persisted,
+# so cached values are unreadable outside of the process
+_FERNET = None
+_FERNET_LOCK = threading.Lock()
+
+
+def _get_fernet() -> Fernet:
+    global _FERNET
+
+    if _FERNET is None:
+        with _FERNET_LOCK:
+            if _FERNET is None:
+                _FERNET = Fernet(Fernet.generate_key())
+
+    return _FERNET
+
+
+def _reset_fernet() -> None:
+    global _FERNET, _FERNET_LOCK
+
+    # Forked workers do not share the key of the parent
+    _FERNET = None
+    _FERNET_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_fernet)
+
+
+class SecretCache(object):
+    """Local cache which keeps secret data encrypted in memory
+
+    Concurrent lookups of a missing key share a single load_func call.
+    """
+
+    def __init__(self, local_cache: LocalCache):
+        self._local_cache = local_cache
+        self._lock = threading.Lock()
+        self._lookup_locks = {}
+
+    def get_or_load(self, key: Hashable, load_func: Callable[[], dict]) -> dict:
+        if (secret_data := self._get(key)) is not None:
+            return secret_data
+
+        with self._get_lookup_lock(key):
+            try:
+                if (secret_data := self._get(key)) is not None:
+                    return secret_data
+
+                secret_data = load_func()
+                self._local_cache.set(key, self._encrypt(secret_data))
+                return secret_data
+            finally:
+                with self._lock:
+                    self._lookup_locks.pop(key, None)
+
+    def get_or_load_many(
+        self,
+        keys: Iterable[Hashable],
+        load_func: Callable[[Hashable], dict],
+        max_workers: int = 8,
+    ) -> dict:
+        """Get multiple secrets and load the missing ones in parallel
+
+        Returns a dict of key to secret data. Keys failed to load are omitted.
+        """
+
+        secrets = {}
+        missing_keys = []
+
+        for key in dict.fromkeys(keys):
+            if (secret_data := self._get(key)) is not None:
+                secrets[key] = secret_data
+            else:
+                missing_keys.append(key)
+
+        def _load(key):
+            try:
+                return self.get_or_load(key, lambda: load_func(key))
+            except Exception as e:
+                _LOGGER.error(f"[SecretCache] failed to load secret: {key[0]}: {e}")
+                return None
+
+        loaded = run_in_threads(_load, missing_keys, max_workers)
+        for key, secret_data in zip(missing_keys, loaded):
+            if secret_data is not None:
+                secrets[key] = secret_data
+
+        return secrets
+
+    def delete(self, secret_id: str) -> None:
+        self._local_cache.delete_by(lambda key: key[0] == secret_id)
+
+    def clear(self) -> None:
+        self._local_cache.clear()
+
+    def _get(self, key: Hashable) -> Union[dict, None]:
+        if (token := self._local_cache.get(key)) is None:
+            return None
+
+        try:
+            return self._decrypt(token)
+        except InvalidToken:
+            # Encrypted with the key of the parent process before fork
+            self._local_cache.delete(key)
+            return None
+
+    def _get_lookup_lock(self, key: Hashable) -> threading.Lock:
+        with self._lock:
+            return self._lookup_locks.setdefault(key, threading.Lock())
+
+    @staticmethod
+    def _encrypt(secret_data: dict) -> bytes:
+        return _get_fernet().encrypt(json.dumps(secret_data).encode())
+
+    @staticmethod
+    def _decrypt(token: bytes) -> dict:
+        return json.loads(_get_fernet().decrypt(token))
+
+
+def get_secret_cache(name: str) -> SecretCache:
+    if name not in _SECRET_CACHES:
+        with _LOCK:
+            if name not in _SECRET_CACHES:
+                _SECRET_CACHES[name] = SecretCache(get_local_cache(name))
+
+    return _SECRET_CACHES[name]
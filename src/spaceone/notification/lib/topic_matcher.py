@@ -0,0 +1,122 @@
+import re
+from typing import Iterable
+
+from spaceone.core import config
+from spaceone.notification.lib.local_cache import get_local_cache
+
+__all__ = ["TopicMatcher", "get_topic_matcher", "make_topic_query"]
+
+_SINGLE_WILDCARD = "*"
+_MULTI_WILDCARD = "#"
+_WILDCARD_PATTERN = r"(^|\.)[*#](\.|$)"
+
+
+class _TrieNode(object):
+    __slots__ = ("children", "is_end")
+
+    def __init__(self):
+        self.children = {}
+        self.is_end = False
+
+
+class TopicMatcher(object):
+    """Compiled subscriptions of a channel
+
+    Topics are dot-separated segments. In subscriptions, a '*' segment matches
+    exactly one segment and a '#' segment matches zero or more segments.
+    Subscriptions without wildcards, or all of them if wildcards are disabled,
+    are matched by a set lookup.
+    """
+
+    __slots__ = ("_topics", "_trie")
+
+    def __init__(self, subscriptions: Iterable[str], use_wildcard: bool = True):
+        self._topics = set()
+        self._trie = None
+
+        for subscription in subscriptions:
+            if use_wildcard and is_wildcard_subscription(subscription):
+                self._add_pattern(subscription)
+            else:
+                self._topics.add(subscription)
+
+    def match(self, topic: str) -> bool:
+        if topic in self._topics:
+            return True
+
+        if self._trie is None:
+            return False
+
+        return self._match_node(self._trie, topic.split("."), 0)
+
+    def _add_pattern(self, subscription: str) -> None:
+        if self._trie is None:
+            self._trie = _TrieNode()
+
+        node = self._trie
+        for segment in subscription.split("."):
+            node = node.children.setdefault(segment, _TrieNode())
+
+        node.is_end = True
+
+    def _match_node(self, node: _TrieNode, segments: list, index: int) -> bool:
+        if index == len(segments):
+            if node.is_end:
+                return True
+
+            # A trailing '#' also matches zero segments
+            multi_node = node.children.get(_MULTI_WILDCARD)
+            return multi_node is not None and self._match_node(
+                multi_node, segments, index
+            )
+
+        for key in (segments[index], _SINGLE_WILDCARD):
+            if child := node.children.get(key):
+                if self._match_node(child, segments, index + 1):
+                    return True
+
+        if multi_node := node.children.get(_MULTI_WILDCARD):
+            for next_index in range(index, len(segments) + 1):
+                if self._match_node(multi_node, segments, next_index):
+                    return True
+
+        return False
+
+
+def is_wildcard_subscription(subscription: str) -> bool:
+    return re.search(_WILDCARD_PATTERN, subscription) is not None
+
+
+def is_wildcard_enabled() -> bool:
+    return config.get_global("TOPIC_WILDCARD_SUBSCRIPTIONS", False)
+
+
+def get_topic_matcher(subscriptions: Iterable[str]) -> TopicMatcher:
+    """Get a compiled matcher shared by channels with the same subscriptions"""
+
+    local_cache = get_local_cache("topic_matcher")
+    use_wildcard = is_wildcard_enabled()
+    cache_key = (tuple(subscriptions), use_wildcard)
+
+    if (topic_matcher := local_cache.get(cache_key)) is None:
+        topic_matcher = TopicMatcher(cache_key[0], use_wildcard)
+        local_cache.set(cache_key, topic_matcher)
+
+    return topic_matcher
+
+
+def make_topic_query(topic: str) -> dict:
+    """Raw query which excludes subscribed channels which can not match the topic
+
+    Channels with wildcard subscriptions are kept and matched by TopicMatcher.
+    """
+
+    or_queries = [
+        {"is_subscribe": {"$ne": True}},
+        {"subscriptions": topic},
+    ]
+
+    if is_wildcard_enabled():
+        or_queries.append({"subscriptions": {"$regex": _WILDCARD_PATTERN}})
+
+    return {"$or": or_queries}
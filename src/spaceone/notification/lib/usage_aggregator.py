@@ -0,0 +1,76 @@
+import logging
+import threading
+import time
+from typing import Callable, Hashable
+
+__all__ = ["UsageAggregator"]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class UsageAggregator(object):
+    """Coalesce usage counters in memory and flush them periodically
+
+    Counters are flushed when the number of buffered events reaches flush_events
+    or flush_interval_ms has elapsed since the last flush.
+    flush_func(key, count, fail_count) is called once per key.
+    """
+
+    def __init__(
+        self,
+        flush_func: Callable[[Hashable, int, int], None],
+        flush_interval_ms: int = 1000,
+        flush_events: int = 100,
+    ):
+        self._flush_func = flush_func
+        self._flush_interval = flush_interval_ms / 1000
+        self._flush_events = flush_events
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._counters = {}
+        self._events = 0
+        self._last_flushed_at = time.monotonic()
+        self._stop_event = threading.Event()
+
+        self._flush_thread = threading.Thread(
+            target=self._run_flush_loop, name="UsageAggregator", daemon=True
+        )
+        self._flush_thread.start()
+
+    def add(self, key: Hashable, count: int = 0, fail_count: int = 0) -> None:
+        with self._lock:
+            counter = self._counters.setdefault(key, [0, 0])
+            counter[0] += count
+            counter[1] += fail_count
+            self._events += 1
+            is_full = self._events >= self._flush_events
+
+        if is_full:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._lock:
+                counters = self._counters
+                self._counters = {}
+                self._events = 0
+                self._last_flushed_at = time.monotonic()
+
+            for key, (count, fail_count) in counters.items():
+                try:
+                    self._flush_func(key, count, fail_count)
+                except Exception as e:
+                    _LOGGER.error(
+                        f"[UsageAggregator] failed to flush usage: {key} "
+                        f"(count = {count}, fail_count = {fail_count}): {e}"
+                    )
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._flush_thread.join()
+        self.flush()
+
+    def _run_flush_loop(self) -> None:
+        while not self._stop_event.wait(self._flush_interval):
+            if time.monotonic() - self._last_flushed_at >= self._flush_interval:
+                self.flush()
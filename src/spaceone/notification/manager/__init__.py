@@ -10,3 +10,7 @@ from spaceone.notification.manager.notification_usage_manager import (
     NotificationUsageManager,
 )
 from spaceone.notification.manager.user_secret_manager import UserSecretManager
+from spaceone.notification.manager.quota_manager import QuotaManager
+from spaceone.notification.manager.notification_event_manager import (
+    NotificationEventManager,
+)
@@ -1,11 +1,31 @@
+import hashlib
 import logging
+import threading
+from typing import Callable, Iterator
 
 from spaceone.core import config
 from spaceone.core.connector.space_connector import SpaceConnector
+from spaceone.core.error import ERROR_BASE
 from spaceone.core.manager import BaseManager
 from spaceone.core.auth.jwt.jwt_util import JWTUtil
+from spaceone.notification.lib import invalidation_bus
+from spaceone.notification.lib.local_cache import get_local_cache
 
 _LOGGER = logging.getLogger(__name__)
+_IDENTITY_TOPIC = "identity"
+_IDENTITY_CACHES = [
+    "identity_domain",
+    "identity_resource",
+    "identity_project",
+    "identity_workspace_users",
+    "identity_project_users",
+    "identity_not_found",
+]
+_LOOKUP_LOCKS = {}
+_LOOKUP_LOCKS_LOCK = threading.Lock()
+
+# Fields of users needed to dispatch notifications
+USER_LIST_FIELDS = ["user_id", "state"]
 
 _GET_RESOURCE_METHODS = {
     "identity.Domain": {"dispatch_method": "Domain.get", "key": "domain_id"},
@@ -18,14 +38,120 @@ _GET_RESOURCE_METHODS = {
 }
 
 
+def _delete_local_identity(key: list) -> None:
+    domain_id, resource_id = key
+
+    for cache_name in _IDENTITY_CACHES:
+        get_local_cache(cache_name).delete_by(
+            lambda cache_key: domain_id in cache_key
+            and (resource_id is None or resource_id in cache_key)
+        )
+
+
+def _get_lookup_lock(cache_key: tuple) -> threading.Lock:
+    with _LOOKUP_LOCKS_LOCK:
+        return _LOOKUP_LOCKS.setdefault(cache_key, threading.Lock())
+
+
 class IdentityManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         token = self.transaction.get_meta("token")
         self.token_type = JWTUtil.get_value_from_token(token, "typ")
+        self.token_hash = hashlib.sha256((token or "").encode()).hexdigest()
         self.identity_connector: SpaceConnector = self.locator.get_connector(
             "SpaceConnector", service="identity"
         )
+        invalidation_bus.subscribe(_IDENTITY_TOPIC, _delete_local_identity)
+
+    def get_cached_resource(self, resource_id: str, resource_type: str, domain_id: str):
+        # Resources are checked with the caller's token unless it is a system token
+        token_key = None if self.token_type == "SYSTEM_TOKEN" else self.token_hash
+        return self._get_cached(
+            "identity_resource",
+            (resource_type, resource_id, domain_id, token_key),
+            self.get_resource,
+            resource_id,
+            resource_type,
+            domain_id,
+        )
+
+    def get_cached_project(self, project_id: str, domain_id: str) -> dict:
+        return self._get_cached(
+            "identity_project",
+            (project_id, domain_id),
+            self.get_project,
+            project_id,
+            domain_id,
+        )
+
+    def get_cached_workspace_users(self, workspace_id: str, domain_id: str) -> dict:
+        return self._get_cached(
+            "identity_workspace_users",
+            (workspace_id, domain_id),
+            self.get_workspace_users,
+            workspace_id,
+            domain_id,
+        )
+
+    def get_cached_project_users(self, project_id: str, domain_id: str) -> frozenset:
+        """User IDs of a project ("*" of INTERNAL project channels)
+
+        Members of a PRIVATE project, or users of the workspace of a PUBLIC project.
+        The expanded set is cached until its TTL or invalidate_cache of the project.
+        """
+        return self._get_cached(
+            "identity_project_users",
+            (project_id, domain_id),
+            self._expand_project_users,
+            project_id,
+            domain_id,
+        )
+
+    def get_cached_domain_info(self, domain_id: str) -> dict:
+        return self._get_cached(
+            "identity_domain", (domain_id,), self.get_domain_info, domain_id
+        )
+
+    @staticmethod
+    def invalidate_cache(domain_id: str, resource_id: str = None) -> None:
+        """Drop cached identity lookups of a domain (or of one resource in it)
+
+        Identity changes are not notified to this service, so this is called
+        manually; otherwise cached lookups expire by the TTL of LOCAL_CACHES.
+        """
+
+        invalidation_bus.publish(_IDENTITY_TOPIC, [domain_id, resource_id])
+
+    @staticmethod
+    def _get_cached(cache_name: str, cache_key: tuple, func: Callable, *args):
+        local_cache = get_local_cache(cache_name)
+        not_found_cache = get_local_cache("identity_not_found")
+        not_found_key = (cache_name,) + cache_key
+
+        if (value := local_cache.get(cache_key)) is not None:
+            return value
+
+        # Concurrent misses of the same key wait for a single identity call
+        with _get_lookup_lock(not_found_key):
+            if (value := local_cache.get(cache_key)) is not None:
+                return value
+
+            if (error := not_found_cache.get(not_found_key)) is not None:
+                raise error
+
+            try:
+                value = func(*args)
+                local_cache.set(cache_key, value)
+            except ERROR_BASE as e:
+                if e.error_code == "ERROR_NOT_FOUND":
+                    not_found_cache.set(not_found_key, e)
+                raise e
+            finally:
+                with _LOOKUP_LOCKS_LOCK:
+                    _LOOKUP_LOCKS.pop(not_found_key, None)
+
+            return value
 
     def get_resource(self, resource_id: str, resource_type: str, domain_id: str):
         get_method = _GET_RESOURCE_METHODS[resource_type]
@@ -58,6 +184,21 @@ class IdentityManager(BaseManager):
             token=system_token,
         )
 
+    def _expand_project_users(self, project_id: str, domain_id: str) -> frozenset:
+        project_info = self.get_cached_project(project_id, domain_id)
+
+        if project_info["project_type"] == "PRIVATE":
+            users = project_info.get("users", [])
+        else:
+            response = self.get_cached_workspace_users(
+                project_info.get("workspace_id", project_id), domain_id
+            )
+            users = response.get("results", [])
+
+        return frozenset(
+            user["user_id"] if isinstance(user, dict) else user for user in users
+        )
+
     def get_user_profile(self):
         return self.identity_connector.dispatch("UserProfile.get", {})
 
@@ -67,14 +208,53 @@ class IdentityManager(BaseManager):
             "Domain.get", {"domain_id": domain_id}, token=system_token
         )
 
-    def get_all_users_in_domain(self, domain_id: str) -> list:
+    def list_users_in_domain(self, query: dict, domain_id: str) -> dict:
+        system_token = config.get_global("TOKEN")
+        return self.identity_connector.dispatch(
+            "User.list",
+            {"state": "ENABLED", "query": query},
+            x_domain_id=domain_id,
+            token=system_token,
+        )
+
+    def list_user_page(
+        self, domain_id: str, page_size: int, last_user_id: str = None
+    ) -> dict:
+        """Get a page of the enabled users of a domain sorted by user_id
+
+        Users are paged by key (user_id > last_user_id), so users added or
+        removed in the meantime do not shift the following pages.
+        Only USER_LIST_FIELDS are requested.
+        """
+
         query = {
-            "state": "ENABLED",
+            "sort": [{"key": "user_id"}],
+            "page": {"limit": page_size},
+            "only": USER_LIST_FIELDS,
         }
 
-        system_token = config.get_global("TOKEN")
-        response = self.identity_connector.dispatch(
-            "User.list", query, x_domain_id=domain_id, token=system_token
-        )
+        if last_user_id:
+            query["filter"] = [{"k": "user_id", "v": last_user_id, "o": "gt"}]
+
+        return self.list_users_in_domain(query, domain_id)
+
+    def get_all_users_in_domain(
+        self, domain_id: str, page_size: int = 1000
+    ) -> Iterator[dict]:
+        """Iterate over the enabled users of a domain page by page
+
+        Only USER_LIST_FIELDS are requested,
+        so memory is bounded by the page size regardless of the number of users.
+        """
+
+        last_user_id = None
+        while True:
+            response = self.list_user_page(domain_id, page_size, last_user_id)
+            users = response.get("results", [])
+
+            yield from users
+
+            if len(users) < page_size:
+                return
 
-        return response.get("results", [])
+            last_user_id = users[-1]["user_id"]
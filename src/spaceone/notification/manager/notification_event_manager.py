@@ -0,0 +1,141 @@
+import datetime
+import logging
+from spaceone.core.manager import BaseManager
+from spaceone.notification.model.notification_event_model import NotificationEvent
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class NotificationEventManager(BaseManager):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.event_model: NotificationEvent = self.locator.get_model(
+            "NotificationEvent"
+        )
+
+    def create_notification_event(self, params: dict) -> NotificationEvent:
+        def _rollback(vo: NotificationEvent):
+            _LOGGER.info(
+                f"[create_notification_event._rollback] "
+                f"Delete Notification Event : {vo.event_id}"
+            )
+            vo.delete()
+
+        event_vo: NotificationEvent = self.event_model.create(params)
+        self._add_rollback(_rollback, event_vo)
+
+        return event_vo
+
+    def update_notification_event_by_vo(
+        self, params: dict, event_vo: NotificationEvent
+    ) -> NotificationEvent:
+        def _rollback(old_data):
+            _LOGGER.info(
+                f"[update_notification_event_by_vo._rollback] "
+                f'Revert Data : {old_data["event_id"]}'
+            )
+            event_vo.update(old_data)
+
+        self._add_rollback(_rollback, event_vo.to_dict())
+        return event_vo.update(params)
+
+    def _add_rollback(self, fn, *args) -> None:
+        # Worker tasks run in a thread transaction which is never rolled back or released
+        if self.transaction.verb:
+            self.transaction.add_rollback(fn, *args)
+
+    def get_notification_event(
+        self, event_id: str, domain_id: str
+    ) -> NotificationEvent:
+        return self.event_model.get(event_id=event_id, domain_id=domain_id)
+
+    def list_notification_events(self, query: dict) -> dict:
+        return self.event_model.query(**query)
+
+    def start_broadcast_job(
+        self, event_vo: NotificationEvent, chunk_size: int
+    ) -> NotificationEvent:
+        return self.update_notification_event_by_vo(
+            {
+                "state": "IN_PROGRESS",
+                "chunk_size": chunk_size,
+                "next_page": 0,
+                "total_pages": None,
+                "last_user_id": None,
+                "page_ranges": {},
+                "completed_pages": [],
+                "page_cursors": {},
+                "updated_at": datetime.datetime.utcnow(),
+            },
+            event_vo,
+        )
+
+    def claim_broadcast_page(
+        self, event_vo: NotificationEvent, page: int, last_user_id: str
+    ) -> bool:
+        """Atomically claim the next page of users, from the user cursor of the job
+        up to last_user_id
+
+        Returns False if another task claimed the page in the meantime.
+        """
+
+        claimed_event_vo = self.event_model.objects(
+            event_id=event_vo.event_id, state="IN_PROGRESS", next_page=page
+        ).modify(
+            set__next_page=page + 1,
+            set__last_user_id=last_user_id,
+            **{
+                f"set__page_ranges__{page}": [event_vo.last_user_id, last_user_id],
+            },
+            set__updated_at=datetime.datetime.utcnow(),
+        )
+
+        return claimed_event_vo is not None
+
+    def checkpoint_broadcast_page(
+        self, event_vo: NotificationEvent, page: int, user_id: str
+    ) -> None:
+        """Record the last dispatched user of a page in progress"""
+
+        self.event_model.objects(event_id=event_vo.event_id).update_one(
+            **{f"set__page_cursors__{page}": user_id},
+            set__updated_at=datetime.datetime.utcnow(),
+        )
+
+    def complete_broadcast_page(self, event_vo: NotificationEvent, page: int) -> None:
+        self.event_model.objects(event_id=event_vo.event_id).update_one(
+            add_to_set__completed_pages=page,
+            **{f"unset__page_cursors__{page}": True},
+            set__updated_at=datetime.datetime.utcnow(),
+        )
+
+    def set_broadcast_total_pages(
+        self, event_vo: NotificationEvent, total_pages: int
+    ) -> None:
+        # Keep the smallest known total
+        self.event_model.objects(
+            event_id=event_vo.event_id, total_pages=None
+        ).update_one(set__total_pages=total_pages)
+        self.event_model.objects(
+            event_id=event_vo.event_id, total_pages__gt=total_pages
+        ).update_one(set__total_pages=total_pages)
+
+    def finish_broadcast_job(self, event_vo: NotificationEvent) -> bool:
+        event_vo.reload()
+
+        if event_vo.state != "IN_PROGRESS" or event_vo.total_pages is None:
+            return False
+
+        if not set(range(event_vo.total_pages)).issubset(event_vo.completed_pages):
+            return False
+
+        finished_event_vo = self.event_model.objects(
+            event_id=event_vo.event_id, state="IN_PROGRESS"
+        ).modify(set__state="DONE", set__finished_at=datetime.datetime.utcnow())
+
+        return finished_event_vo is not None
+
+    def touch_notification_event(self, event_vo: NotificationEvent) -> None:
+        self.event_model.objects(event_id=event_vo.event_id).update_one(
+            set__updated_at=datetime.datetime.utcnow()
+        )
@@ -1,9 +1,22 @@
+import datetime
 import logging
+from pymongo.errors import BulkWriteError
+from spaceone.core import config, utils
 from spaceone.core.manager import BaseManager
 from spaceone.notification.model.notification_model import Notification
 from spaceone.notification.error import *
 
 _LOGGER = logging.getLogger(__name__)
+_DUPLICATE_KEY_ERROR = 11000
+
+
+def _get_write_errors(error: BulkWriteError) -> list:
+    # Documents with a duplicate key are already inserted
+    return [
+        write_error
+        for write_error in error.details.get("writeErrors", [])
+        if write_error.get("code") != _DUPLICATE_KEY_ERROR
+    ]
 
 
 class NotificationManager(BaseManager):
@@ -26,6 +39,73 @@ class NotificationManager(BaseManager):
 
         return notification_vo
 
+    def create_notifications(self, params_list: list) -> list:
+        """Insert notifications with unordered insert_many in chunks
+
+        notification_ids are generated up front so that a single rollback
+        can delete every inserted notification. Documents which failed to be inserted
+        are retried once, so documents inserted by the first try are not duplicated.
+        """
+
+        def _rollback(ids: list):
+            _LOGGER.info(
+                f"[create_notifications._rollback] "
+                f"Delete Notifications : {len(ids)} notifications"
+            )
+            self.notification_model.filter(notification_id=ids).delete()
+
+        chunk_size = config.get_global("NOTIFICATION_INSERT_CHUNK_SIZE", 1000)
+        collection = self.notification_model._get_collection()
+        created_at = datetime.datetime.utcnow()
+        notification_ids = []
+
+        # Worker tasks run in a thread transaction which is never rolled back or released
+        if self.transaction.verb:
+            self.transaction.add_rollback(_rollback, notification_ids)
+
+        for idx in range(0, len(params_list), chunk_size):
+            documents = []
+            for params in params_list[idx : idx + chunk_size]:
+                create_data = {
+                    key: value
+                    for key, value in params.items()
+                    if key in self.notification_model._fields
+                }
+                create_data["notification_id"] = utils.generate_id("notification")
+                create_data["created_at"] = created_at
+
+                notification_vo = self.notification_model(**create_data)
+                notification_vo.validate()
+
+                documents.append(notification_vo.to_mongo())
+                notification_ids.append(create_data["notification_id"])
+
+            self._insert_documents(collection, documents)
+
+        return notification_ids
+
+    @staticmethod
+    def _insert_documents(collection, documents: list) -> None:
+        try:
+            collection.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            retry_documents = [
+                documents[write_error["index"]] for write_error in _get_write_errors(e)
+            ]
+
+            if not retry_documents:
+                return
+
+            _LOGGER.warning(
+                f"[create_notifications] Retry {len(retry_documents)} notifications"
+            )
+
+            try:
+                collection.insert_many(retry_documents, ordered=False)
+            except BulkWriteError as e:
+                if write_errors := _get_write_errors(e):
+                    raise ERROR_DB_QUERY(reason=write_errors[:1])
+
     def set_read_notification(self, notifications, domain_id):
         def _rollback(notification_vos):
             _LOGGER.info(f"[set_read_notification._rollback]")
@@ -1,8 +1,14 @@
 import logging
+import threading
+from mongoengine import NotUniqueError
+from spaceone.core import config
 from spaceone.core.manager import BaseManager
+from spaceone.notification.lib.usage_aggregator import UsageAggregator
 from spaceone.notification.model.notification_usage_model import NotificationUsage
 
 _LOGGER = logging.getLogger(__name__)
+_USAGE_AGGREGATOR = None
+_LOCK = threading.Lock()
 
 
 class NotificationUsageManager(BaseManager):
@@ -34,10 +40,51 @@ class NotificationUsageManager(BaseManager):
     def stat_notification_usages(self, query):
         return self.noti_usage_model.stat(**query)
 
+    def add_notification_usage(self, protocol_id, usage_month, usage_date, domain_id, count=0, fail_count=0):
+        usage_key = (protocol_id, usage_month, usage_date, domain_id)
+
+        if usage_aggregator := self._get_usage_aggregator():
+            usage_aggregator.add(usage_key, count, fail_count)
+        else:
+            self.upsert_notification_usage(usage_key, count, fail_count)
+
+    @staticmethod
+    def upsert_notification_usage(usage_key, count=0, fail_count=0):
+        protocol_id, usage_month, usage_date, domain_id = usage_key
+        usage_qs = NotificationUsage.objects(protocol_id=protocol_id, usage_month=usage_month,
+                                             usage_date=usage_date, domain_id=domain_id)
+
+        try:
+            usage_qs.update_one(upsert=True, inc__count=count, inc__fail_count=fail_count)
+        except NotUniqueError:
+            # Concurrent upsert created the document first
+            usage_qs.update_one(inc__count=count, inc__fail_count=fail_count)
+
     @staticmethod
-    def incremental_notification_usage(noti_usage_vo, count):
-        noti_usage_vo.increment("count", count)
+    def stop_usage_aggregator():
+        """Flush buffered usage counters before the process exits"""
+        global _USAGE_AGGREGATOR
+
+        with _LOCK:
+            usage_aggregator, _USAGE_AGGREGATOR = _USAGE_AGGREGATOR, None
+
+        if usage_aggregator:
+            usage_aggregator.stop()
 
     @staticmethod
-    def incremental_notification_fail_count(noti_usage_vo, count):
-        noti_usage_vo.increment("fail_count", count)
+    def _get_usage_aggregator():
+        global _USAGE_AGGREGATOR
+
+        aggregator_conf = config.get_global('NOTIFICATION_USAGE_AGGREGATOR', {})
+        if not aggregator_conf.get('enabled', False):
+            return None
+
+        if _USAGE_AGGREGATOR is None:
+            with _LOCK:
+                if _USAGE_AGGREGATOR is None:
+                    _USAGE_AGGREGATOR = UsageAggregator(
+                        NotificationUsageManager.upsert_notification_usage,
+                        flush_interval_ms=aggregator_conf.get('flush_interval_ms', 1000),
+                        flush_events=aggregator_conf.get('flush_events', 100))
+
+        return _USAGE_AGGREGATOR
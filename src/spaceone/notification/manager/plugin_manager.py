@@ -1,15 +1,26 @@
+import asyncio
 import logging
 
-from spaceone.core import config
+from spaceone.core import config, utils
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
+from spaceone.core.error import *
 
+from spaceone.notification.error import *
 from spaceone.notification.connector.notification_plugin_connector import (
     NotificationPluginConnector,
 )
+from spaceone.notification.lib.local_cache import get_local_cache
 
 _LOGGER = logging.getLogger(__name__)
 
+# Error codes of plugins which are resolved by a new plugin session
+_PLUGIN_SESSION_ERROR_CODES = [
+    "ERROR_INVALID_PLUGIN_SESSION",
+    "ERROR_AUTHENTICATE_FAILURE",
+    "ERROR_PERMISSION_DENIED",
+]
+
 
 class PluginManager(BaseManager):
     def __init__(self, *args, **kwargs):
@@ -53,6 +64,53 @@ class PluginManager(BaseManager):
 
         return endpoint_response
 
+    def get_plugin_endpoint(self) -> str:
+        return self.noti_plugin_connector.endpoint
+
+    def get_plugin_session(
+        self, plugin_info: dict, domain_id: str, refresh: bool = False
+    ) -> dict:
+        plugin_session_cache = get_local_cache("plugin_session")
+        session_key = self._make_plugin_session_key(plugin_info, domain_id)
+
+        plugin_session = None if refresh else plugin_session_cache.get(session_key)
+
+        if plugin_session is None:
+            endpoint_info = self.initialize(plugin_info, domain_id)
+            metadata = self.init_plugin(plugin_info.get("options", {}), domain_id)
+
+            plugin_session = {
+                "endpoint": endpoint_info["endpoint"],
+                "updated_version": endpoint_info.get("updated_version"),
+                "metadata": metadata,
+            }
+            plugin_session_cache.set(session_key, plugin_session)
+        else:
+            _LOGGER.debug(f"[get_plugin_session] cached session: {session_key}")
+            self.noti_plugin_connector.initialize(plugin_session["endpoint"])
+
+        return plugin_session
+
+    def delete_plugin_session(self, plugin_info: dict, domain_id: str) -> None:
+        session_key = self._make_plugin_session_key(plugin_info, domain_id)
+        get_local_cache("plugin_session").delete(session_key)
+
+    @staticmethod
+    def is_plugin_session_error(error: Exception) -> bool:
+        """Connection, session and auth errors of a plugin call"""
+
+        if isinstance(
+            error,
+            (
+                ERROR_GRPC_CONNECTION,
+                ERROR_AUTHENTICATE_FAILURE,
+                ERROR_PERMISSION_DENIED,
+            ),
+        ):
+            return True
+
+        return getattr(error, "error_code", None) in _PLUGIN_SESSION_ERROR_CODES
+
     def init_plugin(self, options: dict, domain_id: str = None) -> dict:
         plugin_info = self.noti_plugin_connector.init(options, domain_id)
 
@@ -68,3 +126,223 @@ class PluginManager(BaseManager):
         return self.noti_plugin_connector.dispatch_notification(
             secret_data, channel_data, notification_type, message, options, domain_id
         )
+
+    def dispatch_notification_batch(
+        self,
+        secret_data: dict,
+        channels: list,
+        notification_type: str,
+        message: dict,
+        options: dict,
+        plugin_metadata: dict,
+        domain_id: str,
+    ) -> list:
+        """Returns per-channel results: True (success), False (failure) or
+        None when the channel was not attempted due to a plugin session error"""
+
+        results = [None] * len(channels)
+
+        try:
+            if plugin_metadata.get("supports_batch_dispatch", False):
+                max_batch_size = plugin_metadata.get("max_batch_size", 100)
+
+                for offset in range(0, len(channels), max_batch_size):
+                    items = [
+                        {"channel_data": channel_data, "message": message}
+                        for channel_data in channels[offset : offset + max_batch_size]
+                    ]
+                    try:
+                        response = (
+                            self.noti_plugin_connector.dispatch_notification_batch(
+                                secret_data,
+                                items,
+                                notification_type,
+                                options,
+                                domain_id,
+                            )
+                        )
+                    except ERROR_UNSUPPORTED_PLUGIN_METHOD:
+                        _LOGGER.warning(
+                            "[dispatch_notification_batch] dispatch_batch is not supported by the plugin. dispatch one by one"
+                        )
+                        self._dispatch_notifications(
+                            results,
+                            channels,
+                            offset,
+                            secret_data,
+                            notification_type,
+                            message,
+                            options,
+                            domain_id,
+                        )
+                        break
+                    except Exception as e:
+                        if self.is_plugin_session_error(e):
+                            raise
+
+                        _LOGGER.error(f"[dispatch_notification_batch] {e}")
+                        response = {}
+
+                    for index in range(len(items)):
+                        results[offset + index] = False
+
+                    for result in response.get("results", []):
+                        index = int(result.get("index", 0))
+                        if 0 <= index < len(items):
+                            results[offset + index] = result.get("success", False)
+            else:
+                self._dispatch_notifications(
+                    results,
+                    channels,
+                    0,
+                    secret_data,
+                    notification_type,
+                    message,
+                    options,
+                    domain_id,
+                )
+
+        except Exception as e:
+            if not self.is_plugin_session_error(e):
+                raise
+
+            _LOGGER.warning(f"[dispatch_notification_batch] plugin session error: {e}")
+
+        return results
+
+    def _dispatch_notifications(
+        self,
+        results: list,
+        channels: list,
+        offset: int,
+        secret_data: dict,
+        notification_type: str,
+        message: dict,
+        options: dict,
+        domain_id: str,
+    ) -> None:
+        """Dispatch the channels from the offset one by one into results"""
+
+        for index in range(offset, len(channels)):
+            try:
+                self.dispatch_notification(
+                    secret_data,
+                    channels[index],
+                    notification_type,
+                    message,
+                    options,
+                    domain_id,
+                )
+                results[index] = True
+            except Exception as e:
+                if self.is_plugin_session_error(e):
+                    raise
+
+                _LOGGER.error(f"[dispatch_notification_batch] {e}")
+                results[index] = False
+
+    async def async_dispatch_notification_batch(
+        self,
+        endpoint: str,
+        secret_data: dict,
+        channels: list,
+        notification_type: str,
+        message: dict,
+        options: dict,
+        plugin_metadata: dict,
+        limiter: asyncio.Semaphore,
+    ) -> list:
+        """dispatch_notification_batch with grpc.aio channels of the event loop
+
+        Every plugin call is made under the limiter of the protocol.
+        Returns per-channel results as dispatch_notification_batch does.
+        """
+
+        results = [None] * len(channels)
+
+        async def _dispatch_batch_items(offset: int, items: list) -> None:
+            try:
+                async with limiter:
+                    response = await self.noti_plugin_connector.async_dispatch_notification_batch(
+                        endpoint, secret_data, items, notification_type, options
+                    )
+            except ERROR_UNSUPPORTED_PLUGIN_METHOD:
+                _LOGGER.warning(
+                    "[async_dispatch_notification_batch] dispatch_batch is not supported by the plugin. dispatch one by one"
+                )
+                await asyncio.gather(
+                    *[
+                        _dispatch_channel(offset + index, item["channel_data"])
+                        for index, item in enumerate(items)
+                    ]
+                )
+                return
+            except Exception as e:
+                if self.is_plugin_session_error(e):
+                    _LOGGER.warning(
+                        f"[async_dispatch_notification_batch] plugin session error: {e}"
+                    )
+                    return
+
+                _LOGGER.error(f"[async_dispatch_notification_batch] {e}")
+                response = {}
+
+            for index in range(len(items)):
+                results[offset + index] = False
+
+            for result in response.get("results", []):
+                index = int(result.get("index", 0))
+                if 0 <= index < len(items):
+                    results[offset + index] = result.get("success", False)
+
+        async def _dispatch_channel(index: int, channel_data) -> None:
+            try:
+                async with limiter:
+                    await self.noti_plugin_connector.async_dispatch_notification(
+                        endpoint,
+                        secret_data,
+                        channel_data,
+                        notification_type,
+                        message,
+                        options,
+                    )
+                results[index] = True
+            except Exception as e:
+                if self.is_plugin_session_error(e):
+                    _LOGGER.warning(
+                        f"[async_dispatch_notification_batch] plugin session error: {e}"
+                    )
+                    return
+
+                _LOGGER.error(f"[async_dispatch_notification_batch] {e}")
+                results[index] = False
+
+        if plugin_metadata.get("supports_batch_dispatch", False):
+            max_batch_size = plugin_metadata.get("max_batch_size", 100)
+            coroutines = [
+                _dispatch_batch_items(
+                    offset,
+                    [
+                        {"channel_data": channel_data, "message": message}
+                        for channel_data in channels[offset : offset + max_batch_size]
+                    ],
+                )
+                for offset in range(0, len(channels), max_batch_size)
+            ]
+        else:
+            coroutines = [
+                _dispatch_channel(index, channel_data)
+                for index, channel_data in enumerate(channels)
+            ]
+
+        await asyncio.gather(*coroutines)
+        return results
+
+    @staticmethod
+    def _make_plugin_session_key(plugin_info: dict, domain_id: str) -> tuple:
+        return (
+            plugin_info["plugin_id"],
+            plugin_info.get("version"),
+            utils.dict_to_hash(plugin_info.get("options", {})),
+            domain_id,
+        )
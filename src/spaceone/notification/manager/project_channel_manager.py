@@ -1,10 +1,23 @@
 import logging
 
-from mongoengine import QuerySet
+from mongoengine import Q, QuerySet
+from spaceone.core import config
 from spaceone.core.manager import BaseManager
+from spaceone.notification.lib import invalidation_bus
+from spaceone.notification.lib.channel_record import ProjectChannelRecord
+from spaceone.notification.lib.delivery_plan import get_delivery_plan_cache
+from spaceone.notification.lib.local_cache import get_local_cache
+from spaceone.notification.lib.schedule import make_week_hour_query, make_week_hours
+from spaceone.notification.lib.topic_matcher import make_topic_query
+from spaceone.notification.manager.secret_manager import SecretManager
 from spaceone.notification.model.project_channel_model import ProjectChannel
 
 _LOGGER = logging.getLogger(__name__)
+_DISPATCH_REFERENCE_TOPIC = "project_channel_reference"
+
+
+def _delete_dispatch_reference(key: list) -> None:
+    get_local_cache("dispatch_reference").delete(("project_channel", *key))
 
 
 class ProjectChannelManager(BaseManager):
@@ -13,6 +26,12 @@ class ProjectChannelManager(BaseManager):
         self.project_channel_model: ProjectChannel = self.locator.get_model(
             "ProjectChannel"
         )
+        self.delivery_plan_cache = get_delivery_plan_cache(
+            "project", ProjectChannelRecord
+        )
+        invalidation_bus.subscribe(
+            _DISPATCH_REFERENCE_TOPIC, _delete_dispatch_reference
+        )
 
     def create_project_channel(self, params):
         def _rollback(vo):
@@ -20,8 +39,12 @@ class ProjectChannelManager(BaseManager):
                 f"[create_project_channel._rollback] Delete Project Channel : {vo.name} ({vo.project_channel_id})"
             )
             vo.delete()
+            self.refresh_delivery_plan(vo.project_id, vo.domain_id)
 
         project_channel_vo: ProjectChannel = self.project_channel_model.create(params)
+        self.refresh_delivery_plan(
+            project_channel_vo.project_id, project_channel_vo.domain_id
+        )
 
         self.transaction.add_rollback(_rollback, project_channel_vo)
 
@@ -34,9 +57,19 @@ class ProjectChannelManager(BaseManager):
                 f'({old_data["project_channel_id"]})'
             )
             project_channel_vo.update(old_data)
+            self.refresh_delivery_plan(
+                project_channel_vo.project_id, project_channel_vo.domain_id
+            )
+            self.invalidate_dispatch_reference(project_channel_vo)
 
         self.transaction.add_rollback(_rollback, project_channel_vo.to_dict())
-        return project_channel_vo.update(params)
+        project_channel_vo = project_channel_vo.update(params)
+        self.refresh_delivery_plan(
+            project_channel_vo.project_id, project_channel_vo.domain_id
+        )
+        self.invalidate_dispatch_reference(project_channel_vo)
+
+        return project_channel_vo
 
     def delete_project_channel(self, project_channel_id, domain_id):
         project_channel_vo: ProjectChannel = self.get_project_channel(
@@ -66,12 +99,132 @@ class ProjectChannelManager(BaseManager):
             domain_id=domain_id,
         )
 
+    def update_protocol_snapshot(
+        self, protocol_id: str, domain_id: str, protocol_snapshot: dict
+    ) -> int:
+        """Set the protocol snapshot of all channels of a protocol
+
+        Channels with a newer snapshot version are left untouched.
+        """
+
+        count = self.project_channel_model.objects(
+            Q(protocol_snapshot=None)
+            | Q(protocol_snapshot__version__lt=protocol_snapshot["version"]),
+            protocol_id=protocol_id,
+            domain_id=domain_id,
+        ).update(set__protocol_snapshot=protocol_snapshot)
+
+        project_ids = self.project_channel_model.objects(
+            protocol_id=protocol_id, domain_id=domain_id
+        ).distinct("project_id")
+        self.delivery_plan_cache.delete_many(project_ids, domain_id)
+
+        return count
+
     def list_project_channels(self, query: dict) -> dict:
         return self.project_channel_model.query(**query)
 
+    def filter_project_channel_records(
+        self, week_hour: int = None, topic: str = None, **conditions
+    ) -> list:
+        """Filter project channels as lightweight records for dispatch
+
+        Scheduled channels out of week_hour are excluded by the query
+        if SCHEDULE_QUERY_FILTER is enabled, and subscribed channels
+        which can not match the topic are excluded.
+        """
+
+        raw_queries = []
+
+        if week_hour is not None and config.get_global("SCHEDULE_QUERY_FILTER", True):
+            raw_queries.append(make_week_hour_query(week_hour))
+
+        if topic is not None:
+            raw_queries.append(make_topic_query(topic))
+
+        if len(raw_queries) == 1:
+            conditions["__raw__"] = raw_queries[0]
+        elif raw_queries:
+            conditions["__raw__"] = {"$and": raw_queries}
+
+        return [
+            ProjectChannelRecord.from_son(son)
+            for son in self.project_channel_model.filter(**conditions)
+            .only(*ProjectChannelRecord.get_fields())
+            .as_pymongo()
+        ]
+
+    def get_delivery_plans(self, project_ids: list, domain_id: str) -> dict:
+        """Records of the enabled channels of projects through the delivery plan cache
+
+        Returns a dict of project_id to channel records.
+        """
+
+        return self.delivery_plan_cache.get_many(
+            project_ids, domain_id, self._load_delivery_plans
+        )
+
+    def refresh_delivery_plan(self, project_id: str, domain_id: str) -> None:
+        plan_docs = self._load_delivery_plans([project_id], domain_id)
+        self.delivery_plan_cache.set(
+            project_id, domain_id, plan_docs.get(project_id, [])
+        )
+
+    @staticmethod
+    def invalidate_dispatch_reference(project_channel_vo: ProjectChannel) -> None:
+        """Delete the channel and its secret data from the local caches of workers"""
+
+        invalidation_bus.publish(
+            _DISPATCH_REFERENCE_TOPIC,
+            [project_channel_vo.project_channel_id, project_channel_vo.domain_id],
+        )
+
+        if project_channel_vo.secret_id:
+            SecretManager.invalidate_secret_data(project_channel_vo.secret_id)
+
+    def _load_delivery_plans(self, project_ids: list, domain_id: str) -> dict:
+        plan_docs = {}
+
+        for son in (
+            self.project_channel_model.filter(
+                project_id=project_ids, state="ENABLED", domain_id=domain_id
+            )
+            .only(*ProjectChannelRecord.get_fields())
+            .as_pymongo()
+        ):
+            plan_docs.setdefault(son["project_id"], []).append(son)
+
+        return plan_docs
+
+    def backfill_schedule_week_hours(self) -> int:
+        """Set week_hours of schedules saved before week hour masks"""
+
+        count = 0
+        channel_vos = self.project_channel_model.filter(
+            is_scheduled=True, schedule__week_hours=None
+        )
+
+        for channel_vo in channel_vos:
+            if (schedule := channel_vo.schedule) is None:
+                continue
+
+            self.project_channel_model.objects(
+                project_channel_id=channel_vo.project_channel_id
+            ).update_one(
+                set__schedule__week_hours=make_week_hours(
+                    schedule.day_of_week, schedule.start_hour, schedule.end_hour
+                )
+            )
+            count += 1
+
+        return count
+
     def stat_project_channels(self, query):
         return self.project_channel_model.stat(**query)
 
-    @staticmethod
-    def delete_project_channel_by_vo(project_channel_vo):
+    def delete_project_channel_by_vo(self, project_channel_vo):
         project_channel_vo.delete()
+        self.refresh_delivery_plan(
+            project_channel_vo.project_id, project_channel_vo.domain_id
+        )
+        self.invalidate_dispatch_reference(project_channel_vo)
@@ -1,14 +1,44 @@
+import copy
 import logging
+import time
+
+from bson import json_util
+from spaceone.core import cache, config
 from spaceone.core.manager import BaseManager
+from spaceone.notification.lib import invalidation_bus
+from spaceone.notification.lib.local_cache import get_local_cache
+from spaceone.notification.manager.project_channel_manager import (
+    ProjectChannelManager,
+)
+from spaceone.notification.manager.user_channel_manager import UserChannelManager
 from spaceone.notification.model.protocol_model import Protocol
 
 _LOGGER = logging.getLogger(__name__)
+_PROTOCOL_TOPIC = "protocol"
+
+
+def _delete_local_protocol(key: list) -> None:
+    get_local_cache("protocol").delete(tuple(key))
+
+
+def _invalidate_protocol(protocol_vo: Protocol) -> None:
+    protocol_id = protocol_vo.protocol_id
+    domain_id = protocol_vo.domain_id
+
+    if cache.is_set():
+        try:
+            cache.delete(f"protocol:{domain_id}:{protocol_id}")
+        except Exception as e:
+            _LOGGER.error(f"[_invalidate_protocol] failed to delete cache: {e}")
+
+    invalidation_bus.publish(_PROTOCOL_TOPIC, [protocol_id, domain_id])
 
 
 class ProtocolManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.protocol_model: Protocol = self.locator.get_model("Protocol")
+        invalidation_bus.subscribe(_PROTOCOL_TOPIC, _delete_local_protocol)
 
     def create_protocol(self, params):
         def _rollback(protocol_vo):
@@ -37,9 +67,13 @@ class ProtocolManager(BaseManager):
                 f'{old_data["protocol_id"]}'
             )
             protocol_vo.update(old_data)
+            _invalidate_protocol(protocol_vo)
 
         self.transaction.add_rollback(_rollback, protocol_vo.to_dict())
-        return protocol_vo.update(params)
+        protocol_vo = protocol_vo.update(params)
+        _invalidate_protocol(protocol_vo)
+
+        return protocol_vo
 
     def delete_protocol(self, protocol_id: str, domain_id: str) -> None:
         self.delete_protocol_by_vo(self.get_protocol(protocol_id, domain_id))
@@ -57,6 +91,112 @@ class ProtocolManager(BaseManager):
     def get_protocol(self, protocol_id: str, domain_id: str) -> Protocol:
         return self.protocol_model.get(protocol_id=protocol_id, domain_id=domain_id)
 
+    def get_cached_protocol(self, protocol_id: str, domain_id: str) -> Protocol:
+        """Get a protocol through the local cache and the shared cache
+
+        Returns a detached copy of the cached protocol, which can still be updated.
+        """
+        local_cache = get_local_cache("protocol")
+        cache_key = (protocol_id, domain_id)
+
+        if (protocol_data := local_cache.get(cache_key)) is None:
+            protocol_data = self._get_shared_protocol_data(protocol_id, domain_id)
+            local_cache.set(cache_key, protocol_data)
+
+        return self.protocol_model._from_son(copy.deepcopy(protocol_data))
+
+    def _get_shared_protocol_data(self, protocol_id: str, domain_id: str) -> dict:
+        cache_key = f"protocol:{domain_id}:{protocol_id}"
+
+        if cache.is_set():
+            try:
+                if cached_data := cache.get(cache_key):
+                    return json_util.loads(cached_data)
+            except Exception as e:
+                _LOGGER.error(f"[get_cached_protocol] failed to get cache: {e}")
+
+        protocol_vo = self.get_protocol(protocol_id, domain_id)
+        protocol_data = protocol_vo.to_mongo().to_dict()
+
+        if cache.is_set():
+            try:
+                cache.set(
+                    cache_key,
+                    json_util.dumps(protocol_data),
+                    expire=config.get_global("PROTOCOL_CACHE_TTL", 300),
+                )
+            except Exception as e:
+                _LOGGER.error(f"[get_cached_protocol] failed to set cache: {e}")
+
+        return protocol_data
+
+    @staticmethod
+    def make_protocol_snapshot(protocol_vo: Protocol) -> dict:
+        """Routing fields of a protocol stored on its channels
+
+        The version is the snapshot time in milliseconds.
+        """
+
+        plugin_info = protocol_vo.plugin_info.to_dict()
+        return {
+            "protocol_type": protocol_vo.protocol_type,
+            "state": protocol_vo.state,
+            "data_type": plugin_info.get("metadata", {}).get("data_type"),
+            "version": time.time_ns() // 1000000,
+        }
+
+    def sync_protocol_snapshot(
+        self, protocol_vo: Protocol, old_protocol_snapshot: dict
+    ) -> None:
+        """Push the snapshot of an updated protocol to its channels if it changed"""
+
+        protocol_snapshot = self.make_protocol_snapshot(protocol_vo)
+
+        if self._is_same_snapshot(protocol_snapshot, old_protocol_snapshot):
+            return
+
+        def _rollback(old_snapshot: dict):
+            _LOGGER.info(
+                f"[sync_protocol_snapshot._rollback] Revert Protocol Snapshot : "
+                f"{protocol_vo.protocol_id}"
+            )
+            self._update_protocol_snapshot(
+                protocol_vo.protocol_id,
+                protocol_vo.domain_id,
+                # Newer than the synced snapshot
+                {**old_snapshot, "version": protocol_snapshot["version"] + 1},
+            )
+
+        if self.transaction.verb:
+            self.transaction.add_rollback(_rollback, old_protocol_snapshot)
+
+        self._update_protocol_snapshot(
+            protocol_vo.protocol_id, protocol_vo.domain_id, protocol_snapshot
+        )
+
+    def _update_protocol_snapshot(
+        self, protocol_id: str, domain_id: str, protocol_snapshot: dict
+    ) -> None:
+        project_channel_mgr: ProjectChannelManager = self.locator.get_manager(
+            "ProjectChannelManager"
+        )
+        user_channel_mgr: UserChannelManager = self.locator.get_manager(
+            "UserChannelManager"
+        )
+
+        project_channel_mgr.update_protocol_snapshot(
+            protocol_id, domain_id, protocol_snapshot
+        )
+        user_channel_mgr.update_protocol_snapshot(
+            protocol_id, domain_id, protocol_snapshot
+        )
+
+    @staticmethod
+    def _is_same_snapshot(protocol_snapshot: dict, other_snapshot: dict) -> bool:
+        return {k: v for k, v in protocol_snapshot.items() if k != "version"} == {
+            k: v for k, v in other_snapshot.items() if k != "version"
+        }
+
     def list_protocols(self, query={}):
         return self.protocol_model.query(**query)
 
@@ -65,4 +205,5 @@ class ProtocolManager(BaseManager):
 
     @staticmethod
     def delete_protocol_by_vo(protocol_vo):
-        return protocol_vo.delete()
+        protocol_vo.delete()
+        _invalidate_protocol(protocol_vo)
@@ -0,0 +1,182 @@
+import logging
+import weakref
+
+from spaceone.core import cache, config
+from spaceone.core.manager import BaseManager
+
+_LOGGER = logging.getLogger(__name__)
+
+_DAY_TTL = 60 * 60 * 24 * 2
+_MONTH_TTL = 60 * 60 * 24 * 32
+
+# Lua scripts registered per redis connection
+_SCRIPTS = weakref.WeakKeyDictionary()
+
+# KEYS: day_key, month_key / ARGV: count, day_limit, month_limit, day_ttl, month_ttl
+_ACQUIRE_SCRIPT = """
+local granted = tonumber(ARGV[1])
+local limits = {tonumber(ARGV[2]), tonumber(ARGV[3])}
+
+for i, key in ipairs(KEYS) do
+    if limits[i] >= 0 then
+        local used = tonumber(redis.call('GET', key) or '0')
+        granted = math.min(granted, limits[i] - used)
+    end
+end
+
+if granted <= 0 then
+    return 0
+end
+
+redis.call('INCRBY', KEYS[1], granted)
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+redis.call('INCRBY', KEYS[2], granted)
+redis.call('EXPIRE', KEYS[2], ARGV[5])
+
+return granted
+"""
+
+# KEYS: day_key, month_key / ARGV: count
+_RELEASE_SCRIPT = """
+for i, key in ipairs(KEYS) do
+    local used = redis.call('DECRBY', key, ARGV[1])
+    if used < 0 then
+        redis.call('INCRBY', key, -used)
+    end
+end
+"""
+
+# KEYS: day_key, month_key / ARGV: day_count, month_count, day_ttl, month_ttl
+_RECONCILE_SCRIPT = """
+for i, key in ipairs(KEYS) do
+    local used = tonumber(redis.call('GET', key) or '0')
+    if tonumber(ARGV[i]) > used then
+        redis.call('SET', key, ARGV[i], 'EX', ARGV[i + 2])
+    end
+end
+"""
+
+
+@cache.connect
+def _get_cache_connection(cache_cls):
+    return getattr(cache_cls, "conn", None)
+
+
+class QuotaManager(BaseManager):
+    """Per-protocol day/month quota counters of DEFAULT_QUOTA kept in redis"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.default_quota = config.get_global("DEFAULT_QUOTA", {})
+
+    def get_quota_limit(self, plugin_id: str) -> dict:
+        quota_limit = self.default_quota.get(plugin_id, {})
+        return {
+            "day": quota_limit.get("day", -1),
+            "month": quota_limit.get("month", -1),
+        }
+
+    def has_quota_limit(self, plugin_id: str) -> bool:
+        quota_limit = self.get_quota_limit(plugin_id)
+        return quota_limit["day"] >= 0 or quota_limit["month"] >= 0
+
+    def acquire_quota(
+        self,
+        protocol_id: str,
+        plugin_id: str,
+        usage_month: str,
+        usage_date: str,
+        domain_id: str,
+        count: int = 1,
+    ) -> int:
+        """Reserve up to count notifications and return the number of granted ones"""
+
+        if not self.has_quota_limit(plugin_id):
+            return count
+
+        if (conn := self._get_connection()) is None:
+            return count
+
+        quota_limit = self.get_quota_limit(plugin_id)
+        granted = self._get_script(conn, _ACQUIRE_SCRIPT)(
+            keys=self._make_quota_keys(protocol_id, usage_month, usage_date, domain_id),
+            args=[
+                count,
+                quota_limit["day"],
+                quota_limit["month"],
+                _DAY_TTL,
+                _MONTH_TTL,
+            ],
+        )
+
+        return int(granted)
+
+    def release_quota(
+        self,
+        protocol_id: str,
+        plugin_id: str,
+        usage_month: str,
+        usage_date: str,
+        domain_id: str,
+        count: int = 1,
+    ) -> None:
+        if count <= 0 or not self.has_quota_limit(plugin_id):
+            return
+
+        if (conn := self._get_connection()) is None:
+            return
+
+        self._get_script(conn, _RELEASE_SCRIPT)(
+            keys=self._make_quota_keys(protocol_id, usage_month, usage_date, domain_id),
+            args=[count],
+        )
+
+    def reconcile_quota(
+        self,
+        protocol_id: str,
+        usage_month: str,
+        usage_date: str,
+        domain_id: str,
+        day_count: int,
+        month_count: int,
+    ) -> None:
+        """Raise counters to the persisted usage (counters never go below it)"""
+
+        if (conn := self._get_connection()) is None:
+            return
+
+        self._get_script(conn, _RECONCILE_SCRIPT)(
+            keys=self._make_quota_keys(protocol_id, usage_month, usage_date, domain_id),
+            args=[day_count, month_count, _DAY_TTL, _MONTH_TTL],
+        )
+
+    @staticmethod
+    def _get_connection():
+        if not cache.is_set():
+            return None
+
+        conn = _get_cache_connection()
+        if conn is None:
+            _LOGGER.warning(
+                "[QuotaManager] quota is not enforced. (default cache is not redis)"
+            )
+
+        return conn
+
+    @staticmethod
+    def _get_script(conn, script: str):
+        scripts = _SCRIPTS.setdefault(conn, {})
+
+        if script not in scripts:
+            scripts[script] = conn.register_script(script)
+
+        return scripts[script]
+
+    @staticmethod
+    def _make_quota_keys(
+        protocol_id: str, usage_month: str, usage_date: str, domain_id: str
+    ) -> list:
+        return [
+            f"quota:{domain_id}:{protocol_id}:day:{usage_month}-{usage_date}",
+            f"quota:{domain_id}:{protocol_id}:month:{usage_month}",
+        ]
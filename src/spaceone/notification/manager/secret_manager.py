@@ -4,8 +4,15 @@ from spaceone.core import config
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
 from spaceone.notification.error import *
+from spaceone.notification.lib import invalidation_bus
+from spaceone.notification.lib.secret_cache import get_secret_cache
 
 _LOGGER = logging.getLogger(__name__)
+_SECRET_TOPIC = "secret"
+
+
+def _delete_local_secret(secret_id: str) -> None:
+    get_secret_cache("secret_data").delete(secret_id)
 
 
 class SecretManager(BaseManager):
@@ -14,6 +21,7 @@ class SecretManager(BaseManager):
         self.secret_connector: SpaceConnector = self.locator.get_connector(
             "SpaceConnector", service="secret"
         )
+        invalidation_bus.subscribe(_SECRET_TOPIC, _delete_local_secret)
 
     def create_secret(self, params):
         return self.secret_connector.dispatch("Secret.create", params)
@@ -22,10 +30,22 @@ class SecretManager(BaseManager):
         return self.secret_connector.dispatch("Secret.update", params)
 
     def update_secret_data(self, params):
-        return self.secret_connector.dispatch("Secret.update_data", params)
+        response = self.secret_connector.dispatch("Secret.update_data", params)
+        self.invalidate_secret_data(params["secret_id"])
+        return response
 
     def delete_secret(self, secret_id: str):
-        return self.secret_connector.dispatch("Secret.delete", {"secret_id": secret_id})
+        response = self.secret_connector.dispatch(
+            "Secret.delete", {"secret_id": secret_id}
+        )
+        self.invalidate_secret_data(secret_id)
+        return response
+
+    @staticmethod
+    def invalidate_secret_data(secret_id: str) -> None:
+        """Delete the secret data from the 'secret_data' secret caches of workers"""
+
+        invalidation_bus.publish(_SECRET_TOPIC, secret_id)
 
     def list_secrets(self, query, domain_id):
         return self.secret_connector.dispatch(
@@ -41,6 +61,24 @@ class SecretManager(BaseManager):
         )
         return response["data"]
 
+    def get_cached_secret_data(self, secret_id: str, domain_id: str) -> dict:
+        return get_secret_cache("secret_data").get_or_load(
+            (secret_id, domain_id), lambda: self.get_secret_data(secret_id, domain_id)
+        )
+
+    def get_cached_secret_data_many(self, secret_ids: list, domain_id: str) -> dict:
+        """Resolve multiple secrets with up to SECRET_RESOLVE_PARALLEL concurrent calls
+
+        Returns a dict of secret_id to secret data. Secrets failed to resolve are omitted.
+        """
+
+        secrets = get_secret_cache("secret_data").get_or_load_many(
+            [(secret_id, domain_id) for secret_id in secret_ids],
+            lambda key: self.get_secret_data(*key),
+            config.get_global("SECRET_RESOLVE_PARALLEL", 8),
+        )
+        return {key[0]: secret_data for key, secret_data in secrets.items()}
+
     def get_plugin_secret_data(self, secret_id, supported_schema, domain_id):
         secret_query = self._make_query(
             supported_schema=supported_schema, secret_id=secret_id
@@ -1,15 +1,33 @@
 import logging
 
+from mongoengine import Q
+from spaceone.core import config
 from spaceone.core.manager import BaseManager
+from spaceone.notification.lib import invalidation_bus
+from spaceone.notification.lib.channel_record import UserChannelRecord
+from spaceone.notification.lib.delivery_plan import get_delivery_plan_cache
+from spaceone.notification.lib.local_cache import get_local_cache
+from spaceone.notification.lib.schedule import make_week_hour_query, make_week_hours
+from spaceone.notification.lib.topic_matcher import make_topic_query
+from spaceone.notification.manager.user_secret_manager import UserSecretManager
 from spaceone.notification.model.user_channel_model import UserChannel
 
 _LOGGER = logging.getLogger(__name__)
+_DISPATCH_REFERENCE_TOPIC = "user_channel_reference"
+
+
+def _delete_dispatch_reference(key: list) -> None:
+    get_local_cache("dispatch_reference").delete(("user_channel", *key))
 
 
 class UserChannelManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.user_channel_model: UserChannel = self.locator.get_model("UserChannel")
+        self.delivery_plan_cache = get_delivery_plan_cache("user", UserChannelRecord)
+        invalidation_bus.subscribe(
+            _DISPATCH_REFERENCE_TOPIC, _delete_dispatch_reference
+        )
 
     def create_user_channel(self, params):
         def _rollback(vo):
@@ -17,8 +35,10 @@ class UserChannelManager(BaseManager):
                 f"[create_user_channel._rollback] Delete User Channel : {vo.name} ({vo.user_channel_id})"
             )
             vo.delete()
+            self.refresh_delivery_plan(vo.user_id, vo.domain_id)
 
         user_channel_vo: UserChannel = self.user_channel_model.create(params)
+        self.refresh_delivery_plan(user_channel_vo.user_id, user_channel_vo.domain_id)
 
         self.transaction.add_rollback(_rollback, user_channel_vo)
 
@@ -34,9 +54,17 @@ class UserChannelManager(BaseManager):
                 f'({old_data["user_channel_id"]})'
             )
             user_channel_vo.update(old_data)
+            self.refresh_delivery_plan(
+                user_channel_vo.user_id, user_channel_vo.domain_id
+            )
+            self.invalidate_dispatch_reference(user_channel_vo)
 
         self.transaction.add_rollback(_rollback, user_channel_vo.to_dict())
-        return user_channel_vo.update(params)
+        user_channel_vo = user_channel_vo.update(params)
+        self.refresh_delivery_plan(user_channel_vo.user_id, user_channel_vo.domain_id)
+        self.invalidate_dispatch_reference(user_channel_vo)
+
+        return user_channel_vo
 
     def enable_user_channel(self, user_channel_vo: UserChannel) -> UserChannel:
         self.update_user_channel_by_vo({"state": "ENABLED"}, user_channel_vo)
@@ -53,12 +81,130 @@ class UserChannelManager(BaseManager):
             user_channel_id=user_channel_id, user_id=user_id, domain_id=domain_id
         )
 
+    def update_protocol_snapshot(
+        self, protocol_id: str, domain_id: str, protocol_snapshot: dict
+    ) -> int:
+        """Set the protocol snapshot of all channels of a protocol
+
+        Channels with a newer snapshot version are left untouched.
+        """
+
+        count = self.user_channel_model.objects(
+            Q(protocol_snapshot=None)
+            | Q(protocol_snapshot__version__lt=protocol_snapshot["version"]),
+            protocol_id=protocol_id,
+            domain_id=domain_id,
+        ).update(set__protocol_snapshot=protocol_snapshot)
+
+        user_ids = self.user_channel_model.objects(
+            protocol_id=protocol_id, domain_id=domain_id
+        ).distinct("user_id")
+        self.delivery_plan_cache.delete_many(user_ids, domain_id)
+
+        return count
+
     def list_user_channels(self, query):
         return self.user_channel_model.query(**query)
 
+    def filter_user_channel_records(
+        self, week_hour: int = None, topic: str = None, **conditions
+    ) -> list:
+        """Filter user channels as lightweight records for dispatch
+
+        Scheduled channels out of week_hour are excluded by the query
+        if SCHEDULE_QUERY_FILTER is enabled, and subscribed channels
+        which can not match the topic are excluded.
+        """
+
+        raw_queries = []
+
+        if week_hour is not None and config.get_global("SCHEDULE_QUERY_FILTER", True):
+            raw_queries.append(make_week_hour_query(week_hour))
+
+        if topic is not None:
+            raw_queries.append(make_topic_query(topic))
+
+        if len(raw_queries) == 1:
+            conditions["__raw__"] = raw_queries[0]
+        elif raw_queries:
+            conditions["__raw__"] = {"$and": raw_queries}
+
+        return [
+            UserChannelRecord.from_son(son)
+            for son in self.user_channel_model.filter(**conditions)
+            .only(*UserChannelRecord.get_fields())
+            .as_pymongo()
+        ]
+
+    def get_delivery_plans(self, user_ids: list, domain_id: str) -> dict:
+        """Records of the enabled channels of users through the delivery plan cache
+
+        Returns a dict of user_id to channel records.
+        """
+
+        return self.delivery_plan_cache.get_many(
+            user_ids, domain_id, self._load_delivery_plans
+        )
+
+    def refresh_delivery_plan(self, user_id: str, domain_id: str) -> None:
+        plan_docs = self._load_delivery_plans([user_id], domain_id)
+        self.delivery_plan_cache.set(user_id, domain_id, plan_docs.get(user_id, []))
+
+    @staticmethod
+    def invalidate_dispatch_reference(user_channel_vo: UserChannel) -> None:
+        """Delete the channel and its secret data from the local caches of workers"""
+
+        invalidation_bus.publish(
+            _DISPATCH_REFERENCE_TOPIC,
+            [user_channel_vo.user_channel_id, user_channel_vo.domain_id],
+        )
+
+        if user_channel_vo.user_secret_id:
+            UserSecretManager.invalidate_user_secret_data(
+                user_channel_vo.user_secret_id
+            )
+
+    def _load_delivery_plans(self, user_ids: list, domain_id: str) -> dict:
+        plan_docs = {}
+
+        for son in (
+            self.user_channel_model.filter(
+                user_id=user_ids, state="ENABLED", domain_id=domain_id
+            )
+            .only(*UserChannelRecord.get_fields())
+            .as_pymongo()
+        ):
+            plan_docs.setdefault(son["user_id"], []).append(son)
+
+        return plan_docs
+
+    def backfill_schedule_week_hours(self) -> int:
+        """Set week_hours of schedules saved before week hour masks"""
+
+        count = 0
+        channel_vos = self.user_channel_model.filter(
+            is_scheduled=True, schedule__week_hours=None
+        )
+
+        for channel_vo in channel_vos:
+            if (schedule := channel_vo.schedule) is None:
+                continue
+
+            self.user_channel_model.objects(
+                user_channel_id=channel_vo.user_channel_id
+            ).update_one(
+                set__schedule__week_hours=make_week_hours(
+                    schedule.day_of_week, schedule.start_hour, schedule.end_hour
+                )
+            )
+            count += 1
+
+        return count
+
     def stat_user_channels(self, query):
         return self.user_channel_model.stat(**query)
 
-    @staticmethod
-    def delete_user_channel_by_vo(user_channel_vo: UserChannel) -> None:
+    def delete_user_channel_by_vo(self, user_channel_vo: UserChannel) -> None:
         user_channel_vo.delete()
+        self.refresh_delivery_plan(user_channel_vo.user_id, user_channel_vo.domain_id)
+        self.invalidate_dispatch_reference(user_channel_vo)
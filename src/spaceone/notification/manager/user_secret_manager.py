@@ -3,8 +3,15 @@ import logging
 from spaceone.core import config
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
+from spaceone.notification.lib import invalidation_bus
+from spaceone.notification.lib.secret_cache import get_secret_cache
 
 _LOGGER = logging.getLogger(__name__)
+_USER_SECRET_TOPIC = "user_secret"
+
+
+def _delete_local_user_secret(user_secret_id: str) -> None:
+    get_secret_cache("user_secret_data").delete(user_secret_id)
 
 
 class UserSecretManager(BaseManager):
@@ -13,6 +20,7 @@ class UserSecretManager(BaseManager):
         self.secret_connector: SpaceConnector = self.locator.get_connector(
             "SpaceConnector", service="secret"
         )
+        invalidation_bus.subscribe(_USER_SECRET_TOPIC, _delete_local_user_secret)
 
     def create_user_secret(self, params):
         return self.secret_connector.dispatch("UserSecret.create", params)
@@ -21,12 +29,22 @@ class UserSecretManager(BaseManager):
         return self.secret_connector.dispatch("UserSecret.update", params)
 
     def update_user_secret_data(self, params):
-        return self.secret_connector.dispatch("UserSecret.update_data", params)
+        response = self.secret_connector.dispatch("UserSecret.update_data", params)
+        self.invalidate_user_secret_data(params["user_secret_id"])
+        return response
 
     def delete_user_secret(self, user_secret_id: str):
-        return self.secret_connector.dispatch(
+        response = self.secret_connector.dispatch(
             "UserSecret.delete", {"user_secret_id": user_secret_id}
         )
+        self.invalidate_user_secret_data(user_secret_id)
+        return response
+
+    @staticmethod
+    def invalidate_user_secret_data(user_secret_id: str) -> None:
+        """Delete the secret data from the 'user_secret_data' secret caches of workers"""
+
+        invalidation_bus.publish(_USER_SECRET_TOPIC, user_secret_id)
 
     def list_user_secrets(self, query, domain_id):
         return self.secret_connector.dispatch(
@@ -41,3 +59,24 @@ class UserSecretManager(BaseManager):
             token=system_token,
         )
         return response["data"]
+
+    def get_cached_user_secret_data(self, user_secret_id: str, domain_id: str) -> dict:
+        return get_secret_cache("user_secret_data").get_or_load(
+            (user_secret_id, domain_id),
+            lambda: self.get_user_secret_data(user_secret_id, domain_id),
+        )
+
+    def get_cached_user_secret_data_many(
+        self, user_secret_ids: list, domain_id: str
+    ) -> dict:
+        """Resolve multiple secrets with up to SECRET_RESOLVE_PARALLEL concurrent calls
+
+        Returns a dict of user_secret_id to secret data. Secrets failed to resolve are omitted.
+        """
+
+        secrets = get_secret_cache("user_secret_data").get_or_load_many(
+            [(user_secret_id, domain_id) for user_secret_id in user_secret_ids],
+            lambda key: self.get_user_secret_data(*key),
+            config.get_global("SECRET_RESOLVE_PARALLEL", 8),
+        )
+        return {key[0]: secret_data for key, secret_data in secrets.items()}
@@ -3,4 +3,6 @@ from spaceone.notification.model.notification_model import Notification
 from spaceone.notification.model.project_channel_model import ProjectChannel
 from spaceone.notification.model.user_channel_model import UserChannel
 from spaceone.notification.model.schedule_model import Schedule
+from spaceone.notification.model.protocol_snapshot_model import ProtocolSnapshot
 from spaceone.notification.model.notification_usage_model import NotificationUsage
+from spaceone.notification.model.notification_event_model import NotificationEvent
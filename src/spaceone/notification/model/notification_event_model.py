@@ -0,0 +1,58 @@
+from mongoengine import *
+from spaceone.core.model.mongo_model import MongoModel
+
+
+class NotificationEvent(MongoModel):
+    event_id = StringField(max_length=40, generate_id="event", unique=True)
+    resource_type = StringField(max_length=40)
+    resource_id = StringField(max_length=255)
+    topic = StringField(max_length=255)
+    message = DictField()
+    notification_type = StringField(max_length=20, default="INFO")
+    notification_level = StringField(max_length=40, default="ALL")
+    state = StringField(
+        max_length=20,
+        default="PENDING",
+        choices=("PENDING", "IN_PROGRESS", "DONE", "FAILED"),
+    )
+    chunk_size = IntField(default=0)
+    next_page = IntField(default=0)
+    total_pages = IntField(default=None, null=True)
+    last_user_id = StringField(max_length=255, default=None, null=True)
+    page_ranges = DictField(default={})
+    completed_pages = ListField(IntField(), default=[])
+    page_cursors = DictField(default={})
+    domain_id = StringField(max_length=40)
+    created_at = DateTimeField(auto_now_add=True)
+    updated_at = DateTimeField(default=None, null=True)
+    finished_at = DateTimeField(default=None, null=True)
+
+    meta = {
+        "updatable_fields": [
+            "state",
+            "chunk_size",
+            "next_page",
+            "total_pages",
+            "last_user_id",
+            "page_ranges",
+            "completed_pages",
+            "page_cursors",
+            "updated_at",
+            "finished_at",
+        ],
+        "minimal_fields": [
+            "event_id",
+            "resource_type",
+            "resource_id",
+            "topic",
+            "state",
+        ],
+        "ordering": ["-created_at"],
+        "indexes": [
+            "state",
+            "resource_type",
+            "domain_id",
+            "created_at",
+            "updated_at",
+        ],
+    }
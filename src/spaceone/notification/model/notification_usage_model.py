@@ -3,7 +3,9 @@ from spaceone.core.model.mongo_model import MongoModel
 
 
 class NotificationUsage(MongoModel):
-    protocol_id = StringField(max_length=40)
+    protocol_id = StringField(
+        max_length=40, unique_with=["usage_month", "usage_date", "domain_id"]
+    )
     usage_date = StringField(max_length=255)
     usage_month = StringField(max_length=255)
     count = IntField(default=0)
@@ -21,5 +23,5 @@ class NotificationUsage(MongoModel):
             "domain_id",
         ],
         "ordering": ["protocol_id", "usage_month", "usage_date"],
-        "indexes": ["protocol_id", "usage_date", "usage_month", "domain_id"],
+        "indexes": ["usage_date", "usage_month", "domain_id"],
     }
@@ -1,6 +1,7 @@
 from mongoengine import *
 from spaceone.core.model.mongo_model import MongoModel
 from spaceone.notification.model.schedule_model import Schedule
+from spaceone.notification.model.protocol_snapshot_model import ProtocolSnapshot
 
 
 class ProjectChannel(MongoModel):
@@ -22,6 +23,7 @@ class ProjectChannel(MongoModel):
     tags = DictField()
     secret_id = StringField(max_length=255)
     protocol_id = StringField(max_length=40)
+    protocol_snapshot = EmbeddedDocumentField(ProtocolSnapshot, default=None, null=True)
     project_id = StringField(max_length=255)
     workspace_id = StringField(default=None, null=True, max_length=40)
     domain_id = StringField(max_length=255)
@@ -49,6 +51,7 @@ class ProjectChannel(MongoModel):
         "indexes": [
             "state",
             "is_subscribe",
+            "subscriptions",
             "is_scheduled",
             "secret_id",
             "protocol_id",
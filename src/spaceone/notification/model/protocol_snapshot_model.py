@@ -0,0 +1,13 @@
+from mongoengine import *
+
+
+class ProtocolSnapshot(EmbeddedDocument):
+    """Routing fields of the protocol of a channel (synced by ProtocolManager)"""
+
+    protocol_type = StringField(max_length=40)
+    state = StringField(max_length=20)
+    data_type = StringField(max_length=40, null=True, default=None)
+    version = IntField(default=0)
+
+    def to_dict(self):
+        return dict(self.to_mongo())
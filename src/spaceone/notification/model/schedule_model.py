@@ -6,3 +6,5 @@ class Schedule(EmbeddedDocument):
     day_of_week = ListField(StringField(choices=['MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN'], required=True))
     start_hour = IntField(required=True, default=0)
     end_hour = IntField(required=True)
+    # Bitmask of week hours (spaceone.notification.lib.schedule.make_week_hours)
+    week_hours = BinaryField(default=None, null=True)
@@ -1,6 +1,7 @@
 from mongoengine import *
 from spaceone.core.model.mongo_model import MongoModel
 from spaceone.notification.model.schedule_model import Schedule
+from spaceone.notification.model.protocol_snapshot_model import ProtocolSnapshot
 
 
 class UserChannel(MongoModel):
@@ -17,6 +18,7 @@ class UserChannel(MongoModel):
     tags = DictField()
     user_secret_id = StringField(max_length=255)
     protocol_id = StringField(max_length=40)
+    protocol_snapshot = EmbeddedDocumentField(ProtocolSnapshot, default=None, null=True)
     user_id = StringField(max_length=255)
     domain_id = StringField(max_length=255)
     created_at = DateTimeField(auto_now_add=True)
@@ -42,6 +44,7 @@ class UserChannel(MongoModel):
         "indexes": [
             "state",
             "is_subscribe",
+            "subscriptions",
             "is_scheduled",
             "user_secret_id",
             "protocol_id",
@@ -1,12 +1,27 @@
 import logging
 import datetime
+import functools
+import time
+from typing import Union
 
-from spaceone.core import queue, utils
+from opentelemetry import metrics
+
+from spaceone.core import cache, config, queue, utils
 from spaceone.core.service import *
 
+from spaceone.notification.error import *
+from spaceone.notification.lib.channel_eligibility import evaluate_channel_eligibility
+from spaceone.notification.lib.channel_record import (
+    ProjectChannelRecord,
+    UserChannelRecord,
+)
+from spaceone.notification.lib.local_cache import get_local_cache
+from spaceone.notification.lib.parallel import run_concurrently, run_in_threads
 from spaceone.notification.lib.schedule import *
+from spaceone.notification.lib.topic_matcher import get_topic_matcher
 from spaceone.notification.manager import IdentityManager
 from spaceone.notification.manager import NotificationManager
+from spaceone.notification.manager import NotificationEventManager
 from spaceone.notification.manager import ProjectChannelManager
 from spaceone.notification.manager import UserChannelManager
 from spaceone.notification.manager import ProtocolManager
@@ -14,12 +29,30 @@ from spaceone.notification.manager import SecretManager
 from spaceone.notification.manager import UserSecretManager
 from spaceone.notification.manager import PluginManager
 from spaceone.notification.manager import NotificationUsageManager
-from spaceone.notification.model import Protocol, UserChannel
+from spaceone.notification.manager import QuotaManager
+from spaceone.notification.model import (
+    NotificationEvent,
+    Protocol,
+    ProjectChannel,
+    UserChannel,
+)
 from spaceone.notification.conf.global_conf import *
 
 _LOGGER = logging.getLogger(__name__)
 OLD_NOTIFICATION_DAYS = 60
 
+_METER = metrics.get_meter(__name__)
+_IDENTITY_LOOKUP_DURATION = _METER.create_histogram(
+    "notification.create.identity_lookup.duration",
+    unit="ms",
+    description="Wall time of the concurrent identity lookups of Notification.create",
+)
+_IDENTITY_LOOKUP_SAVED = _METER.create_histogram(
+    "notification.create.identity_lookup.saved",
+    unit="ms",
+    description="Sequential time of the identity lookups minus their wall time",
+)
+
 
 @authentication_handler
 @authorization_handler
@@ -33,6 +66,10 @@ class NotificationService(BaseService):
         self.notification_mgr: NotificationManager = self.locator.get_manager(
             "NotificationManager"
         )
+        self.queue_payload = self._get_queue_payload()
+        self.dispatch_batches = {}
+        self.queue_messages = {}
+        self.notification_buffer = []
 
     @transaction()
     @check_required(["resource_type", "resource_id", "topic", "message", "domain_id"])
@@ -60,7 +97,16 @@ class NotificationService(BaseService):
         resource_id = params["resource_id"]
         message = params["message"]
 
-        domain_info = identity_mgr.get_domain_info(domain_id)
+        lookups = self._lookup_identity(identity_mgr, params)
+
+        try:
+            domain_info = lookups["domain"].result()
+        except TimeoutError:
+            raise ERROR_IDENTITY_LOOKUP_TIMEOUT(
+                timeout=config.get_global("IDENTITY_LOOKUP_TIMEOUT", 10),
+                lookups="domain",
+            )
+
         if domain_info["state"] != "ENABLED":
             _LOGGER.error(f"[Notification] Domain is disabled: {domain_id}")
             return None
@@ -68,11 +114,87 @@ class NotificationService(BaseService):
         message["domain_name"] = self.get_domain_name(domain_info)
 
         try:
-            identity_mgr.get_resource(resource_id, resource_type, domain_id)
+            lookups["resource"].result()
+        except TimeoutError:
+            raise ERROR_IDENTITY_LOOKUP_TIMEOUT(
+                timeout=config.get_global("IDENTITY_LOOKUP_TIMEOUT", 10),
+                lookups="resource",
+            )
         except Exception as e:
             _LOGGER.error(f"[Notification] Failed to get resource: {e}")
             return None
 
+        if config.get_global("NOTIFICATION_FANOUT", "SYNC") == "ASYNC":
+            event_mgr: NotificationEventManager = self.locator.get_manager(
+                NotificationEventManager
+            )
+            event_vo = event_mgr.create_notification_event(
+                {
+                    "resource_type": resource_type,
+                    "resource_id": resource_id,
+                    "topic": params["topic"],
+                    "message": message,
+                    "notification_type": params.get("notification_type", "INFO"),
+                    "notification_level": params.get("notification_level", "ALL"),
+                    "domain_id": domain_id,
+                }
+            )
+
+            self._push_dispatch_task(
+                "fan_out_notification",
+                {"event_id": event_vo.event_id, "domain_id": domain_id},
+            )
+        else:
+            self.dispatch_resource(params)
+
+    @staticmethod
+    def _lookup_identity(identity_mgr: IdentityManager, params: dict) -> dict:
+        """Resolve the identity lookups of a notification concurrently
+
+        All lookups share IDENTITY_LOOKUP_TIMEOUT. Project users of "*" channels
+        are resolved lazily by dispatch_project_channel.
+
+        Returns:
+            lookups (dict): {lookup name: Future}
+        """
+
+        domain_id = params["domain_id"]
+        resource_type = params["resource_type"]
+        resource_id = params["resource_id"]
+
+        lookups = {
+            "domain": functools.partial(identity_mgr.get_cached_domain_info, domain_id),
+            "resource": functools.partial(
+                identity_mgr.get_cached_resource,
+                resource_id,
+                resource_type,
+                domain_id,
+            ),
+        }
+
+        start = time.perf_counter()
+        futures, durations = run_concurrently(
+            lookups,
+            timeout=config.get_global("IDENTITY_LOOKUP_TIMEOUT", 10),
+            max_workers=len(lookups),
+        )
+        elapsed = time.perf_counter() - start
+        saved = max(sum(durations.values()) - elapsed, 0)
+
+        attributes = {"resource_type": resource_type}
+        _IDENTITY_LOOKUP_DURATION.record(elapsed * 1000, attributes)
+        _IDENTITY_LOOKUP_SAVED.record(saved * 1000, attributes)
+
+        _LOGGER.debug(
+            f"[_lookup_identity] {list(durations)}: {elapsed * 1000:.1f}ms "
+            f"(saved {saved * 1000:.1f}ms)"
+        )
+
+        return futures
+
+    def dispatch_resource(self, params):
+        resource_type = params["resource_type"]
+
         if resource_type == "identity.Domain":
             self.dispatch_domain(params)
 
@@ -82,30 +204,306 @@ class NotificationService(BaseService):
         elif resource_type == "identity.User":
             self.dispatch_user_channel(params)
 
-    def dispatch_domain(self, params):
+        self.flush_notifications()
+        self.flush_queue()
+
+    def fan_out_notification(self, event_id, domain_id):
+        event_mgr: NotificationEventManager = self.locator.get_manager(
+            NotificationEventManager
+        )
+        event_vo = event_mgr.get_notification_event(event_id, domain_id)
+
+        if event_vo.state != "PENDING":
+            _LOGGER.info(
+                f"[fan_out_notification] Event is already {event_vo.state}: {event_id}"
+            )
+            return
+
+        if event_vo.resource_type == "identity.Domain":
+            self.dispatch_domain(self._make_event_params(event_vo), event_vo)
+            return
+
+        event_vo = event_mgr.update_notification_event_by_vo(
+            {"state": "IN_PROGRESS"}, event_vo
+        )
+
+        try:
+            self.dispatch_resource(self._make_event_params(event_vo))
+            event_mgr.update_notification_event_by_vo(
+                {"state": "DONE", "finished_at": datetime.datetime.utcnow()}, event_vo
+            )
+        except Exception as e:
+            _LOGGER.error(
+                f"[fan_out_notification] Failed to fan out event ({event_id}): {e}",
+                exc_info=True,
+            )
+            event_mgr.update_notification_event_by_vo(
+                {"state": "FAILED", "finished_at": datetime.datetime.utcnow()}, event_vo
+            )
+
+    @staticmethod
+    def _make_event_params(event_vo) -> dict:
+        return {
+            "resource_type": event_vo.resource_type,
+            "resource_id": event_vo.resource_id,
+            "topic": event_vo.topic,
+            "message": event_vo.message,
+            "notification_type": event_vo.notification_type,
+            "notification_level": event_vo.notification_level,
+            "domain_id": event_vo.domain_id,
+        }
+
+    def dispatch_domain(self, params, event_vo=None):
+        """Dispatch the notification to all users of a domain
+
+        A broadcast job is started whenever the worker queue exists: pages of
+        NOTIFICATION_FANOUT_CHUNK_SIZE users are claimed after the user cursor
+        of the job by NOTIFICATION_BROADCAST_PARALLEL dispatch_domain_chunk tasks.
+        Progress of pages is recorded on the job so that it can be resumed after
+        failure. Without the queue, users are paged and dispatched in the request.
+        """
         domain_id = params["resource_id"]
         _LOGGER.debug(f"[Dispatch Domain] Domain ID: {domain_id}")
 
+        chunk_size = config.get_global("NOTIFICATION_FANOUT_CHUNK_SIZE", 100)
+
+        if event_vo is None and "notification_q" not in config.get_global("QUEUES", {}):
+            identity_mgr: IdentityManager = self.locator.get_manager(IdentityManager)
+
+            user_ids = []
+            for user in identity_mgr.get_all_users_in_domain(domain_id, chunk_size):
+                user_ids.append(user["user_id"])
+
+                if len(user_ids) >= chunk_size:
+                    self.dispatch_user_channels(params, user_ids)
+                    user_ids = []
+
+            if user_ids:
+                self.dispatch_user_channels(params, user_ids)
+
+            return
+
+        event_mgr: NotificationEventManager = self.locator.get_manager(
+            NotificationEventManager
+        )
+
+        if event_vo is None:
+            event_vo = event_mgr.create_notification_event(
+                {
+                    "resource_type": "identity.Domain",
+                    "resource_id": domain_id,
+                    "topic": params["topic"],
+                    "message": params["message"],
+                    "notification_type": params.get("notification_type", "INFO"),
+                    "notification_level": params.get("notification_level", "ALL"),
+                    "domain_id": domain_id,
+                }
+            )
+
+        event_vo = event_mgr.start_broadcast_job(event_vo, chunk_size)
+
+        for _ in range(config.get_global("NOTIFICATION_BROADCAST_PARALLEL", 4)):
+            self._push_dispatch_task(
+                "dispatch_domain_chunk",
+                {"event_id": event_vo.event_id, "domain_id": domain_id},
+            )
+
+    def dispatch_domain_chunk(self, event_id, domain_id, page=None):
+        """Dispatch a page of a broadcast job
+
+        Without page, the next page is claimed from the user cursor of the job
+        and another task is pushed afterwards. With page, only the users in the
+        range of the given page are resumed from the last user recorded as dispatched.
+        """
+        event_mgr: NotificationEventManager = self.locator.get_manager(
+            NotificationEventManager
+        )
         identity_mgr: IdentityManager = self.locator.get_manager(IdentityManager)
-        users = identity_mgr.get_all_users_in_domain(domain_id)
-
-        for user in users:
-            user_channel_params = {
-                "notification_type": params.get("notification_type", "INFO"),
-                "notification_level": params.get("notification_level", "ALL"),
-                "topic": params["topic"],
-                "message": params["message"],
-                "resource_type": "identity.User",
-                "resource_id": user["user_id"],
-                "domain_id": domain_id,
-            }
 
-            self.dispatch_user_channel(user_channel_params)
+        event_vo = event_mgr.get_notification_event(event_id, domain_id)
+
+        if event_vo.state != "IN_PROGRESS":
+            return
+
+        is_resumed = page is not None
+        if is_resumed:
+            if page in event_vo.completed_pages:
+                return
+
+            start_user_id, last_user_id = event_vo.page_ranges[str(page)]
+
+            # Users up to the cursor were dispatched before the page was interrupted
+            response = identity_mgr.list_user_page(
+                event_vo.resource_id,
+                event_vo.chunk_size,
+                event_vo.page_cursors.get(str(page)) or start_user_id,
+            )
+            user_ids = [
+                user["user_id"]
+                for user in response.get("results", [])
+                if user["user_id"] <= last_user_id
+            ]
+        else:
+            claimed_page = self._claim_broadcast_page(event_vo, event_mgr, identity_mgr)
+
+            if claimed_page is None:
+                if event_mgr.finish_broadcast_job(event_vo):
+                    _LOGGER.info(
+                        f"[dispatch_domain_chunk] Broadcast is done: {event_id}"
+                    )
+                return
+
+            page, user_ids = claimed_page
+
+        _LOGGER.debug(
+            f"[dispatch_domain_chunk] Event ID: {event_id} | page: {page} | users: {len(user_ids)}"
+        )
+
+        checkpoint_size = config.get_global(
+            "NOTIFICATION_BROADCAST_CHECKPOINT_SIZE", 20
+        )
+        event_params = self._make_event_params(event_vo)
+
+        for idx in range(0, len(user_ids), checkpoint_size):
+            checkpoint_user_ids = user_ids[idx : idx + checkpoint_size]
+            self.dispatch_user_channels(event_params, checkpoint_user_ids)
+            self.flush_notifications()
+            self.flush_queue()
+
+            if idx + checkpoint_size < len(user_ids):
+                event_mgr.checkpoint_broadcast_page(
+                    event_vo, page, checkpoint_user_ids[-1]
+                )
+
+        event_mgr.complete_broadcast_page(event_vo, page)
+
+        if not is_resumed:
+            self._push_dispatch_task(
+                "dispatch_domain_chunk",
+                {"event_id": event_id, "domain_id": domain_id},
+            )
+
+        if event_mgr.finish_broadcast_job(event_vo):
+            _LOGGER.info(f"[dispatch_domain_chunk] Broadcast is done: {event_id}")
+
+    @staticmethod
+    def _claim_broadcast_page(
+        event_vo: NotificationEvent,
+        event_mgr: NotificationEventManager,
+        identity_mgr: IdentityManager,
+    ) -> Union[tuple, None]:
+        """Claim the next page of users after the user cursor of a broadcast job
+
+        Returns:
+            claimed_page (tuple): (page, user_ids). None if there is no more page.
+        """
+
+        while True:
+            page = event_vo.next_page
+
+            if event_vo.state != "IN_PROGRESS" or (
+                event_vo.total_pages is not None and page >= event_vo.total_pages
+            ):
+                return None
+
+            response = identity_mgr.list_user_page(
+                event_vo.resource_id, event_vo.chunk_size, event_vo.last_user_id
+            )
+            user_ids = [user["user_id"] for user in response.get("results", [])]
+
+            if not user_ids:
+                event_mgr.set_broadcast_total_pages(event_vo, page)
+                return None
+
+            if event_mgr.claim_broadcast_page(event_vo, page, user_ids[-1]):
+                if len(user_ids) < event_vo.chunk_size:
+                    event_mgr.set_broadcast_total_pages(event_vo, page + 1)
+
+                return page, user_ids
+
+            # Another task claimed the page in the meantime
+            event_vo.reload()
+
+    @transaction()
+    def resume_broadcast_jobs(self, params):
+        """Resume stale broadcast jobs from their recorded progress
+
+        Completed pages are skipped and interrupted pages are resumed
+        after the last user recorded as dispatched.
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None
+        """
+        event_mgr: NotificationEventManager = self.locator.get_manager(
+            NotificationEventManager
+        )
+
+        stale_timeout = config.get_global("NOTIFICATION_BROADCAST_STALE_TIMEOUT", 600)
+        stale_time = datetime.datetime.utcnow() - datetime.timedelta(
+            seconds=stale_timeout
+        )
+
+        query = {
+            "filter": [
+                {"k": "resource_type", "v": "identity.Domain", "o": "eq"},
+                {"k": "state", "v": "IN_PROGRESS", "o": "eq"},
+                {
+                    "k": "updated_at",
+                    "v": utils.datetime_to_iso8601(stale_time),
+                    "o": "datetime_lt",
+                },
+            ]
+        }
+        event_vos, total_count = event_mgr.list_notification_events(query)
+
+        _LOGGER.debug(f"[resume_broadcast_jobs] Stale Job Count: {total_count}")
+
+        for event_vo in event_vos:
+            if event_mgr.finish_broadcast_job(event_vo):
+                continue
+
+            claimed_pages = event_vo.next_page
+            if event_vo.total_pages is not None:
+                claimed_pages = min(claimed_pages, event_vo.total_pages)
+
+            completed_pages = set(event_vo.completed_pages)
+            missing_pages = [
+                page for page in range(claimed_pages) if page not in completed_pages
+            ]
+
+            _LOGGER.info(
+                f"[resume_broadcast_jobs] Resume broadcast: {event_vo.event_id} "
+                f"(missing pages: {len(missing_pages)})"
+            )
+
+            event_mgr.touch_notification_event(event_vo)
+
+            for page in missing_pages:
+                self._push_dispatch_task(
+                    "dispatch_domain_chunk",
+                    {
+                        "event_id": event_vo.event_id,
+                        "domain_id": event_vo.domain_id,
+                        "page": page,
+                    },
+                )
+
+            if event_vo.total_pages is None or claimed_pages < event_vo.total_pages:
+                for _ in range(config.get_global("NOTIFICATION_BROADCAST_PARALLEL", 4)):
+                    self._push_dispatch_task(
+                        "dispatch_domain_chunk",
+                        {
+                            "event_id": event_vo.event_id,
+                            "domain_id": event_vo.domain_id,
+                        },
+                    )
 
     def dispatch_project_channel(self, params: dict):
         project_id = params["resource_id"]
         _LOGGER.debug(f"[Dispatch Project Channel] Project ID: {project_id}")
-        protocol_mgr: ProtocolManager = self.locator.get_manager(ProtocolManager)
         project_ch_mgr: ProjectChannelManager = self.locator.get_manager(
             ProjectChannelManager
         )
@@ -118,94 +516,69 @@ class NotificationService(BaseService):
         notification_level = params.get("notification_level", "ALL")
         message = params["message"]
 
-        prj_ch_vos, prj_ch_total_count = project_ch_mgr.list_project_channels(
-            {
-                "filter": [
-                    {"k": "project_id", "v": project_id, "o": "eq"},
-                    {"k": "domain_id", "v": domain_id, "o": "eq"},
-                ]
-            }
-        )
+        # Users of "*", resolved once for all channels of the project
+        project_users = None
+        protocol_vos = {}
+        week_hour = get_week_hour(datetime.datetime.utcnow())
 
-        for prj_ch_vo in prj_ch_vos:
-            if prj_ch_vo.state == "ENABLED":
-                protocol_vo = protocol_mgr.get_protocol(
-                    prj_ch_vo.protocol_id, domain_id
-                )
+        if config.get_global("DELIVERY_PLAN_CACHE", True):
+            prj_ch_vos = project_ch_mgr.get_delivery_plans([project_id], domain_id).get(
+                project_id, []
+            )
+        else:
+            prj_ch_vos = project_ch_mgr.filter_project_channel_records(
+                week_hour=week_hour,
+                topic=topic,
+                project_id=project_id,
+                domain_id=domain_id,
+            )
 
-                dispatch_subscribe = self.check_subscribe_for_dispatch(
-                    prj_ch_vo.is_subscribe, prj_ch_vo.subscriptions, topic
-                )
-                dispatch_schedule = self.check_schedule_for_dispatch(
-                    prj_ch_vo.is_scheduled, prj_ch_vo.schedule
-                )
-                dispatch_notification_level = (
-                    self.check_notification_level_for_dispatch(
-                        notification_level, prj_ch_vo.notification_level
-                    )
-                )
+        dispatch_mask = evaluate_channel_eligibility(
+            prj_ch_vos, topic, week_hour, notification_level
+        )
 
-                _LOGGER.debug(
-                    f"[Notification] subscribe: {dispatch_subscribe} | schedule: {dispatch_schedule} "
-                    f"| notification_level: {dispatch_notification_level}"
+        for prj_ch_vo, dispatch in zip(prj_ch_vos, dispatch_mask.tolist()):
+            if prj_ch_vo.state == "ENABLED":
+                protocol_snapshot = self._get_protocol_snapshot(
+                    prj_ch_vo, protocol_vos, domain_id
                 )
 
-                if (
-                    dispatch_subscribe
-                    and dispatch_schedule
-                    and dispatch_notification_level
-                ):
+                if dispatch:
                     _LOGGER.info(
                         f"[Notification] Dispatch Notification to project: {project_id}"
                     )
 
-                    if protocol_vo.protocol_type == "INTERNAL":
+                    if protocol_snapshot["protocol_type"] == "INTERNAL":
                         internal_project_channel_data = prj_ch_vo.data
-                        users = []
+                        users = set()
                         for user_id in internal_project_channel_data.get("users", []):
                             if user_id == "*":
-                                project_info = identity_mgr.get_project(
-                                    project_id, domain_id
-                                )
-                                project_type = project_info["project_type"]
-                                project_users = project_info.get("users", [])
-                                if project_type == "PRIVATE":
-                                    users += project_users
-                                else:
-                                    response = identity_mgr.get_workspace_users(
-                                        project_id, domain_id
+                                if project_users is None:
+                                    project_users = (
+                                        identity_mgr.get_cached_project_users(
+                                            project_id, domain_id
+                                        )
                                     )
-                                    workspace_users = response.get("results", [])
-                                    users += workspace_users
+                                users |= project_users
                             else:
-                                users.append(user_id)
-
-                        users = list(set(users))
-                        for user_id in users:
-                            params.update(
-                                {
-                                    "resource_type": "identity.User",
-                                    "resource_id": user_id,
-                                }
-                            )
-
-                            _LOGGER.debug(
-                                f"[Forward to User Channel] User ID: {user_id}"
-                            )
-                            self.dispatch_user_channel(params)
-                    elif protocol_vo.protocol_type == "EXTERNAL":
+                                users.add(user_id)
+
+                        users = sorted(users)
+                        _LOGGER.debug(f"[Forward to User Channel] User IDs: {users}")
+                        self.dispatch_user_channels(params, users)
+                    elif protocol_snapshot["state"] == "DISABLED":
                         _LOGGER.info(
-                            f"[Notification] Dispatch Notification to project: {project_id}"
+                            f"[Notification] Protocol is disabled. skip notification: {prj_ch_vo.protocol_id}"
                         )
-                        channel_data = self.get_channel_data(
-                            prj_ch_vo, protocol_vo, domain_id
+                    elif protocol_snapshot["protocol_type"] == "EXTERNAL":
+                        _LOGGER.info(
+                            f"[Notification] Dispatch Notification to project: {project_id}"
                         )
-                        secret_data = self.get_secret_data(protocol_vo, domain_id)
-
                         self.push_queue(
-                            protocol_vo.protocol_id,
-                            channel_data,
-                            secret_data,
+                            self._get_protocol_vo(
+                                prj_ch_vo.protocol_id, protocol_vos, domain_id
+                            ),
+                            prj_ch_vo,
                             notification_type,
                             message,
                             domain_id,
@@ -220,70 +593,164 @@ class NotificationService(BaseService):
                 )
 
     def dispatch_user_channel(self, params):
-        user_id = params["resource_id"]
-        _LOGGER.debug(f"[Dispatch User Channel] User ID: {user_id}")
+        self.dispatch_user_channels(params, [params["resource_id"]])
 
-        protocol_mgr: ProtocolManager = self.locator.get_manager(ProtocolManager)
+    def dispatch_user_channels(self, params: dict, user_ids: list):
+        """Dispatch a notification to the channels of multiple users
+
+        User channels are fetched per USER_CHANNEL_LOOKUP_CHUNK_SIZE users from the delivery
+        plan cache, which loads the missing users with one query, and grouped by user_id.
+        """
         user_ch_mgr: UserChannelManager = self.locator.get_manager(UserChannelManager)
 
         domain_id = params["domain_id"]
-        topic = params["topic"]
+        chunk_size = config.get_global("USER_CHANNEL_LOOKUP_CHUNK_SIZE", 500)
+        use_delivery_plan = config.get_global("DELIVERY_PLAN_CACHE", True)
+        protocol_vos = {}
+        week_hour = get_week_hour(datetime.datetime.utcnow())
+
+        for idx in range(0, len(user_ids), chunk_size):
+            chunk_user_ids = user_ids[idx : idx + chunk_size]
+
+            if use_delivery_plan:
+                user_plans = user_ch_mgr.get_delivery_plans(chunk_user_ids, domain_id)
+                user_ch_vos = [
+                    user_ch_vo
+                    for user_id in chunk_user_ids
+                    for user_ch_vo in user_plans.get(user_id, [])
+                ]
+            else:
+                user_ch_vos = user_ch_mgr.filter_user_channel_records(
+                    week_hour=week_hour,
+                    topic=params["topic"],
+                    user_id=chunk_user_ids,
+                    state="ENABLED",
+                    domain_id=domain_id,
+                )
 
-        notification_type = params.get("notification_type", "INFO")
-        message = params["message"]
+            dispatch_mask = evaluate_channel_eligibility(
+                user_ch_vos, params["topic"], week_hour
+            )
 
-        user_ch_vos, user_ch_total_count = user_ch_mgr.list_user_channels(
-            {
-                "filter": [
-                    {"k": "user_id", "v": user_id, "o": "eq"},
-                    {"k": "domain_id", "v": domain_id, "o": "eq"},
-                ]
-            }
+            user_channels = {}
+            for user_ch_vo, dispatch in zip(user_ch_vos, dispatch_mask.tolist()):
+                user_channels.setdefault(user_ch_vo.user_id, []).append(
+                    (user_ch_vo, dispatch)
+                )
+
+            if self.queue_payload == "INLINE":
+                self._prefetch_user_secret_data(user_ch_vos, protocol_vos, domain_id)
+
+            for user_id in chunk_user_ids:
+                self._dispatch_user_channel_vos(
+                    {
+                        **params,
+                        "resource_type": "identity.User",
+                        "resource_id": user_id,
+                    },
+                    user_channels.get(user_id, []),
+                    protocol_vos,
+                )
+
+    def _get_protocol_vo(
+        self, protocol_id: str, protocol_vos: dict, domain_id: str
+    ) -> Protocol:
+        if protocol_id not in protocol_vos:
+            protocol_mgr: ProtocolManager = self.locator.get_manager(ProtocolManager)
+            protocol_vos[protocol_id] = protocol_mgr.get_cached_protocol(
+                protocol_id, domain_id
+            )
+
+        return protocol_vos[protocol_id]
+
+    def _get_protocol_snapshot(
+        self, channel_vo, protocol_vos: dict, domain_id: str
+    ) -> dict:
+        """Routing fields of the protocol of a channel
+
+        Channels created before protocol snapshots fall back to the protocol.
+        """
+
+        if protocol_snapshot := channel_vo.protocol_snapshot:
+            # Channel records keep the raw snapshot
+            if isinstance(protocol_snapshot, dict):
+                return protocol_snapshot
+
+            return protocol_snapshot.to_dict()
+
+        return ProtocolManager.make_protocol_snapshot(
+            self._get_protocol_vo(channel_vo.protocol_id, protocol_vos, domain_id)
         )
 
+    def _prefetch_user_secret_data(
+        self, user_ch_vos: list, protocol_vos: dict, domain_id: str
+    ) -> None:
+        """Resolve the user secrets of SECRET type channels at once into the secret cache"""
+
+        user_secret_mgr: UserSecretManager = self.locator.get_manager(UserSecretManager)
+
+        user_secret_ids = []
         for user_ch_vo in user_ch_vos:
-            if user_ch_vo.state == "ENABLED":
-                protocol_vo = protocol_mgr.get_protocol(
-                    user_ch_vo.protocol_id, domain_id
-                )
+            protocol_snapshot = self._get_protocol_snapshot(
+                user_ch_vo, protocol_vos, domain_id
+            )
 
-                dispatch_subscribe = self.check_subscribe_for_dispatch(
-                    user_ch_vo.is_subscribe, user_ch_vo.subscriptions, topic
-                )
-                dispatch_schedule = self.check_schedule_for_dispatch(
-                    user_ch_vo.is_scheduled, user_ch_vo.schedule
-                )
+            if protocol_snapshot["data_type"] == "SECRET":
+                if user_ch_vo.user_secret_id:
+                    user_secret_ids.append(user_ch_vo.user_secret_id)
 
-                _LOGGER.debug(
-                    f"[Notification] subscribe: {dispatch_subscribe} | schedule: {dispatch_schedule}"
-                )
+        if len(user_secret_ids) > 1:
+            user_secret_mgr.get_cached_user_secret_data_many(user_secret_ids, domain_id)
 
-                if dispatch_subscribe and dispatch_schedule:
-                    _LOGGER.info(
-                        f"[Notification] Dispatch Notification to user: {user_id}"
-                    )
-                    channel_data = self.get_user_channel_data(
-                        user_ch_vo, protocol_vo, domain_id
-                    )
-                    secret_data = self.get_secret_data(protocol_vo, domain_id)
+    def _dispatch_user_channel_vos(
+        self, params: dict, user_channels: list, protocol_vos: dict
+    ):
+        """Dispatch a notification to the channels of a user
 
-                    self.push_queue(
-                        protocol_vo.protocol_id,
-                        channel_data,
-                        secret_data,
-                        notification_type,
-                        message,
-                        domain_id,
-                    )
-                else:
-                    _LOGGER.info(f"[Notification] Skip Notification to user: {user_id}")
-            else:
+        user_channels is a list of (user channel, dispatch) pairs,
+        where dispatch is the result of evaluate_channel_eligibility.
+        """
+
+        user_id = params["resource_id"]
+        _LOGGER.debug(f"[Dispatch User Channel] User ID: {user_id}")
+
+        domain_id = params["domain_id"]
+
+        notification_type = params.get("notification_type", "INFO")
+        message = params["message"]
+
+        for user_ch_vo, dispatch in user_channels:
+            protocol_snapshot = self._get_protocol_snapshot(
+                user_ch_vo, protocol_vos, domain_id
+            )
+
+            if protocol_snapshot["state"] == "DISABLED":
                 _LOGGER.info(
-                    f"[Notification] User Channel is disabled: {user_ch_vo.user_channel_id}"
+                    f"[Notification] Protocol is disabled. skip notification: {user_ch_vo.protocol_id}"
                 )
+                continue
+
+            if dispatch:
+                _LOGGER.info(f"[Notification] Dispatch Notification to user: {user_id}")
+                self.push_queue(
+                    self._get_protocol_vo(
+                        user_ch_vo.protocol_id, protocol_vos, domain_id
+                    ),
+                    user_ch_vo,
+                    notification_type,
+                    message,
+                    domain_id,
+                )
+            else:
+                _LOGGER.info(f"[Notification] Skip Notification to user: {user_id}")
 
         params.update({"user_id": user_id})
-        self.notification_mgr.create_notification(params)
+        self.notification_buffer.append(params)
+
+        if len(self.notification_buffer) >= config.get_global(
+            "NOTIFICATION_INSERT_CHUNK_SIZE", 1000
+        ):
+            self.flush_notifications()
 
     @transaction()
     @check_required(["protocol_id", "data", "message", "domain_id"])
@@ -310,17 +777,10 @@ class NotificationService(BaseService):
         message = params.get("message", {})
 
         protocol_mgr: ProtocolManager = self.locator.get_manager("ProtocolManager")
-        protocol_vo = protocol_mgr.get_protocol(protocol_id, domain_id)
-        secret_data = self.get_secret_data(protocol_vo, domain_id)
+        protocol_vo = protocol_mgr.get_cached_protocol(protocol_id, domain_id)
 
-        self.push_queue(
-            protocol_vo.protocol_id,
-            data,
-            secret_data,
-            notification_type,
-            message,
-            domain_id,
-        )
+        self.push_queue(protocol_vo, data, notification_type, message, domain_id)
+        self.flush_queue()
 
     @transaction(permission="notification:Notification.write", role_types=["USER"])
     @check_required(["notifications", "domain_id"])
@@ -445,46 +905,157 @@ class NotificationService(BaseService):
 
     def push_queue(
         self,
-        protocol_id,
-        channel_data,
-        secret_data,
-        notification_type,
-        message,
-        domain_id,
+        protocol_vo: Protocol,
+        channel,
+        notification_type: str,
+        message: dict,
+        domain_id: str,
     ):
-        task = {
-            "name": "dispatch_notification",
-            "version": "v1",
-            "executionEngine": "BaseWorker",
-            "stages": [
-                {
-                    "locator": "SERVICE",
-                    "name": "NotificationService",
-                    "metadata": self.transaction.meta,
-                    "method": "dispatch_notification",
-                    "params": {
-                        "protocol_id": protocol_id,
-                        "channel_data": channel_data,
-                        "secret_data": secret_data,
-                        "notification_type": notification_type,
-                        "message": message,
-                        "domain_id": domain_id,
-                    },
-                }
-            ],
-        }
+        """Queue a notification for a channel
 
-        _LOGGER.debug(f"[push_queue] task: {task}")
-        queue.put("notification_q", utils.dump_json(task))
+        Args:
+            protocol_vo (Protocol)
+            channel: ProjectChannel | UserChannel | channel record | dict (channel data of push API)
+            notification_type (str)
+            message (dict)
+            domain_id (str)
+        """
+        batch_size = config.get_global("DISPATCH_BATCH_SIZE", 1)
+        batch_key = (protocol_vo.protocol_id, notification_type, domain_id)
+        dispatch_batch = self.dispatch_batches.get(batch_key)
+
+        if dispatch_batch and dispatch_batch["message"] is not message:
+            self._flush_dispatch_batch(batch_key)
+            dispatch_batch = None
+
+        if dispatch_batch is None:
+            dispatch_batch = self.dispatch_batches[batch_key] = {
+                "message": message,
+                "channels": [],
+                "params": self._make_dispatch_params(
+                    protocol_vo, notification_type, message, domain_id
+                ),
+            }
 
-    @transaction()
-    def delete_old_notifications(self, params):
-        """Delete old notifications
+        dispatch_batch["channels"].append(
+            self._make_channel_payload(channel, protocol_vo, domain_id)
+        )
 
-        Args:
-            params (dict): {}
+        if len(dispatch_batch["channels"]) >= batch_size:
+            self._flush_dispatch_batch(batch_key)
 
-        Returns:
+    def flush_notifications(self):
+        if self.notification_buffer:
+            notification_buffer = self.notification_buffer
+            self.notification_buffer = []
+            self.notification_mgr.create_notifications(notification_buffer)
+
+    def flush_queue(self):
+        for batch_key in list(self.dispatch_batches.keys()):
+            self._flush_dispatch_batch(batch_key)
+
+    def _flush_dispatch_batch(self, batch_key):
+        dispatch_batch = self.dispatch_batches.pop(batch_key)
+        channels = dispatch_batch["channels"]
+        params = dispatch_batch["params"]
+
+        if self.queue_payload == "REFERENCE":
+            channel_key, channels_key = "channel_ref", "channel_refs"
+        else:
+            channel_key, channels_key = "channel_data", "channels"
+
+        if len(channels) == 1:
+            params[channel_key] = channels[0]
+            self._push_dispatch_task("dispatch_notification", params)
+        else:
+            params[channels_key] = channels
+            self._push_dispatch_task("dispatch_notification_batch", params)
+
+    def _make_dispatch_params(
+        self,
+        protocol_vo: Protocol,
+        notification_type: str,
+        message: dict,
+        domain_id: str,
+    ) -> dict:
+        params = {
+            "protocol_id": protocol_vo.protocol_id,
+            "notification_type": notification_type,
+            "domain_id": domain_id,
+        }
+
+        if self.queue_payload == "REFERENCE":
+            params["message_id"] = self._put_queue_message(message, domain_id)
+        else:
+            params["secret_data"] = self.get_secret_data(protocol_vo, domain_id)
+            params["message"] = message
+
+        return params
+
+    def _make_channel_payload(self, channel, protocol_vo: Protocol, domain_id: str):
+        if isinstance(channel, (ProjectChannel, ProjectChannelRecord)):
+            if self.queue_payload == "REFERENCE":
+                return {
+                    "project_channel_id": channel.project_channel_id,
+                    "workspace_id": channel.workspace_id,
+                }
+            return self.get_channel_data(channel, protocol_vo, domain_id)
+
+        elif isinstance(channel, (UserChannel, UserChannelRecord)):
+            if self.queue_payload == "REFERENCE":
+                return {
+                    "user_channel_id": channel.user_channel_id,
+                    "user_id": channel.user_id,
+                }
+            return self.get_user_channel_data(channel, protocol_vo, domain_id)
+
+        else:
+            if self.queue_payload == "REFERENCE":
+                return {"channel_data": channel}
+            return channel
+
+    def _put_queue_message(self, message: dict, domain_id: str) -> str:
+        for message_id, queue_message in self.queue_messages.items():
+            if queue_message is message:
+                return message_id
+
+        message_id = utils.generate_id("message")
+        cache.set(
+            f"queue-message:{domain_id}:{message_id}",
+            message,
+            expire=config.get_global("NOTIFICATION_MESSAGE_TTL", 3600),
+        )
+        self.queue_messages[message_id] = message
+
+        return message_id
+
+    def _push_dispatch_task(self, method, params):
+        task = {
+            "name": method,
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": [
+                {
+                    "locator": "SERVICE",
+                    "name": "NotificationService",
+                    "metadata": self.metadata,
+                    "method": method,
+                    "params": params,
+                }
+            ],
+        }
+
+        _LOGGER.debug(f"[push_queue] task: {task}")
+        queue.put("notification_q", utils.dump_json(task))
+
+    @transaction()
+    def delete_old_notifications(self, params):
+        """Delete old notifications
+
+        Args:
+            params (dict): {}
+
+        Returns:
             None
         """
         now = datetime.datetime.now()
@@ -506,6 +1077,99 @@ class NotificationService(BaseService):
         )
         notification_vos.delete()
 
+        event_mgr: NotificationEventManager = self.locator.get_manager(
+            NotificationEventManager
+        )
+        event_vos, event_total_count = event_mgr.list_notification_events(query)
+
+        _LOGGER.debug(
+            f"[delete_old_notifications] Old Notification Event Count: {event_total_count}"
+        )
+        event_vos.delete()
+
+    @transaction()
+    def reconcile_quota(self, params):
+        """Reconcile quota counters with notification usages
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None
+        """
+        quota_mgr: QuotaManager = self.locator.get_manager(QuotaManager)
+        protocol_mgr: ProtocolManager = self.locator.get_manager(ProtocolManager)
+        noti_usage_mgr: NotificationUsageManager = self.locator.get_manager(
+            NotificationUsageManager
+        )
+
+        plugin_ids = [
+            plugin_id
+            for plugin_id in config.get_global("DEFAULT_QUOTA", {})
+            if quota_mgr.has_quota_limit(plugin_id)
+        ]
+
+        if not plugin_ids:
+            return
+
+        month, date = self.get_month_date()
+        protocol_vos, total_count = protocol_mgr.list_protocols(
+            {"filter": [{"k": "plugin_info.plugin_id", "v": plugin_ids, "o": "in"}]}
+        )
+
+        _LOGGER.debug(f"[reconcile_quota] Protocol Count: {total_count}")
+
+        for protocol_vo in protocol_vos:
+            noti_usage_vos, _ = noti_usage_mgr.list_notification_usages(
+                {
+                    "filter": [
+                        {"k": "protocol_id", "v": protocol_vo.protocol_id, "o": "eq"},
+                        {"k": "usage_month", "v": month, "o": "eq"},
+                        {"k": "domain_id", "v": protocol_vo.domain_id, "o": "eq"},
+                    ]
+                }
+            )
+
+            month_count = sum(noti_usage_vo.count for noti_usage_vo in noti_usage_vos)
+            day_count = sum(
+                noti_usage_vo.count
+                for noti_usage_vo in noti_usage_vos
+                if noti_usage_vo.usage_date == date
+            )
+
+            quota_mgr.reconcile_quota(
+                protocol_vo.protocol_id,
+                month,
+                date,
+                protocol_vo.domain_id,
+                day_count,
+                month_count,
+            )
+
+    @transaction()
+    def backfill_schedule_week_hours(self, params):
+        """Set week hour masks of channel schedules saved before week hour masks
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None
+        """
+        project_ch_mgr: ProjectChannelManager = self.locator.get_manager(
+            ProjectChannelManager
+        )
+        user_ch_mgr: UserChannelManager = self.locator.get_manager(UserChannelManager)
+
+        project_channel_count = project_ch_mgr.backfill_schedule_week_hours()
+        user_channel_count = user_ch_mgr.backfill_schedule_week_hours()
+
+        if project_channel_count or user_channel_count:
+            _LOGGER.info(
+                f"[backfill_schedule_week_hours] project channels: {project_channel_count} "
+                f"| user channels: {user_channel_count}"
+            )
+
     def get_channel_data(self, channel_vo, protocol_vo, domain_id):
         secret_mgr: SecretManager = self.locator.get_manager(SecretManager)
 
@@ -516,7 +1180,9 @@ class NotificationService(BaseService):
         if plugin_metadata.get("data_type") == "PLAIN_TEXT":
             channel_data = channel_vo.data
         elif plugin_metadata.get("data_type") == "SECRET":
-            channel_data = secret_mgr.get_secret_data(channel_vo.secret_id, domain_id)
+            channel_data = secret_mgr.get_cached_secret_data(
+                channel_vo.secret_id, domain_id
+            )
 
         return channel_data
 
@@ -534,7 +1200,7 @@ class NotificationService(BaseService):
         if plugin_metadata.get("data_type") == "PLAIN_TEXT":
             channel_data = user_channel_vo.data
         elif plugin_metadata.get("data_type") == "SECRET":
-            channel_data = user_secret_mgr.get_user_secret_data(
+            channel_data = user_secret_mgr.get_cached_user_secret_data(
                 user_channel_vo.user_secret_id, domain_id
             )
 
@@ -547,45 +1213,51 @@ class NotificationService(BaseService):
         plugin_info = protocol_vo.plugin_info.to_dict()
 
         if secret_id := plugin_info.get("secret_id"):
-            secret_data = secret_mgr.get_secret_data(secret_id, domain_id)
+            secret_data = secret_mgr.get_cached_secret_data(secret_id, domain_id)
 
         return secret_data
 
     def dispatch_notification(
         self,
         protocol_id,
-        channel_data,
-        secret_data,
         notification_type,
-        message,
         domain_id,
+        channel_data=None,
+        secret_data=None,
+        message=None,
+        channel_ref=None,
+        message_id=None,
     ):
         protocol_mgr: ProtocolManager = self.locator.get_manager(ProtocolManager)
         plugin_mgr: PluginManager = self.locator.get_manager(PluginManager)
 
-        protocol_vo = protocol_mgr.get_protocol(protocol_id, domain_id)
+        protocol_vo = protocol_mgr.get_cached_protocol(protocol_id, domain_id)
 
         if protocol_vo.state == "ENABLED":
             plugin_info = protocol_vo.plugin_info.to_dict()
             options = plugin_info.get("options", {})
 
+            try:
+                if message_id:
+                    message = self._get_queue_message(message_id, domain_id)
+
+                if channel_ref:
+                    channel_data = self._get_channel_data_by_ref(
+                        channel_ref, protocol_vo, domain_id
+                    )
+
+                if secret_data is None:
+                    secret_data = self.get_secret_data(protocol_vo, domain_id)
+            except Exception as e:
+                _LOGGER.error(f"[Notification] Failed to resolve queue payload: {e}")
+                return
+
             _LOGGER.debug(
                 f'[Plugin Initialize] plugin_id: {plugin_info["plugin_id"]} | version: {plugin_info["version"]} '
                 f"| domain_id: {domain_id}"
             )
             try:
-                endpoint_info = plugin_mgr.initialize(plugin_info, domain_id)
-                plugin_metadata = plugin_mgr.init_plugin(options, domain_id)
-                plugin_info["metadata"] = plugin_metadata
-
-                if version := endpoint_info.get("updated_version"):
-                    plugin_info["version"] = version
-
-                protocol_mgr = self.locator.get_manager(ProtocolManager)
-                protocol_mgr.update_protocol_by_vo(
-                    {"plugin_info": plugin_info}, protocol_vo
-                )
-
+                self._init_plugin_session(protocol_vo, plugin_mgr, domain_id)
             except Exception as e:
                 _LOGGER.error(f"[Notification] Plugin Error: {e}")
 
@@ -614,82 +1286,485 @@ class NotificationService(BaseService):
         plugin_mgr,
         domain_id,
     ):
-        month, date = self.get_month_date()
-        noti_usage_vo, usage_month, usage_date = self.get_notification_usage(
-            protocol_vo, month, date
-        )
+        if self._acquire_quota(protocol_vo) == 0:
+            _LOGGER.error(
+                f"[Notification] Quota is exceeded. skip notification: {protocol_vo.protocol_id}"
+            )
+            self.increment_fail_count(protocol_vo)
+            return
 
         try:
-            plugin_mgr.dispatch_notification(
+            try:
+                plugin_mgr.dispatch_notification(
+                    secret_data,
+                    channel_data,
+                    notification_type,
+                    message,
+                    options,
+                    domain_id,
+                )
+            except Exception as e:
+                if not plugin_mgr.is_plugin_session_error(e):
+                    raise
+
+                _LOGGER.warning(
+                    f"[Notification] Retry with refreshed plugin session: {e}"
+                )
+                self._init_plugin_session(
+                    protocol_vo, plugin_mgr, domain_id, refresh=True
+                )
+                plugin_mgr.dispatch_notification(
+                    secret_data,
+                    channel_data,
+                    notification_type,
+                    message,
+                    options,
+                    domain_id,
+                )
+
+            self.increment_usage(protocol_vo)
+        except Exception as e:
+            _LOGGER.error(f"[Notification] Failed to dispatch notification: {e}")
+            if plugin_mgr.is_plugin_session_error(e):
+                plugin_mgr.delete_plugin_session(
+                    protocol_vo.plugin_info.to_dict(), domain_id
+                )
+            self._release_quota(protocol_vo)
+            self.increment_fail_count(protocol_vo)
+
+    def dispatch_notification_batch(
+        self,
+        protocol_id,
+        notification_type,
+        domain_id,
+        channels=None,
+        secret_data=None,
+        message=None,
+        channel_refs=None,
+        message_id=None,
+    ):
+        protocol_mgr: ProtocolManager = self.locator.get_manager(ProtocolManager)
+        plugin_mgr: PluginManager = self.locator.get_manager(PluginManager)
+
+        protocol_vo = protocol_mgr.get_cached_protocol(protocol_id, domain_id)
+
+        if protocol_vo.state == "ENABLED":
+            try:
+                if message_id:
+                    message = self._get_queue_message(message_id, domain_id)
+
+                if secret_data is None:
+                    secret_data = self.get_secret_data(protocol_vo, domain_id)
+            except Exception as e:
+                _LOGGER.error(f"[Notification] Failed to resolve queue payload: {e}")
+                return
+
+            if channel_refs:
+                channels = self._resolve_channel_refs(
+                    channel_refs, protocol_vo, domain_id
+                )
+
+            if not channels:
+                return
+            _LOGGER.debug(
+                f"[dispatch_notification_batch] protocol_id: {protocol_id} | channels: {len(channels)}"
+            )
+            try:
+                self._init_plugin_session(protocol_vo, plugin_mgr, domain_id)
+            except Exception as e:
+                _LOGGER.error(f"[Notification] Plugin Error: {e}")
+
+            self._dispatch_notification_batch(
+                protocol_vo,
                 secret_data,
-                channel_data,
+                channels,
                 notification_type,
                 message,
-                options,
+                plugin_mgr,
                 domain_id,
             )
-            self.increment_usage(noti_usage_vo)
+
+        else:
+            _LOGGER.info("[Notification] Protocol is disabled. skip notification")
+
+    def _dispatch_notification_batch(
+        self,
+        protocol_vo,
+        secret_data,
+        channels,
+        notification_type,
+        message,
+        plugin_mgr,
+        domain_id,
+    ):
+        if not (channels := self._acquire_batch_quota(protocol_vo, channels)):
+            return
+
+        plugin_info = protocol_vo.plugin_info.to_dict()
+        results = plugin_mgr.dispatch_notification_batch(
+            secret_data,
+            channels,
+            notification_type,
+            message,
+            plugin_info.get("options", {}),
+            plugin_info.get("metadata", {}),
+            domain_id,
+        )
+
+        self._complete_dispatch_batch(
+            protocol_vo,
+            secret_data,
+            channels,
+            notification_type,
+            message,
+            plugin_mgr,
+            domain_id,
+            results,
+        )
+
+    def prepare_dispatch(self, method: str, params: dict) -> Union[dict, None]:
+        """Resolve a dispatch task up to the plugin call (asynchronous dispatch engine)
+
+        Args:
+            method (str): 'dispatch_notification | dispatch_notification_batch'
+            params (dict): params of the dispatch task
+
+        Returns:
+            dispatch (dict): plugin call of the channels granted by the quota,
+                to be completed with complete_dispatch. None if there is nothing to dispatch.
+        """
+
+        protocol_mgr: ProtocolManager = self.locator.get_manager(ProtocolManager)
+        plugin_mgr: PluginManager = self.locator.get_manager(PluginManager)
+
+        domain_id = params["domain_id"]
+        protocol_vo = protocol_mgr.get_cached_protocol(params["protocol_id"], domain_id)
+
+        if protocol_vo.state != "ENABLED":
+            _LOGGER.info("[Notification] Protocol is disabled. skip notification")
+            return None
+
+        message = params.get("message")
+        secret_data = params.get("secret_data")
+
+        try:
+            if message_id := params.get("message_id"):
+                message = self._get_queue_message(message_id, domain_id)
+
+            if secret_data is None:
+                secret_data = self.get_secret_data(protocol_vo, domain_id)
+
+            if method == "dispatch_notification_batch":
+                channels = params.get("channels")
+            elif channel_ref := params.get("channel_ref"):
+                channels = [
+                    self._get_channel_data_by_ref(channel_ref, protocol_vo, domain_id)
+                ]
+            else:
+                channels = [params.get("channel_data")]
         except Exception as e:
-            self.increment_fail_count(noti_usage_vo)
+            _LOGGER.error(f"[Notification] Failed to resolve queue payload: {e}")
+            return None
 
-    def increment_usage(self, noti_usage_vo, count=1):
-        noti_usage_mgr: NotificationUsageManager = self.locator.get_manager(
-            "NotificationUsageManager"
+        if channel_refs := params.get("channel_refs"):
+            channels = self._resolve_channel_refs(channel_refs, protocol_vo, domain_id)
+
+        if not channels:
+            return None
+
+        try:
+            self._init_plugin_session(protocol_vo, plugin_mgr, domain_id)
+        except Exception as e:
+            _LOGGER.error(f"[Notification] Plugin Error: {e}")
+
+        if not (channels := self._acquire_batch_quota(protocol_vo, channels)):
+            return None
+
+        plugin_info = protocol_vo.plugin_info.to_dict()
+        return {
+            "protocol_id": protocol_vo.protocol_id,
+            "domain_id": domain_id,
+            "endpoint": plugin_mgr.get_plugin_endpoint(),
+            "secret_data": secret_data,
+            "channels": channels,
+            "notification_type": params["notification_type"],
+            "message": message,
+            "options": plugin_info.get("options", {}),
+            "plugin_metadata": plugin_info.get("metadata", {}),
+        }
+
+    def complete_dispatch(self, dispatch: dict, results: list) -> None:
+        """Record the results of a plugin call of prepare_dispatch
+
+        Channels not attempted due to a connection error (None) are retried
+        with a refreshed plugin session.
+        """
+
+        protocol_mgr: ProtocolManager = self.locator.get_manager(ProtocolManager)
+        plugin_mgr: PluginManager = self.locator.get_manager(PluginManager)
+
+        protocol_vo = protocol_mgr.get_cached_protocol(
+            dispatch["protocol_id"], dispatch["domain_id"]
         )
-        _LOGGER.debug(
-            f"[increment_usage] Incremental Usage Count - Protocol {noti_usage_vo.protocol_id} (count: {count})"
+
+        self._complete_dispatch_batch(
+            protocol_vo,
+            dispatch["secret_data"],
+            dispatch["channels"],
+            dispatch["notification_type"],
+            dispatch["message"],
+            plugin_mgr,
+            dispatch["domain_id"],
+            results,
         )
-        noti_usage_mgr.incremental_notification_usage(noti_usage_vo, count)
 
-    def increment_fail_count(self, noti_usage_vo, count=1):
-        noti_usage_mgr: NotificationUsageManager = self.locator.get_manager(
-            "NotificationUsageManager"
+    def _acquire_batch_quota(self, protocol_vo: Protocol, channels: list) -> list:
+        granted = self._acquire_quota(protocol_vo, len(channels))
+        if rejected_count := len(channels) - granted:
+            _LOGGER.error(
+                f"[Notification] Quota is exceeded. skip {rejected_count} notifications: {protocol_vo.protocol_id}"
+            )
+            self.increment_fail_count(protocol_vo, rejected_count)
+
+        return channels[:granted]
+
+    def _complete_dispatch_batch(
+        self,
+        protocol_vo,
+        secret_data,
+        channels,
+        notification_type,
+        message,
+        plugin_mgr,
+        domain_id,
+        results,
+    ):
+        plugin_info = protocol_vo.plugin_info.to_dict()
+
+        if pending_indexes := [i for i, result in enumerate(results) if result is None]:
+            _LOGGER.warning(
+                f"[Notification] Retry {len(pending_indexes)} notifications with refreshed plugin session"
+            )
+            try:
+                self._init_plugin_session(
+                    protocol_vo, plugin_mgr, domain_id, refresh=True
+                )
+                plugin_info = protocol_vo.plugin_info.to_dict()
+                retry_results = plugin_mgr.dispatch_notification_batch(
+                    secret_data,
+                    [channels[i] for i in pending_indexes],
+                    notification_type,
+                    message,
+                    plugin_info.get("options", {}),
+                    plugin_info.get("metadata", {}),
+                    domain_id,
+                )
+
+                for index, result in zip(pending_indexes, retry_results):
+                    results[index] = result
+            except Exception as e:
+                _LOGGER.error(f"[Notification] Plugin Error: {e}")
+
+        success_count = results.count(True)
+        fail_count = len(results) - success_count
+
+        if success_count > 0:
+            self.increment_usage(protocol_vo, success_count)
+
+        if fail_count > 0:
+            _LOGGER.error(
+                f"[Notification] Failed to dispatch {fail_count} notifications"
+            )
+
+            # Channels which are not attempted due to a plugin session error
+            if None in results:
+                plugin_mgr.delete_plugin_session(plugin_info, domain_id)
+
+            self._release_quota(protocol_vo, fail_count)
+            self.increment_fail_count(protocol_vo, fail_count)
+
+    def _resolve_channel_refs(
+        self, channel_refs: list, protocol_vo: Protocol, domain_id: str
+    ) -> list:
+        def _resolve_channel(channel_ref):
+            try:
+                return True, self._get_channel_data_by_ref(
+                    channel_ref, protocol_vo, domain_id
+                )
+            except Exception as e:
+                _LOGGER.error(
+                    f"[Notification] Failed to resolve channel ({channel_ref}): {e}"
+                )
+                return False, None
+
+        # Channel secrets are resolved in parallel
+        resolved_channels = run_in_threads(
+            _resolve_channel,
+            channel_refs,
+            config.get_global("SECRET_RESOLVE_PARALLEL", 8),
         )
+        return [
+            channel_data
+            for is_resolved, channel_data in resolved_channels
+            if is_resolved
+        ]
+
+    def _get_queue_message(self, message_id: str, domain_id: str) -> dict:
+        local_cache = get_local_cache("dispatch_reference")
+        cache_key = ("message", message_id)
+
+        if (message := local_cache.get(cache_key)) is None:
+            message = cache.get(f"queue-message:{domain_id}:{message_id}")
+
+            if message is None:
+                raise ERROR_QUEUE_MESSAGE_NOT_FOUND(message_id=message_id)
+
+            local_cache.set(cache_key, message)
+
+        return message
+
+    def _get_channel_data_by_ref(
+        self, channel_ref: dict, protocol_vo: Protocol, domain_id: str
+    ):
+        if "channel_data" in channel_ref:
+            return channel_ref["channel_data"]
+
+        # Channels are cached instead of channel data,
+        # so secret data is only kept in the encrypted secret cache
+        local_cache = get_local_cache("dispatch_reference")
+
+        if project_channel_id := channel_ref.get("project_channel_id"):
+            cache_key = ("project_channel", project_channel_id, domain_id)
+            if (prj_ch_vo := local_cache.get(cache_key)) is None:
+                project_ch_mgr: ProjectChannelManager = self.locator.get_manager(
+                    ProjectChannelManager
+                )
+                prj_ch_vo = project_ch_mgr.get_project_channel(
+                    project_channel_id, channel_ref.get("workspace_id"), domain_id
+                )
+                local_cache.set(cache_key, prj_ch_vo)
+
+            return self.get_channel_data(prj_ch_vo, protocol_vo, domain_id)
+        else:
+            user_channel_id = channel_ref["user_channel_id"]
+            cache_key = ("user_channel", user_channel_id, domain_id)
+            if (user_ch_vo := local_cache.get(cache_key)) is None:
+                user_ch_mgr: UserChannelManager = self.locator.get_manager(
+                    UserChannelManager
+                )
+                user_ch_vo = user_ch_mgr.get_user_channel(
+                    user_channel_id, channel_ref.get("user_id"), domain_id
+                )
+                local_cache.set(cache_key, user_ch_vo)
+
+            return self.get_user_channel_data(user_ch_vo, protocol_vo, domain_id)
+
+    def _init_plugin_session(
+        self,
+        protocol_vo: Protocol,
+        plugin_mgr: PluginManager,
+        domain_id: str,
+        refresh: bool = False,
+    ) -> None:
+        plugin_info = protocol_vo.plugin_info.to_dict()
+        plugin_session = plugin_mgr.get_plugin_session(plugin_info, domain_id, refresh)
+
+        is_changed = False
+        if plugin_session["metadata"] != plugin_info.get("metadata"):
+            plugin_info["metadata"] = plugin_session["metadata"]
+            is_changed = True
+
+        version = plugin_session.get("updated_version")
+        if version and version != plugin_info.get("version"):
+            plugin_info["version"] = version
+            is_changed = True
+
+        if is_changed:
+            _LOGGER.debug(
+                f"[_init_plugin_session] update plugin_info: {protocol_vo.protocol_id}"
+            )
+            protocol_mgr: ProtocolManager = self.locator.get_manager(ProtocolManager)
+            old_protocol_snapshot = protocol_mgr.make_protocol_snapshot(protocol_vo)
+            protocol_vo = protocol_mgr.update_protocol_by_vo(
+                {"plugin_info": plugin_info}, protocol_vo
+            )
+            protocol_mgr.sync_protocol_snapshot(protocol_vo, old_protocol_snapshot)
+
+    def _acquire_quota(self, protocol_vo: Protocol, count: int = 1) -> int:
+        quota_mgr: QuotaManager = self.locator.get_manager(QuotaManager)
+        month, date = self.get_month_date()
+
+        try:
+            return quota_mgr.acquire_quota(
+                protocol_vo.protocol_id,
+                protocol_vo.plugin_info.plugin_id,
+                month,
+                date,
+                protocol_vo.domain_id,
+                count,
+            )
+        except Exception as e:
+            if config.get_global("QUOTA_FAIL_OPEN", True):
+                _LOGGER.error(
+                    f"[Notification] Failed to check quota. dispatch without quota: {e}"
+                )
+                return count
+
+            _LOGGER.error(
+                f"[Notification] Failed to check quota. skip notification: {e}"
+            )
+            return 0
+
+    def _release_quota(self, protocol_vo: Protocol, count: int = 1) -> None:
+        quota_mgr: QuotaManager = self.locator.get_manager(QuotaManager)
+        month, date = self.get_month_date()
+
+        try:
+            quota_mgr.release_quota(
+                protocol_vo.protocol_id,
+                protocol_vo.plugin_info.plugin_id,
+                month,
+                date,
+                protocol_vo.domain_id,
+                count,
+            )
+        except Exception as e:
+            _LOGGER.error(f"[Notification] Failed to release quota: {e}")
+
+    def increment_usage(self, protocol_vo: Protocol, count: int = 1):
         _LOGGER.debug(
-            f"[increment_fail_count] Incremental Fail Count - Protocol {noti_usage_vo.protocol_id} (count: {count})"
+            f"[increment_usage] Incremental Usage Count - Protocol {protocol_vo.protocol_id} (count: {count})"
         )
-        noti_usage_mgr.incremental_notification_fail_count(noti_usage_vo, count)
+        self._add_notification_usage(protocol_vo, count=count)
 
-    def get_notification_usage(self, protocol_vo, month, date):
-        usage_month = 0
-        usage_date = 0
-        noti_usage_vo = None
+    def increment_fail_count(self, protocol_vo: Protocol, count: int = 1):
+        _LOGGER.debug(
+            f"[increment_fail_count] Incremental Fail Count - Protocol {protocol_vo.protocol_id} (count: {count})"
+        )
+        self._add_notification_usage(protocol_vo, fail_count=count)
 
+    def _add_notification_usage(
+        self, protocol_vo: Protocol, count: int = 0, fail_count: int = 0
+    ):
         noti_usage_mgr: NotificationUsageManager = self.locator.get_manager(
             "NotificationUsageManager"
         )
-
-        month_query = {
-            "filter": [
-                {"k": "protocol_id", "v": protocol_vo.protocol_id, "o": "eq"},
-                {"k": "usage_month", "v": month, "o": "eq"},
-            ]
-        }
-        (
-            month_usage_results,
-            month_usage_total_count,
-        ) = noti_usage_mgr.list_notification_usages(month_query)
-
-        for _noti_usage in month_usage_results:
-            usage_month += _noti_usage.count
-            if _noti_usage.usage_date == date:
-                usage_date = _noti_usage.count
-                noti_usage_vo = _noti_usage
-
-        if not noti_usage_vo:
-            params = {
-                "protocol_id": protocol_vo.protocol_id,
-                "usage_month": month,
-                "usage_date": date,
-                "domain_id": protocol_vo.domain_id,
-            }
-            noti_usage_vo = noti_usage_mgr.create_notification_usage(params)
-
-        return noti_usage_vo, usage_month, usage_date
+        month, date = self.get_month_date()
+        noti_usage_mgr.add_notification_usage(
+            protocol_vo.protocol_id,
+            month,
+            date,
+            protocol_vo.domain_id,
+            count=count,
+            fail_count=fail_count,
+        )
 
     @staticmethod
-    def check_schedule_for_dispatch(is_scheduled, schedule):
+    def check_schedule_for_dispatch(is_scheduled, schedule, week_hour=None):
         if is_scheduled:
+            if week_hour is not None and schedule.week_hours:
+                return check_week_hours(schedule.week_hours, week_hour)
+
             now_time = datetime.datetime.utcnow()
 
             valid_weekday = check_weekday_schedule(now_time, schedule.day_of_week)
@@ -710,7 +1785,7 @@ class NotificationService(BaseService):
     def check_subscribe_for_dispatch(is_subscribe, subscriptions, topic):
         if is_subscribe is False:
             return True
-        elif is_subscribe and topic in subscriptions:
+        elif is_subscribe and get_topic_matcher(subscriptions).match(topic):
             return True
 
         return False
@@ -732,20 +1807,16 @@ class NotificationService(BaseService):
         return now.strftime("%Y-%m"), now.strftime("%d")
 
     @staticmethod
-    def _check_quota_limit(protocol_id, limit, usage_month, usage_date, count):
-        if "month" in limit:
-            if limit["month"] != -1 and limit["month"] < (usage_month + count):
-                raise ERROR_QUOTA_IS_EXCEEDED(
-                    protocol_id=protocol_id,
-                    limit=f'limit.month=({usage_month}/{limit["month"]})',
-                )
+    def _get_queue_payload() -> str:
+        queue_payload = config.get_global("NOTIFICATION_QUEUE_PAYLOAD", "INLINE")
 
-        if "day" in limit:
-            if limit["day"] != -1 and limit["day"] < (usage_date + count):
-                raise ERROR_QUOTA_IS_EXCEEDED(
-                    protocol_id=protocol_id,
-                    limit=f'limit.day=({usage_date}/{limit["day"]})',
-                )
+        if queue_payload == "REFERENCE" and not cache.is_set():
+            _LOGGER.warning(
+                "[Notification] REFERENCE queue payload requires a shared cache. use INLINE instead."
+            )
+            return "INLINE"
+
+        return queue_payload
 
     @staticmethod
     def get_domain_name(domain_info: dict):
@@ -105,6 +105,10 @@ class ProjectChannelService(BaseService):
                 {"secret_id": project_channel_secret["secret_id"], "data": {}}
             )
 
+        params["protocol_snapshot"] = self.protocol_mgr.make_protocol_snapshot(
+            protocol_vo
+        )
+
         # Create Project Channel
         return self.project_channel_mgr.create_project_channel(params)
 
@@ -182,7 +182,10 @@ class ProtocolService(BaseService):
         }
 
         _LOGGER.debug(f"[update_plugin] {plugin_info}")
-        return self.protocol_mgr.update_protocol_by_vo(params, protocol_vo)
+        old_protocol_snapshot = self.protocol_mgr.make_protocol_snapshot(protocol_vo)
+        protocol_vo = self.protocol_mgr.update_protocol_by_vo(params, protocol_vo)
+        self.protocol_mgr.sync_protocol_snapshot(protocol_vo, old_protocol_snapshot)
+        return protocol_vo
 
     @transaction(permission="notification:Protocol.write", role_types=["DOMAIN_ADMIN"])
     @check_required(["protocol_id", "domain_id"])
@@ -227,7 +230,9 @@ class ProtocolService(BaseService):
         protocol_vo = self.protocol_mgr.get_protocol(
             params["protocol_id"], params["domain_id"]
         )
+        old_protocol_snapshot = self.protocol_mgr.make_protocol_snapshot(protocol_vo)
         protocol_vo = self.protocol_mgr.enable_protocol(protocol_vo)
+        self.protocol_mgr.sync_protocol_snapshot(protocol_vo, old_protocol_snapshot)
         return protocol_vo
 
     @transaction(permission="notification:Protocol.write", role_types=["DOMAIN_ADMIN"])
@@ -248,7 +253,9 @@ class ProtocolService(BaseService):
         protocol_vo = self.protocol_mgr.get_protocol(
             params["protocol_id"], params["domain_id"]
         )
+        old_protocol_snapshot = self.protocol_mgr.make_protocol_snapshot(protocol_vo)
         protocol_vo = self.protocol_mgr.disable_protocol(protocol_vo)
+        self.protocol_mgr.sync_protocol_snapshot(protocol_vo, old_protocol_snapshot)
         return protocol_vo
 
     @transaction(
@@ -103,6 +103,10 @@ class UserChannelService(BaseService):
                 {"user_secret_id": user_channel_secret["user_secret_id"], "data": {}}
             )
 
+        params["protocol_snapshot"] = self.protocol_mgr.make_protocol_snapshot(
+            protocol_vo
+        )
+
         return self.user_channel_mgr.create_user_channel(params)
 
     @transaction(
@@ -0,0 +1,142 @@
+import random
+import time
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.notification.lib.channel_eligibility import evaluate_channel_eligibility
+from spaceone.notification.lib.channel_record import (
+    ProjectChannelRecord,
+    ScheduleRecord,
+)
+from spaceone.notification.lib.schedule import DAYS, make_week_hours
+from spaceone.notification.service.notification_service import NotificationService
+
+CHANNEL_COUNT = 10000
+TOPICS = ["monitoring.Alert", "inventory.Server", "cost.Budget", "monitoring.Event"]
+SUBSCRIPTIONS = [
+    ["monitoring.Alert"],
+    ["inventory.Server", "cost.Budget"],
+    ["monitoring.*"],
+    ["#"],
+    ["cost.#", "inventory.Collector"],
+]
+
+
+class BenchmarkChannelEligibility(unittest.TestCase):
+    """Compare the scalar dispatch checks with the vectorized channel eligibility
+
+    python -m unittest test.benchmark.channel_eligibility_benchmark
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.notification")
+
+        rand = random.Random(0)
+        cls.channels = []
+        for i in range(CHANNEL_COUNT):
+            day_of_week = rand.sample(DAYS, rand.randint(1, 7))
+            start_hour, end_hour = rand.randint(0, 23), rand.randint(1, 24)
+            schedule = {
+                "day_of_week": day_of_week,
+                "start_hour": start_hour,
+                "end_hour": end_hour,
+                "week_hours": make_week_hours(day_of_week, start_hour, end_hour),
+            }
+
+            cls.channels.append(
+                ProjectChannelRecord.from_son(
+                    {
+                        "project_channel_id": f"pch-{i}",
+                        "state": rand.choice(["ENABLED", "ENABLED", "DISABLED"]),
+                        "is_subscribe": rand.choice([True, False]),
+                        "subscriptions": rand.choice(SUBSCRIPTIONS),
+                        "notification_level": rand.choice(
+                            ["LV1", "LV2", "LV3", "LV4", "LV5"]
+                        ),
+                        "is_scheduled": rand.choice([True, False]),
+                        "schedule": schedule,
+                    }
+                )
+            )
+
+        super().setUpClass()
+
+    def test_evaluate_channel_eligibility(self):
+        scalar_elapsed = vector_elapsed = 0
+
+        for week_hour in range(0, 168, 7):
+            for topic in TOPICS:
+                for notification_level in ["ALL", "LV3"]:
+                    start = time.perf_counter()
+                    expected = self._check_channels(
+                        topic, week_hour, notification_level
+                    )
+                    scalar_elapsed += time.perf_counter() - start
+
+                    start = time.perf_counter()
+                    dispatch_mask = evaluate_channel_eligibility(
+                        self.channels, topic, week_hour, notification_level
+                    )
+                    vector_elapsed += time.perf_counter() - start
+
+                    self.assertEqual(expected, dispatch_mask.tolist())
+
+        print()
+        print(
+            f"[scalar]     {CHANNEL_COUNT} channels x 192 events: {scalar_elapsed:.3f}s"
+        )
+        print(
+            f"[vectorized] {CHANNEL_COUNT} channels x 192 events: {vector_elapsed:.3f}s"
+        )
+
+    def test_evaluate_legacy_schedules(self):
+        legacy_channels = []
+        for channel in self.channels[:1000]:
+            legacy_channel = ProjectChannelRecord.from_son(
+                {
+                    **{
+                        field: getattr(channel, field)
+                        for field in ProjectChannelRecord.get_fields()
+                    },
+                    "schedule": None,
+                }
+            )
+            legacy_channel.schedule = ScheduleRecord(
+                {
+                    "day_of_week": channel.schedule.day_of_week,
+                    "start_hour": channel.schedule.start_hour,
+                    "end_hour": channel.schedule.end_hour,
+                }
+            )
+            legacy_channels.append(legacy_channel)
+
+        for week_hour in range(168):
+            self.assertEqual(
+                evaluate_channel_eligibility(
+                    self.channels[:1000], "monitoring.Alert", week_hour
+                ).tolist(),
+                evaluate_channel_eligibility(
+                    legacy_channels, "monitoring.Alert", week_hour
+                ).tolist(),
+            )
+
+    def _check_channels(self, topic, week_hour, notification_level):
+        return [
+            channel.state == "ENABLED"
+            and NotificationService.check_subscribe_for_dispatch(
+                channel.is_subscribe, channel.subscriptions, topic
+            )
+            and NotificationService.check_schedule_for_dispatch(
+                channel.is_scheduled, channel.schedule, week_hour
+            )
+            and NotificationService.check_notification_level_for_dispatch(
+                notification_level, channel.notification_level
+            )
+            for channel in self.channels
+        ]
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,101 @@
+import time
+import tracemalloc
+import unittest
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.transaction import Transaction
+from spaceone.notification.manager.user_channel_manager import UserChannelManager
+from spaceone.notification.model.user_channel_model import UserChannel
+from test.factory.user_channel_factory import UserChannelFactory
+
+CHANNEL_COUNT = 10000
+
+
+class BenchmarkChannelQuery(unittest.TestCase):
+    """Compare mongoengine documents with channel records for dispatch queries
+
+    python -m unittest test.benchmark.channel_query_benchmark
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.notification")
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        cls.transaction = Transaction(
+            {"service": "notification", "api_class": "UserChannel"}
+        )
+
+        user_channels = []
+        for i in range(CHANNEL_COUNT):
+            user_channel = UserChannelFactory.build(
+                domain_id=cls.domain_id, user_id=f"user-{i}"
+            )
+            user_channels.append(user_channel.to_mongo())
+
+        UserChannel._get_collection().insert_many(user_channels)
+        cls.user_ids = [f"user-{i}" for i in range(CHANNEL_COUNT)]
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        UserChannel.objects.filter().delete()
+        disconnect()
+
+    def test_filter_user_channels(self):
+        user_channel_mgr = UserChannelManager(transaction=self.transaction)
+
+        documents, doc_elapsed, doc_peak = self._measure(
+            lambda: list(
+                user_channel_mgr.user_channel_model.filter(
+                    user_id=self.user_ids, state="ENABLED", domain_id=self.domain_id
+                )
+            )
+        )
+        records, record_elapsed, record_peak = self._measure(
+            lambda: user_channel_mgr.filter_user_channel_records(
+                user_id=self.user_ids, state="ENABLED", domain_id=self.domain_id
+            )
+        )
+
+        print()
+        print(
+            f"[documents] {len(documents)} channels: {doc_elapsed:.3f}s, peak {doc_peak / 1024 / 1024:.1f} MiB"
+        )
+        print(
+            f"[records]   {len(records)} channels: {record_elapsed:.3f}s, peak {record_peak / 1024 / 1024:.1f} MiB"
+        )
+
+        self.assertEqual(len(documents), CHANNEL_COUNT)
+        self.assertEqual(
+            [vo.user_channel_id for vo in documents],
+            [record.user_channel_id for record in records],
+        )
+        self.assertEqual(
+            documents[0].schedule.day_of_week, records[0].schedule.day_of_week
+        )
+        self.assertEqual(documents[0].subscriptions, records[0].subscriptions)
+
+    @staticmethod
+    def _measure(func):
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return result, elapsed, peak
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,179 @@
+import multiprocessing
+import os
+import signal
+import time
+import unittest
+from unittest.mock import patch
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.interface.task.v1 import notification_worker
+from spaceone.notification.interface.task.v1.notification_worker import (
+    NotificationWorker,
+    NotificationWorkerSupervisor,
+)
+
+_EVENTS = multiprocessing.Queue()
+
+
+class _ExitingWorker(multiprocessing.Process):
+    """Worker which exits right after start"""
+
+    def __init__(self, queue, **kwargs):
+        super().__init__()
+
+    def run(self):
+        _EVENTS.put(("start", os.getpid()))
+
+
+class _StuckWorker(multiprocessing.Process):
+    """Worker which never finishes its current task"""
+
+    def __init__(self, queue, **kwargs):
+        super().__init__()
+
+    def run(self):
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        _EVENTS.put(("start", os.getpid()))
+
+        while True:
+            time.sleep(1)
+
+
+class _DrainingWorker(multiprocessing.Process):
+    """Worker which finishes its current task in 0.5 seconds on SIGTERM"""
+
+    def __init__(self, queue, **kwargs):
+        super().__init__()
+
+    def run(self):
+        def _handle_stop(signum, frame):
+            time.sleep(0.5)
+            _EVENTS.put(("drained", os.getpid()))
+            raise SystemExit(0)
+
+        signal.signal(signal.SIGTERM, _handle_stop)
+        _EVENTS.put(("start", os.getpid()))
+
+        while True:
+            time.sleep(1)
+
+
+def _get_events(count: int, timeout: float = 10) -> list:
+    return [_EVENTS.get(timeout=timeout) for _ in range(count)]
+
+
+class TestNotificationWorkerSupervisor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.notification")
+        config.set_service_config()
+        super().setUpClass()
+
+    def _start_supervisor(self, worker_cls, processes=2, drain_timeout=25):
+        supervisor = NotificationWorkerSupervisor(
+            "notification_q", processes=processes, drain_timeout=drain_timeout
+        )
+        supervisor.worker_cls = worker_cls
+
+        self.addCleanup(signal.signal, signal.SIGTERM, signal.getsignal(signal.SIGTERM))
+        self.addCleanup(notification_worker._SUPERVISORS.remove, supervisor)
+        self.addCleanup(self._kill, supervisor)
+
+        supervisor.start()
+        return supervisor
+
+    @staticmethod
+    def _kill(supervisor):
+        if supervisor.is_alive():
+            supervisor.kill()
+            supervisor.join()
+
+    @patch.object(notification_worker, "_RESTART_DELAY", 0)
+    def test_restart_worker(self):
+        self._start_supervisor(_ExitingWorker, processes=2)
+
+        # Exited workers are restarted again and again
+        pids = {pid for _, pid in _get_events(6)}
+        self.assertGreaterEqual(len(pids), 6)
+
+    def test_drain_workers(self):
+        supervisor = self._start_supervisor(_DrainingWorker, processes=2)
+        started = {pid for _, pid in _get_events(2)}
+
+        os.kill(supervisor.pid, signal.SIGTERM)
+        supervisor.join(10)
+
+        self.assertEqual(0, supervisor.exitcode)
+        self.assertEqual(
+            {("drained", pid) for pid in started}, set(_get_events(2, timeout=1))
+        )
+
+    def test_kill_workers_after_drain_timeout(self):
+        supervisor = self._start_supervisor(
+            _StuckWorker, processes=1, drain_timeout=0.5
+        )
+        _get_events(1)
+
+        start = time.monotonic()
+        os.kill(supervisor.pid, signal.SIGTERM)
+        supervisor.join(10)
+
+        self.assertEqual(0, supervisor.exitcode)
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_forward_stop_signal(self):
+        supervisor = self._start_supervisor(_DrainingWorker, processes=1)
+        _get_events(1)
+
+        notification_worker._forward_stop_signal(signal.SIGTERM, None)
+        supervisor.join(10)
+
+        self.assertEqual(0, supervisor.exitcode)
+        self.assertEqual("drained", _get_events(1, timeout=1)[0][0])
+
+
+@patch.object(NotificationWorker, "_stop_usage_aggregator")
+class TestNotificationWorker(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.notification")
+        config.set_service_config()
+        super().setUpClass()
+
+    def setUp(self) -> None:
+        for signum in [signal.SIGTERM, signal.SIGINT]:
+            self.addCleanup(signal.signal, signum, signal.getsignal(signum))
+
+        self.worker = NotificationWorker("notification_q")
+
+    def test_stop_while_idle(self, stop_usage_aggregator):
+        def _get(queue_name):
+            self.worker._handle_stop(signal.SIGTERM, None)
+
+        with patch.object(notification_worker.queue, "get", side_effect=_get):
+            with patch.object(NotificationWorker, "_execute") as execute:
+                self.worker.run()
+
+        execute.assert_not_called()
+        stop_usage_aggregator.assert_called_once()
+
+    def test_drain_current_task(self, stop_usage_aggregator):
+        executed = []
+
+        def _execute(binary_task):
+            # SIGTERM while the task is running
+            self.worker._handle_stop(signal.SIGTERM, None)
+            executed.append(binary_task)
+
+        with patch.object(notification_worker.queue, "get", return_value=b"task"):
+            with patch.object(self.worker, "_execute", side_effect=_execute):
+                self.worker.run()
+
+        self.assertEqual([b"task"], executed)
+        stop_usage_aggregator.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
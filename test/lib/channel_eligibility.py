@@ -0,0 +1,134 @@
+import random
+import unittest
+from types import SimpleNamespace
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.lib.channel_eligibility import evaluate_channel_eligibility
+from spaceone.notification.lib.schedule import DAYS, WEEK_HOURS, make_week_hours
+from spaceone.notification.service.notification_service import NotificationService
+
+_LEVELS = ["LV1", "LV2", "LV3", "LV4", "LV5"]
+
+
+def _make_schedule(day_of_week, start_hour, end_hour, week_hours=True):
+    return SimpleNamespace(
+        day_of_week=day_of_week,
+        start_hour=start_hour,
+        end_hour=end_hour,
+        week_hours=(
+            make_week_hours(day_of_week, start_hour, end_hour) if week_hours else None
+        ),
+    )
+
+
+def _make_channel(**kwargs):
+    channel = {
+        "state": "ENABLED",
+        "is_subscribe": False,
+        "subscriptions": [],
+        "is_scheduled": False,
+        "schedule": None,
+        "notification_level": "LV1",
+    }
+    channel.update(kwargs)
+    return SimpleNamespace(**channel)
+
+
+class TestChannelEligibility(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.notification")
+        config.set_service_config()
+        super().setUpClass()
+
+    def _evaluate(self, channels, topic="topic-a", week_hour=0, level="ALL"):
+        return evaluate_channel_eligibility(channels, topic, week_hour, level).tolist()
+
+    def test_state_and_subscription(self):
+        channels = [
+            _make_channel(),
+            _make_channel(state="DISABLED"),
+            _make_channel(is_subscribe=True, subscriptions=["topic-a"]),
+            _make_channel(is_subscribe=True, subscriptions=["topic-b"]),
+            _make_channel(is_subscribe=None, subscriptions=["topic-a"]),
+        ]
+
+        self.assertEqual([True, False, True, False, False], self._evaluate(channels))
+
+    def test_schedule(self):
+        channels = [
+            _make_channel(is_scheduled=True, schedule=_make_schedule(["MON"], 9, 18)),
+            _make_channel(
+                is_scheduled=True, schedule=_make_schedule(["MON"], 9, 18, False)
+            ),
+            _make_channel(is_scheduled=True, schedule=_make_schedule(["TUE"], 22, 6)),
+        ]
+
+        # MON 10:00, MON 20:00 and TUE 02:00
+        self.assertEqual([True, True, False], self._evaluate(channels, week_hour=10))
+        self.assertEqual([False, False, False], self._evaluate(channels, week_hour=20))
+        self.assertEqual([False, False, True], self._evaluate(channels, week_hour=26))
+
+    def test_notification_level(self):
+        channels = [
+            _make_channel(notification_level="LV1"),
+            _make_channel(notification_level="LV2"),
+            _make_channel(notification_level=None),
+        ]
+
+        self.assertEqual([True, True, True], self._evaluate(channels))
+        self.assertEqual([False, True, False], self._evaluate(channels, level="LV2"))
+        self.assertEqual([False, False, False], self._evaluate(channels, level="LV9"))
+
+    def test_empty_channels(self):
+        self.assertEqual([], self._evaluate([]))
+
+    def test_same_as_scalar_rules(self):
+        rand = random.Random(19)
+        channels = []
+
+        for _ in range(500):
+            start_hour = rand.randrange(24)
+            channels.append(
+                _make_channel(
+                    state=rand.choice(["ENABLED", "DISABLED"]),
+                    is_subscribe=rand.choice([True, False]),
+                    subscriptions=rand.sample(["topic-a", "topic-b", "topic-c"], 2),
+                    is_scheduled=rand.choice([True, False]),
+                    schedule=_make_schedule(
+                        rand.sample(DAYS, rand.randrange(1, 8)),
+                        start_hour,
+                        rand.choice([h for h in range(1, 25) if h != start_hour]),
+                    ),
+                    notification_level=rand.choice(_LEVELS),
+                )
+            )
+
+        for _ in range(20):
+            topic = rand.choice(["topic-a", "topic-b", "topic-c"])
+            week_hour = rand.randrange(WEEK_HOURS)
+            level = rand.choice(["ALL"] + _LEVELS)
+
+            expected = [
+                channel.state == "ENABLED"
+                and NotificationService.check_subscribe_for_dispatch(
+                    channel.is_subscribe, channel.subscriptions, topic
+                )
+                and NotificationService.check_schedule_for_dispatch(
+                    channel.is_scheduled, channel.schedule, week_hour
+                )
+                and NotificationService.check_notification_level_for_dispatch(
+                    level, channel.notification_level
+                )
+                for channel in channels
+            ]
+
+            self.assertEqual(
+                expected, self._evaluate(channels, topic, week_hour, level)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,138 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+from bson import json_util
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.lib.channel_record import ProjectChannelRecord
+from spaceone.notification.lib.delivery_plan import DeliveryPlanCache
+
+
+class TestDeliveryPlanCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.notification")
+        config.set_service_config()
+        config.set_global_force(CACHES={})
+        super().setUpClass()
+
+    def setUp(self) -> None:
+        self.conn = fakeredis.FakeRedis()
+        self.domain_id = "domain-1"
+
+        patcher = patch.object(
+            DeliveryPlanCache, "_get_connection", return_value=self.conn
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.plan_cache = DeliveryPlanCache("project", ProjectChannelRecord)
+
+    def tearDown(self) -> None:
+        self.plan_cache._local_cache.clear()
+
+    @staticmethod
+    def _make_docs(*channel_ids) -> list:
+        return [
+            {"project_channel_id": channel_id, "project_id": "project-1"}
+            for channel_id in channel_ids
+        ]
+
+    def _get_plan_ids(self, owner_ids: list, load_func) -> dict:
+        plans = self.plan_cache.get_many(owner_ids, self.domain_id, load_func)
+        return {
+            owner_id: [record.project_channel_id for record in plan]
+            for owner_id, plan in plans.items()
+        }
+
+    def _get_shared_plan(self, owner_id: str) -> list:
+        value = self.conn.get(self.plan_cache._make_key(owner_id, self.domain_id))
+        return json_util.loads(value)
+
+    def test_get_many(self):
+        load_func = MagicMock(
+            return_value={"project-1": self._make_docs("project-ch-1")}
+        )
+
+        for _ in range(2):
+            self.assertEqual(
+                {"project-1": ["project-ch-1"], "project-2": []},
+                self._get_plan_ids(["project-1", "project-2"], load_func),
+            )
+
+        load_func.assert_called_once_with(["project-1", "project-2"], self.domain_id)
+        self.assertEqual([], self._get_shared_plan("project-2"))
+        self.assertGreater(
+            self.conn.ttl(self.plan_cache._make_key("project-1", self.domain_id)), 0
+        )
+
+    def test_get_many_from_shared_cache(self):
+        self.plan_cache.set("project-1", self.domain_id, self._make_docs("ch-1"))
+        load_func = MagicMock()
+
+        self.assertEqual(
+            {"project-1": ["ch-1"]}, self._get_plan_ids(["project-1"], load_func)
+        )
+        load_func.assert_not_called()
+
+    def test_set_invalidates_local_plan(self):
+        load_func = MagicMock(return_value={"project-1": self._make_docs("ch-1")})
+        self._get_plan_ids(["project-1"], load_func)
+
+        self.plan_cache.set(
+            "project-1", self.domain_id, self._make_docs("ch-1", "ch-2")
+        )
+
+        self.assertEqual(
+            {"project-1": ["ch-1", "ch-2"]},
+            self._get_plan_ids(["project-1"], load_func),
+        )
+        load_func.assert_called_once()
+
+    def test_delete_many(self):
+        load_func = MagicMock(return_value={"project-1": self._make_docs("ch-1")})
+        self._get_plan_ids(["project-1"], load_func)
+
+        self.plan_cache.delete_many(["project-1"], self.domain_id)
+
+        self.assertIsNone(
+            self.conn.get(self.plan_cache._make_key("project-1", self.domain_id))
+        )
+        self._get_plan_ids(["project-1"], load_func)
+        self.assertEqual(2, load_func.call_count)
+
+    def test_miss_fill_does_not_overwrite_refresh(self):
+        loading = threading.Event()
+        refreshed = threading.Event()
+
+        def _load_plans(owner_ids, domain_id):
+            # Channels are read before a channel change
+            docs = self._make_docs("ch-1")
+            loading.set()
+            refreshed.wait(5)
+            return {"project-1": docs}
+
+        def _refresh():
+            loading.wait(5)
+            self.plan_cache.set(
+                "project-1", self.domain_id, self._make_docs("ch-1", "ch-2")
+            )
+            refreshed.set()
+
+        thread = threading.Thread(target=_refresh)
+        thread.start()
+        plan_ids = self._get_plan_ids(["project-1"], _load_plans)
+        thread.join()
+
+        self.assertEqual({"project-1": ["ch-1", "ch-2"]}, plan_ids)
+        self.assertEqual(
+            self._make_docs("ch-1", "ch-2"), self._get_shared_plan("project-1")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,72 @@
+import time
+import unittest
+from unittest.mock import patch
+
+import fakeredis
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.lib.reliable_queue import RedisReliableQueue
+
+
+class TestRedisReliableQueue(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = fakeredis.FakeServer()
+        self.conn = fakeredis.FakeRedis(server=self.server)
+
+    def _make_queue(self, consumer_id: str) -> RedisReliableQueue:
+        with patch("redis.Redis", return_value=self.conn):
+            reliable_queue = RedisReliableQueue(
+                {"channel": "notification_job", "heartbeat_ttl": 1, "block_timeout": 1}
+            )
+
+        # Consumers of this test share a process
+        reliable_queue.consumer_id = consumer_id
+        reliable_queue.processing_key = f"notification_job:processing:{consumer_id}"
+        reliable_queue.heartbeat_key = f"notification_job:consumer:{consumer_id}"
+        return reliable_queue
+
+    def _get_processing(self, consumer_id: str) -> list:
+        return self.conn.lrange(f"notification_job:processing:{consumer_id}", 0, -1)
+
+    def test_get_and_ack(self):
+        reliable_queue = self._make_queue("consumer-1")
+        reliable_queue.put(b"task-1")
+
+        self.assertEqual(b"task-1", reliable_queue.get())
+        self.assertEqual([b"task-1"], self._get_processing("consumer-1"))
+        self.assertEqual(0, self.conn.llen("notification_job"))
+
+        reliable_queue.ack(b"task-1")
+        self.assertEqual([], self._get_processing("consumer-1"))
+
+    def test_get_without_task(self):
+        self.assertIsNone(self._make_queue("consumer-1").get())
+
+    def test_requeue_tasks_of_dead_consumer(self):
+        self.conn.rpush("notification_job", b"task-2")
+        self.conn.rpush("notification_job:processing:consumer-dead", b"task-1")
+        reliable_queue = self._make_queue("consumer-1")
+
+        self.assertEqual(b"task-1", reliable_queue.get())
+        self.assertEqual(b"task-2", reliable_queue.get())
+        self.assertEqual([], self._get_processing("consumer-dead"))
+
+    def test_busy_consumer_over_heartbeat_ttl(self):
+        busy_queue = self._make_queue("consumer-busy")
+        busy_queue.put(b"task-1")
+        self.assertEqual(b"task-1", busy_queue.get())
+
+        # The busy consumer executes its task without getting for 3 heartbeat TTLs
+        other_queue = self._make_queue("consumer-other")
+        deadline = time.monotonic() + 3
+
+        while time.monotonic() < deadline:
+            self.assertIsNone(other_queue.get())
+
+        self.assertEqual([b"task-1"], self._get_processing("consumer-busy"))
+        self.assertEqual(0, self.conn.llen("notification_job"))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
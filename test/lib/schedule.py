@@ -0,0 +1,60 @@
+import unittest
+from datetime import datetime, timedelta
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.error import *
+from spaceone.notification.lib.schedule import *
+
+
+class TestSchedule(unittest.TestCase):
+    def _assert_same_as_schedule_check(self, day_of_week, start_hour, end_hour):
+        week_hours = make_week_hours(day_of_week, start_hour, end_hour)
+        # 2024-01-01 is a Monday
+        monday = datetime(2024, 1, 1)
+
+        self.assertEqual(WEEK_HOURS // 8, len(week_hours))
+
+        for week_hour in range(WEEK_HOURS):
+            now_time = monday + timedelta(hours=week_hour)
+            expected = check_weekday_schedule(
+                now_time, day_of_week
+            ) and check_time_schedule(now_time, start_hour, end_hour)
+
+            self.assertEqual(week_hour, get_week_hour(now_time))
+            self.assertEqual(
+                expected, check_week_hours(week_hours, week_hour), now_time
+            )
+
+    def test_make_week_hours(self):
+        self._assert_same_as_schedule_check(["MON", "WED", "FRI"], 8, 23)
+        self._assert_same_as_schedule_check(DAYS, 0, 24)
+        self._assert_same_as_schedule_check([], 0, 24)
+
+    def test_make_week_hours_overnight(self):
+        self._assert_same_as_schedule_check(["TUE", "SUN"], 22, 6)
+
+    def test_make_week_hours_bit_order(self):
+        week_hours = make_week_hours(["MON"], 0, 1)
+
+        # MON 00:00 is the least significant bit of the first byte
+        self.assertEqual(b"\x01" + bytes(20), week_hours)
+
+    def test_validate_schedule(self):
+        schedule = {"day_of_week": ["SAT"], "start_hour": 22, "end_hour": 2}
+        validate_schedule(schedule)
+
+        self.assertEqual(make_week_hours(["SAT"], 22, 2), schedule["week_hours"])
+
+        with self.assertRaises(ERROR_WRONG_SCHEDULE_SETTINGS):
+            validate_schedule({"day_of_week": ["SAT"], "start_hour": 9, "end_hour": 9})
+
+    def test_make_week_hour_query(self):
+        self.assertEqual(
+            {"schedule.week_hours": {"$bitsAllSet": [30]}},
+            make_week_hour_query(30)["$or"][2],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
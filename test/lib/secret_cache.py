@@ -0,0 +1,101 @@
+import os
+import unittest
+from unittest.mock import MagicMock
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.lib import secret_cache
+from spaceone.notification.lib.secret_cache import get_secret_cache
+
+
+class TestSecretCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.secret_cache = get_secret_cache("test_secret_data")
+        self.secret_data = {"token": "secret-token"}
+
+    def tearDown(self) -> None:
+        self.secret_cache.clear()
+
+    def test_get_or_load(self):
+        load_func = MagicMock(return_value=self.secret_data)
+
+        for _ in range(3):
+            self.assertEqual(
+                self.secret_data,
+                self.secret_cache.get_or_load(("secret-1", "domain-1"), load_func),
+            )
+
+        load_func.assert_called_once_with()
+
+    def test_get_or_load_many(self):
+        load_func = MagicMock(side_effect=lambda key: {"token": key[0]})
+        self.secret_cache.get_or_load(("secret-1", "domain-1"), lambda: {"token": "a"})
+
+        secrets = self.secret_cache.get_or_load_many(
+            [("secret-1", "domain-1"), ("secret-2", "domain-1")], load_func
+        )
+
+        self.assertEqual({"token": "a"}, secrets[("secret-1", "domain-1")])
+        self.assertEqual({"token": "secret-2"}, secrets[("secret-2", "domain-1")])
+        load_func.assert_called_once_with(("secret-2", "domain-1"))
+
+    def test_encrypted_value(self):
+        self.secret_cache.get_or_load(
+            ("secret-1", "domain-1"), lambda: self.secret_data
+        )
+        token = self.secret_cache._local_cache.get(("secret-1", "domain-1"))
+
+        self.assertIsInstance(token, bytes)
+        self.assertNotIn(b"secret-token", token)
+
+    def test_delete(self):
+        self.secret_cache.get_or_load(("secret-1", "domain-1"), lambda: {"v": 1})
+        self.secret_cache.get_or_load(("secret-2", "domain-1"), lambda: {"v": 2})
+
+        self.secret_cache.delete("secret-1")
+
+        self.assertEqual(
+            {"v": 3},
+            self.secret_cache.get_or_load(("secret-1", "domain-1"), lambda: {"v": 3}),
+        )
+        self.assertEqual(
+            {"v": 2},
+            self.secret_cache.get_or_load(("secret-2", "domain-1"), lambda: {"v": 4}),
+        )
+
+    def test_key_after_fork(self):
+        self.secret_cache.get_or_load(("secret-1", "domain-1"), lambda: {"v": 1})
+        parent_fernet = secret_cache._get_fernet()
+
+        # Same as the handler registered with os.register_at_fork
+        secret_cache._reset_fernet()
+
+        self.assertIsNot(parent_fernet, secret_cache._get_fernet())
+        self.assertEqual(
+            {"v": 2},
+            self.secret_cache.get_or_load(("secret-1", "domain-1"), lambda: {"v": 2}),
+        )
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_fork(self):
+        parent_key = secret_cache._get_fernet()._signing_key
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+
+        if pid == 0:
+            os.close(read_fd)
+            child_key = secret_cache._get_fernet()._signing_key
+            os.write(write_fd, b"1" if child_key != parent_key else b"0")
+            os.close(write_fd)
+            os._exit(0)
+
+        os.close(write_fd)
+        result = os.read(read_fd, 1)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        self.assertEqual(b"1", result)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,79 @@
+import unittest
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.lib.topic_matcher import *
+
+
+class TestTopicMatcher(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.notification")
+        config.set_service_config()
+        super().setUpClass()
+
+    def tearDown(self) -> None:
+        config.set_global(TOPIC_WILDCARD_SUBSCRIPTIONS=False)
+
+    def test_match_literal(self):
+        topic_matcher = TopicMatcher(["monitoring.alert", "billing"])
+
+        self.assertTrue(topic_matcher.match("monitoring.alert"))
+        self.assertTrue(topic_matcher.match("billing"))
+        self.assertFalse(topic_matcher.match("monitoring"))
+        self.assertFalse(topic_matcher.match("monitoring.alert.created"))
+
+    def test_match_single_wildcard(self):
+        topic_matcher = TopicMatcher(["monitoring.*.created"])
+
+        self.assertTrue(topic_matcher.match("monitoring.alert.created"))
+        self.assertFalse(topic_matcher.match("monitoring.created"))
+        self.assertFalse(topic_matcher.match("monitoring.alert.event.created"))
+
+    def test_match_multi_wildcard(self):
+        topic_matcher = TopicMatcher(["monitoring.#", "#.deleted"])
+
+        self.assertTrue(topic_matcher.match("monitoring"))
+        self.assertTrue(topic_matcher.match("monitoring.alert.created"))
+        self.assertTrue(topic_matcher.match("billing.budget.deleted"))
+        self.assertTrue(topic_matcher.match("deleted"))
+        self.assertFalse(topic_matcher.match("billing.budget"))
+
+    def test_match_without_wildcard(self):
+        topic_matcher = TopicMatcher(["monitoring.*", "#"], use_wildcard=False)
+
+        self.assertTrue(topic_matcher.match("monitoring.*"))
+        self.assertTrue(topic_matcher.match("#"))
+        self.assertFalse(topic_matcher.match("monitoring.alert"))
+
+    def test_partial_segment_is_literal(self):
+        topic_matcher = TopicMatcher(["monitoring.alert*"])
+
+        self.assertTrue(topic_matcher.match("monitoring.alert*"))
+        self.assertFalse(topic_matcher.match("monitoring.alerts"))
+
+    def test_get_topic_matcher(self):
+        self.assertFalse(get_topic_matcher(["monitoring.*"]).match("monitoring.alert"))
+
+        config.set_global(TOPIC_WILDCARD_SUBSCRIPTIONS=True)
+
+        self.assertTrue(get_topic_matcher(["monitoring.*"]).match("monitoring.alert"))
+        self.assertIs(
+            get_topic_matcher(["monitoring.*"]), get_topic_matcher(["monitoring.*"])
+        )
+
+    def test_make_topic_query(self):
+        self.assertEqual(2, len(make_topic_query("monitoring.alert")["$or"]))
+
+        config.set_global(TOPIC_WILDCARD_SUBSCRIPTIONS=True)
+
+        self.assertIn(
+            {"subscriptions": "monitoring.alert"},
+            make_topic_query("monitoring.alert")["$or"],
+        )
+        self.assertEqual(3, len(make_topic_query("monitoring.alert")["$or"]))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
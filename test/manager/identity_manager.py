@@ -0,0 +1,210 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_NOT_FOUND
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.lib import invalidation_bus
+from spaceone.notification.lib.local_cache import get_local_cache
+from spaceone.notification.manager.identity_manager import (
+    IdentityManager,
+    _delete_local_identity,
+)
+
+
+@patch.object(IdentityManager, "__init__", return_value=None)
+class TestIdentityManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.notification")
+        config.set_service_config()
+        config.set_global_force(CACHES={})
+        invalidation_bus.subscribe("identity", _delete_local_identity)
+        super().setUpClass()
+
+    def setUp(self) -> None:
+        self.users = [{"user_id": f"user-{i}", "state": "ENABLED"} for i in range(5)]
+        self.projects = {
+            "project-private": {
+                "project_id": "project-private",
+                "project_type": "PRIVATE",
+                "workspace_id": "workspace-1",
+                "users": ["user-1", "user-2", "user-1"],
+            },
+            "project-public": {
+                "project_id": "project-public",
+                "project_type": "PUBLIC",
+                "workspace_id": "workspace-1",
+            },
+        }
+
+    def tearDown(self) -> None:
+        for cache_name in [
+            "identity_project",
+            "identity_workspace_users",
+            "identity_project_users",
+            "identity_not_found",
+        ]:
+            get_local_cache(cache_name).clear()
+
+    def _get_project(self, project_id: str, domain_id: str) -> dict:
+        if project_id not in self.projects:
+            raise ERROR_NOT_FOUND(key="project_id", value=project_id)
+
+        return self.projects[project_id]
+
+    @staticmethod
+    def _get_workspace_users(workspace_id: str, domain_id: str) -> dict:
+        return {
+            "results": [
+                {"user_id": "user-3", "workspace_id": workspace_id},
+                {"user_id": "user-4", "workspace_id": workspace_id},
+            ]
+        }
+
+    def _list_users_in_domain(self, query: dict, domain_id: str) -> dict:
+        users = self.users
+        for condition in query.get("filter", []):
+            users = [user for user in users if user["user_id"] > condition["v"]]
+
+        return {"results": users[: query["page"]["limit"]]}
+
+    def test_list_user_page(self, *args):
+        with patch.object(
+            IdentityManager,
+            "list_users_in_domain",
+            side_effect=self._list_users_in_domain,
+        ) as list_users_in_domain:
+            response = IdentityManager().list_user_page("domain-1", 2, "user-1")
+
+        self.assertEqual(self.users[2:4], response["results"])
+
+        query = list_users_in_domain.call_args.args[0]
+        self.assertEqual([{"k": "user_id", "v": "user-1", "o": "gt"}], query["filter"])
+        self.assertEqual([{"key": "user_id"}], query["sort"])
+        self.assertEqual({"limit": 2}, query["page"])
+        self.assertEqual(["user_id", "state"], query["only"])
+
+    def test_get_all_users_in_domain(self, *args):
+        with patch.object(
+            IdentityManager,
+            "list_users_in_domain",
+            side_effect=self._list_users_in_domain,
+        ) as list_users_in_domain:
+            users = list(IdentityManager().get_all_users_in_domain("domain-1", 2))
+
+        self.assertEqual(self.users, users)
+        self.assertEqual(
+            [[], ["user-1"], ["user-3"]],
+            [
+                [condition["v"] for condition in call.args[0].get("filter", [])]
+                for call in list_users_in_domain.call_args_list
+            ],
+        )
+
+    def test_get_all_users_in_domain_with_full_last_page(self, *args):
+        self.users = self.users[:4]
+
+        with patch.object(
+            IdentityManager,
+            "list_users_in_domain",
+            side_effect=self._list_users_in_domain,
+        ) as list_users_in_domain:
+            users = list(IdentityManager().get_all_users_in_domain("domain-1", 2))
+
+        self.assertEqual(self.users, users)
+        self.assertEqual(3, list_users_in_domain.call_count)
+
+    @patch.object(IdentityManager, "get_workspace_users")
+    def test_get_cached_project_users_private(self, get_workspace_users, _):
+        with patch.object(
+            IdentityManager, "get_project", side_effect=self._get_project
+        ) as get_project:
+            identity_mgr = IdentityManager()
+
+            for _ in range(2):
+                self.assertEqual(
+                    frozenset(["user-1", "user-2"]),
+                    identity_mgr.get_cached_project_users(
+                        "project-private", "domain-1"
+                    ),
+                )
+
+        get_project.assert_called_once_with("project-private", "domain-1")
+        get_workspace_users.assert_not_called()
+
+    def test_get_cached_project_users_public(self, *args):
+        with patch.object(
+            IdentityManager, "get_project", side_effect=self._get_project
+        ), patch.object(
+            IdentityManager,
+            "get_workspace_users",
+            side_effect=self._get_workspace_users,
+        ) as get_workspace_users:
+            project_users = IdentityManager().get_cached_project_users(
+                "project-public", "domain-1"
+            )
+
+        self.assertEqual(frozenset(["user-3", "user-4"]), project_users)
+        get_workspace_users.assert_called_once_with("workspace-1", "domain-1")
+
+    def test_get_cached_project_users_not_found(self, *args):
+        with patch.object(
+            IdentityManager, "get_project", side_effect=self._get_project
+        ) as get_project:
+            identity_mgr = IdentityManager()
+
+            for _ in range(2):
+                with self.assertRaises(ERROR_NOT_FOUND):
+                    identity_mgr.get_cached_project_users("project-x", "domain-1")
+
+        get_project.assert_called_once()
+
+    def test_invalidate_project_users(self, *args):
+        with patch.object(
+            IdentityManager, "get_project", side_effect=self._get_project
+        ):
+            identity_mgr = IdentityManager()
+            identity_mgr.get_cached_project_users("project-private", "domain-1")
+
+            self.projects["project-private"]["users"] = ["user-1"]
+            IdentityManager.invalidate_cache("domain-1", "project-private")
+
+            self.assertEqual(
+                frozenset(["user-1"]),
+                identity_mgr.get_cached_project_users("project-private", "domain-1"),
+            )
+
+    def test_get_cached_project_users_concurrently(self, *args):
+        def _get_project(project_id, domain_id):
+            time.sleep(0.05)
+            return self._get_project(project_id, domain_id)
+
+        results = []
+
+        def _get_project_users():
+            results.append(
+                IdentityManager().get_cached_project_users(
+                    "project-private", "domain-1"
+                )
+            )
+
+        with patch.object(
+            IdentityManager, "get_project", side_effect=_get_project
+        ) as get_project:
+            threads = [threading.Thread(target=_get_project_users) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        get_project.assert_called_once()
+        self.assertEqual(8, len(results))
+        self.assertEqual(1, len({id(project_users) for project_users in results}))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,108 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from pymongo.errors import BulkWriteError
+
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.transaction import Transaction, get_transaction
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.error import *
+from spaceone.notification.manager.notification_manager import NotificationManager
+from spaceone.notification.model.notification_model import Notification
+
+
+class TestNotificationManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.notification")
+        config.set_service_config()
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        cls.transaction = Transaction(
+            {"service": "notification", "api_class": "Notification"}
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def tearDown(self) -> None:
+        Notification.objects.filter().delete()
+
+    def _make_params_list(self, count: int) -> list:
+        return [
+            {
+                "topic": "topic-a",
+                "message": {"title": "test"},
+                "user_id": f"user-{i}",
+                "domain_id": self.domain_id,
+            }
+            for i in range(count)
+        ]
+
+    def test_create_notifications_in_worker(self):
+        results = []
+
+        def _create_notifications():
+            notification_mgr = NotificationManager()
+            notification_mgr.create_notifications(self._make_params_list(3))
+            results.append(len(get_transaction()._rollbacks))
+
+        thread = threading.Thread(target=_create_notifications)
+        thread.start()
+        thread.join()
+
+        self.assertEqual([0], results)
+        self.assertEqual(3, Notification.objects.count())
+
+    def test_create_notifications_with_partial_failure(self):
+        collection = MagicMock()
+        collection.insert_many.side_effect = [
+            BulkWriteError(
+                {
+                    "writeErrors": [
+                        {"index": 1, "code": 91, "errmsg": "shutdown in progress"},
+                        {"index": 2, "code": 11000, "errmsg": "duplicate key"},
+                    ]
+                }
+            ),
+            None,
+        ]
+
+        with patch.object(Notification, "_get_collection", return_value=collection):
+            notification_mgr = NotificationManager(transaction=self.transaction)
+            notification_mgr.create_notifications(self._make_params_list(4))
+
+        documents = collection.insert_many.call_args_list[0].args[0]
+        retry_documents = collection.insert_many.call_args_list[1].args[0]
+
+        self.assertEqual(4, len(documents))
+        self.assertEqual([documents[1]], retry_documents)
+
+    def test_create_notifications_with_retry_failure(self):
+        write_error = {"writeErrors": [{"index": 0, "code": 91, "errmsg": "error"}]}
+        collection = MagicMock()
+        collection.insert_many.side_effect = [
+            BulkWriteError(write_error),
+            BulkWriteError(write_error),
+        ]
+
+        with patch.object(Notification, "_get_collection", return_value=collection):
+            notification_mgr = NotificationManager(transaction=self.transaction)
+
+            with self.assertRaises(ERROR_DB_QUERY):
+                notification_mgr.create_notifications(self._make_params_list(2))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
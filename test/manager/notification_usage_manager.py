@@ -0,0 +1,112 @@
+import unittest
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import NotUniqueError, connect, disconnect
+from mongoengine.queryset import QuerySet
+
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.transaction import Transaction
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.manager.notification_usage_manager import (
+    NotificationUsageManager,
+)
+from spaceone.notification.model.notification_usage_model import NotificationUsage
+
+
+class TestNotificationUsageManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.notification")
+        config.set_service_config()
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        cls.transaction = Transaction(
+            {"service": "notification", "api_class": "NotificationUsage"}
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.protocol_id = utils.generate_id("protocol")
+        self.usage_key = (self.protocol_id, "2024-01", "15", self.domain_id)
+
+    def tearDown(self) -> None:
+        NotificationUsageManager.stop_usage_aggregator()
+        config.set_global(NOTIFICATION_USAGE_AGGREGATOR={"enabled": False})
+        NotificationUsage.objects.filter().delete()
+
+    def _get_usage(self) -> NotificationUsage:
+        return NotificationUsage.objects.get(protocol_id=self.protocol_id)
+
+    def test_upsert_notification_usage(self):
+        NotificationUsageManager.upsert_notification_usage(self.usage_key, 3, 1)
+        NotificationUsageManager.upsert_notification_usage(self.usage_key, 2, 0)
+
+        usage_vo = self._get_usage()
+        self.assertEqual(1, NotificationUsage.objects.count())
+        self.assertEqual((5, 1), (usage_vo.count, usage_vo.fail_count))
+        self.assertEqual(
+            ("2024-01", "15", self.domain_id),
+            (usage_vo.usage_month, usage_vo.usage_date, usage_vo.domain_id),
+        )
+
+    def test_upsert_notification_usage_with_concurrent_insert(self):
+        update_one = QuerySet.update_one
+
+        def _update_one(queryset, upsert=False, **kwargs):
+            if upsert:
+                # Another worker inserts the document between find and insert
+                update_one(queryset, upsert=True, inc__count=1)
+                raise NotUniqueError("duplicate key error")
+
+            return update_one(queryset, **kwargs)
+
+        with patch.object(QuerySet, "update_one", _update_one):
+            NotificationUsageManager.upsert_notification_usage(self.usage_key, 2, 1)
+
+        usage_vo = self._get_usage()
+        self.assertEqual(1, NotificationUsage.objects.count())
+        self.assertEqual((3, 1), (usage_vo.count, usage_vo.fail_count))
+
+    def test_add_notification_usage_with_aggregator(self):
+        config.set_global(
+            NOTIFICATION_USAGE_AGGREGATOR={
+                "enabled": True,
+                "flush_interval_ms": 60000,
+                "flush_events": 100,
+            }
+        )
+        noti_usage_mgr = NotificationUsageManager(transaction=self.transaction)
+
+        with patch.object(
+            NotificationUsageManager,
+            "upsert_notification_usage",
+            wraps=NotificationUsageManager.upsert_notification_usage,
+        ) as upsert_notification_usage:
+            NotificationUsageManager.stop_usage_aggregator()
+
+            for _ in range(10):
+                noti_usage_mgr.add_notification_usage(*self.usage_key, count=1)
+            noti_usage_mgr.add_notification_usage(*self.usage_key, fail_count=1)
+
+            self.assertEqual(0, NotificationUsage.objects.count())
+
+            NotificationUsageManager.stop_usage_aggregator()
+
+        upsert_notification_usage.assert_called_once_with(self.usage_key, 10, 1)
+        usage_vo = self._get_usage()
+        self.assertEqual((10, 1), (usage_vo.count, usage_vo.fail_count))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
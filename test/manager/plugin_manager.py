@@ -0,0 +1,126 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from spaceone.core.error import *
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.error import *
+from spaceone.notification.manager.plugin_manager import PluginManager
+
+
+class TestPluginManager(unittest.TestCase):
+    @patch.object(PluginManager, "__init__", return_value=None)
+    def setUp(self, *args) -> None:
+        self.plugin_mgr = PluginManager()
+        self.plugin_mgr.noti_plugin_connector = MagicMock()
+
+    def test_is_plugin_session_error(self):
+        plugin_error = ERROR_INTERNAL_API(message="invalid session")
+        plugin_error.error_code = "ERROR_INVALID_PLUGIN_SESSION"
+
+        for error in [
+            ERROR_GRPC_CONNECTION(channel="plugin:50051", message="unavailable"),
+            ERROR_AUTHENTICATE_FAILURE(message="invalid token"),
+            ERROR_PERMISSION_DENIED(),
+            plugin_error,
+        ]:
+            self.assertTrue(PluginManager.is_plugin_session_error(error))
+
+        for error in [
+            ERROR_INTERNAL_API(message="invalid channel data"),
+            ValueError("invalid message"),
+        ]:
+            self.assertFalse(PluginManager.is_plugin_session_error(error))
+
+    def test_dispatch_notification_batch_with_channel_error(self):
+        self.plugin_mgr.noti_plugin_connector.dispatch_notification.side_effect = [
+            None,
+            ERROR_INTERNAL_API(message="invalid channel data"),
+            None,
+        ]
+
+        results = self.plugin_mgr.dispatch_notification_batch(
+            {}, [{"n": 1}, {"n": 2}, {"n": 3}], "INFO", {}, {}, {}, "domain-1"
+        )
+
+        self.assertEqual([True, False, True], results)
+
+    def test_dispatch_notification_batch_with_session_error(self):
+        self.plugin_mgr.noti_plugin_connector.dispatch_notification.side_effect = [
+            None,
+            ERROR_AUTHENTICATE_FAILURE(message="invalid token"),
+        ]
+
+        results = self.plugin_mgr.dispatch_notification_batch(
+            {}, [{"n": 1}, {"n": 2}, {"n": 3}], "INFO", {}, {}, {}, "domain-1"
+        )
+
+        # Channels which are not attempted are retried with a new plugin session
+        self.assertEqual([True, None, None], results)
+
+    def test_dispatch_notification_batch_not_supported(self):
+        connector = self.plugin_mgr.noti_plugin_connector
+        connector.dispatch_notification_batch.side_effect = [
+            {
+                "results": [
+                    {"index": 0, "success": True},
+                    {"index": 1, "success": False},
+                ]
+            },
+            ERROR_UNSUPPORTED_PLUGIN_METHOD(method="Notification.dispatch_batch"),
+        ]
+        connector.dispatch_notification.side_effect = [
+            None,
+            ERROR_INTERNAL_API(message="invalid channel data"),
+            None,
+        ]
+
+        results = self.plugin_mgr.dispatch_notification_batch(
+            {},
+            [{"n": n} for n in range(5)],
+            "INFO",
+            {},
+            {},
+            {"supports_batch_dispatch": True, "max_batch_size": 2},
+            "domain-1",
+        )
+
+        # Channels from the unsupported batch are dispatched one by one
+        self.assertEqual([True, False, True, False, True], results)
+        self.assertEqual(2, connector.dispatch_notification_batch.call_count)
+        self.assertEqual(
+            [{"n": 2}, {"n": 3}, {"n": 4}],
+            [call.args[1] for call in connector.dispatch_notification.call_args_list],
+        )
+
+    def test_async_dispatch_notification_batch_not_supported(self):
+        connector = self.plugin_mgr.noti_plugin_connector
+        connector.async_dispatch_notification_batch = AsyncMock(
+            side_effect=ERROR_UNSUPPORTED_PLUGIN_METHOD(
+                method="Notification.dispatch_batch"
+            )
+        )
+        connector.async_dispatch_notification = AsyncMock(
+            side_effect=[None, ERROR_INTERNAL_API(message="invalid channel data"), None]
+        )
+
+        results = asyncio.run(
+            self.plugin_mgr.async_dispatch_notification_batch(
+                "grpc://plugin:50051",
+                {},
+                [{"n": n} for n in range(3)],
+                "INFO",
+                {},
+                {},
+                {"supports_batch_dispatch": True, "max_batch_size": 3},
+                asyncio.Semaphore(1),
+            )
+        )
+
+        self.assertEqual([True, False, True], results)
+        self.assertEqual(3, connector.async_dispatch_notification.await_count)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
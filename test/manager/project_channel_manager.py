@@ -0,0 +1,114 @@
+import unittest
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.transaction import Transaction
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.lib import invalidation_bus
+from spaceone.notification.lib.local_cache import get_local_cache
+from spaceone.notification.lib.schedule import make_week_hours
+from spaceone.notification.lib.secret_cache import get_secret_cache
+from spaceone.notification.manager.project_channel_manager import (
+    ProjectChannelManager,
+)
+from spaceone.notification.manager.secret_manager import _delete_local_secret
+from spaceone.notification.model.project_channel_model import ProjectChannel
+from test.factory.project_channel_factory import ProjectChannelFactory
+
+
+class TestProjectChannelManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.notification")
+        config.set_service_config()
+        config.set_global_force(CACHES={})
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        cls.transaction = Transaction(
+            {"service": "notification", "api_class": "ProjectChannel"}
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def tearDown(self) -> None:
+        ProjectChannel.objects.filter().delete()
+        get_local_cache("dispatch_reference").clear()
+        get_secret_cache("secret_data").clear()
+
+    def _cache_dispatch_reference(self, project_channel_vo):
+        cache_key = (
+            "project_channel",
+            project_channel_vo.project_channel_id,
+            self.domain_id,
+        )
+        get_local_cache("dispatch_reference").set(cache_key, project_channel_vo)
+        return cache_key
+
+    def test_disable_project_channel(self):
+        project_channel_vo = ProjectChannelFactory(domain_id=self.domain_id)
+        project_channel_mgr = ProjectChannelManager(transaction=self.transaction)
+        cache_key = self._cache_dispatch_reference(project_channel_vo)
+
+        project_channel_mgr.disable_project_channel(project_channel_vo)
+
+        self.assertIsNone(get_local_cache("dispatch_reference").get(cache_key))
+        self.assertEqual(
+            [],
+            project_channel_mgr.get_delivery_plans(
+                [project_channel_vo.project_id], self.domain_id
+            )[project_channel_vo.project_id],
+        )
+
+    def test_delete_project_channel(self):
+        project_channel_vo = ProjectChannelFactory(domain_id=self.domain_id)
+        project_channel_mgr = ProjectChannelManager(transaction=self.transaction)
+        cache_key = self._cache_dispatch_reference(project_channel_vo)
+
+        project_channel_mgr.delete_project_channel_by_vo(project_channel_vo)
+
+        self.assertIsNone(get_local_cache("dispatch_reference").get(cache_key))
+
+    def test_update_project_channel_with_secret(self):
+        invalidation_bus.subscribe("secret", _delete_local_secret)
+        project_channel_vo = ProjectChannelFactory(
+            domain_id=self.domain_id, secret_id=utils.generate_id("secret")
+        )
+        project_channel_mgr = ProjectChannelManager(transaction=self.transaction)
+        secret_cache = get_secret_cache("secret_data")
+        cache_key = (project_channel_vo.secret_id, self.domain_id)
+        secret_cache.get_or_load(cache_key, lambda: {"token": "old-token"})
+
+        project_channel_mgr.enable_project_channel(project_channel_vo)
+
+        self.assertEqual(
+            {"token": "new-token"},
+            secret_cache.get_or_load(cache_key, lambda: {"token": "new-token"}),
+        )
+
+    def test_backfill_schedule_week_hours(self):
+        project_channel_vo = ProjectChannelFactory(domain_id=self.domain_id)
+        ProjectChannelFactory(domain_id=self.domain_id, is_scheduled=False)
+        project_channel_mgr = ProjectChannelManager(transaction=self.transaction)
+
+        self.assertIsNone(project_channel_vo.schedule.week_hours)
+        self.assertEqual(1, project_channel_mgr.backfill_schedule_week_hours())
+        self.assertEqual(
+            make_week_hours(["MON", "WED", "FRI"], 8, 23),
+            bytes(project_channel_vo.reload().schedule.week_hours),
+        )
+        self.assertEqual(0, project_channel_mgr.backfill_schedule_week_hours())
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import patch
+
+import fakeredis
+
+from spaceone.core import config
+from spaceone.core.transaction import Transaction
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.manager.quota_manager import QuotaManager
+
+
+class TestQuotaManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.notification")
+        config.set_service_config()
+        cls.transaction = Transaction({"service": "notification", "api_class": "Quota"})
+        super().setUpClass()
+
+    def setUp(self) -> None:
+        config.set_global(
+            DEFAULT_QUOTA={"plugin-sms": {"day": 5, "month": 8}},
+        )
+        self.conn = fakeredis.FakeRedis()
+        self.quota_key = ("protocol-1", "2024-01", "15", "domain-1")
+        self.day_key, self.month_key = QuotaManager._make_quota_keys(*self.quota_key)
+
+        patcher = patch.object(QuotaManager, "_get_connection", return_value=self.conn)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.quota_mgr = QuotaManager(transaction=self.transaction)
+
+    def tearDown(self) -> None:
+        config.set_global_force(DEFAULT_QUOTA={})
+
+    def _acquire(self, count: int, plugin_id: str = "plugin-sms") -> int:
+        protocol_id, usage_month, usage_date, domain_id = self.quota_key
+        return self.quota_mgr.acquire_quota(
+            protocol_id, plugin_id, usage_month, usage_date, domain_id, count
+        )
+
+    def _release(self, count: int) -> None:
+        protocol_id, usage_month, usage_date, domain_id = self.quota_key
+        self.quota_mgr.release_quota(
+            protocol_id, "plugin-sms", usage_month, usage_date, domain_id, count
+        )
+
+    def _get_used(self) -> tuple:
+        return int(self.conn.get(self.day_key) or 0), int(
+            self.conn.get(self.month_key) or 0
+        )
+
+    def test_acquire_quota(self):
+        self.assertEqual(3, self._acquire(3))
+        self.assertEqual(2, self._acquire(3))
+        self.assertEqual(0, self._acquire(1))
+        self.assertEqual((5, 5), self._get_used())
+        self.assertGreater(self.conn.ttl(self.day_key), 0)
+        self.assertGreater(self.conn.ttl(self.month_key), 0)
+
+    def test_acquire_quota_without_limit(self):
+        self.assertEqual(100, self._acquire(100, plugin_id="plugin-slack"))
+        self.assertEqual((0, 0), self._get_used())
+
+    def test_release_quota(self):
+        self._acquire(5)
+        self._release(2)
+
+        self.assertEqual((3, 3), self._get_used())
+        self.assertEqual(2, self._acquire(4))
+
+        # Counters never go below zero
+        self._release(10)
+        self.assertEqual((0, 0), self._get_used())
+
+    def test_reconcile_quota(self):
+        self._acquire(2)
+        protocol_id, usage_month, usage_date, domain_id = self.quota_key
+
+        self.quota_mgr.reconcile_quota(
+            protocol_id, usage_month, usage_date, domain_id, 4, 7
+        )
+        self.assertEqual((4, 7), self._get_used())
+        self.assertEqual(1, self._acquire(3))
+
+        # Persisted usage lower than the counters does not lower them
+        self.quota_mgr.reconcile_quota(
+            protocol_id, usage_month, usage_date, domain_id, 1, 1
+        )
+        self.assertEqual((5, 8), self._get_used())
+
+    def test_register_script_once_per_connection(self):
+        with patch.object(
+            self.conn, "register_script", wraps=self.conn.register_script
+        ) as register_script:
+            for _ in range(3):
+                self._acquire(1)
+                self._release(1)
+
+        self.assertEqual(2, register_script.call_count)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
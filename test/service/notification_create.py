@@ -0,0 +1,102 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_NOT_FOUND
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.error import *
+from spaceone.notification.manager.identity_manager import IdentityManager
+from spaceone.notification.service.notification_service import NotificationService
+
+
+@patch.object(IdentityManager, "__init__", return_value=None)
+@patch.object(
+    IdentityManager,
+    "get_cached_domain_info",
+    return_value={"state": "ENABLED", "name": "test"},
+)
+@patch.object(NotificationService, "dispatch_resource")
+class TestNotificationCreate(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.notification")
+        config.set_service_config()
+        config.set_global_force(CACHES={})
+        super().setUpClass()
+
+    def tearDown(self) -> None:
+        config.set_global(IDENTITY_LOOKUP_TIMEOUT=10)
+
+    def _create(self, resource_type="identity.User", resource_id="user-1"):
+        return NotificationService().create(
+            {
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "topic": "topic-a",
+                "message": {"title": "test"},
+                "domain_id": "domain-1",
+            }
+        )
+
+    def test_create(self, dispatch_resource, *args):
+        with patch.object(IdentityManager, "get_cached_resource"):
+            self._create()
+
+        dispatch_resource.assert_called_once()
+
+    @patch.object(IdentityManager, "get_cached_project_users")
+    def test_create_project_notification(
+        self, get_cached_project_users, dispatch_resource, *args
+    ):
+        with patch.object(IdentityManager, "get_cached_resource"):
+            self._create("identity.Project", "project-1")
+
+        # Project users are resolved only for "*" channels on dispatch
+        get_cached_project_users.assert_not_called()
+        dispatch_resource.assert_called_once()
+
+    def test_create_with_domain_lookup_error(self, dispatch_resource, domain_info, _):
+        domain_info.side_effect = ERROR_NOT_FOUND(key="domain_id", value="domain-1")
+
+        with patch.object(IdentityManager, "get_cached_resource"):
+            with self.assertRaises(ERROR_NOT_FOUND):
+                self._create()
+
+        dispatch_resource.assert_not_called()
+
+    def test_create_with_resource_lookup_error(self, dispatch_resource, *args):
+        with patch.object(
+            IdentityManager,
+            "get_cached_resource",
+            side_effect=ERROR_NOT_FOUND(key="user_id", value="user-1"),
+        ):
+            with self.assertLogs(
+                "spaceone.notification.service.notification_service", "ERROR"
+            ) as logs:
+                self.assertIsNone(self._create())
+
+        self.assertIn("[Notification] Failed to get resource:", logs.output[0])
+        dispatch_resource.assert_not_called()
+
+    def test_create_with_resource_lookup_timeout(self, dispatch_resource, *args):
+        config.set_global(IDENTITY_LOOKUP_TIMEOUT=1)
+        released = threading.Event()
+
+        with patch.object(
+            IdentityManager,
+            "get_cached_resource",
+            side_effect=lambda *args: released.wait(5),
+        ):
+            try:
+                with self.assertRaises(ERROR_IDENTITY_LOOKUP_TIMEOUT):
+                    self._create()
+            finally:
+                released.set()
+
+        dispatch_resource.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,109 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.manager.plugin_manager import PluginManager
+from spaceone.notification.service.notification_service import NotificationService
+
+
+@patch.object(NotificationService, "get_secret_data", return_value={"k": "v"})
+@patch.object(NotificationService, "_push_dispatch_task")
+class TestNotificationDispatchBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.notification")
+        config.set_service_config()
+        super().setUpClass()
+
+    def setUp(self) -> None:
+        self.protocol_vo = MagicMock(protocol_id="protocol-1")
+        self.message = {"title": "test"}
+        self.channels = [{"email": f"user-{i}@example.com"} for i in range(5)]
+
+    def tearDown(self) -> None:
+        config.set_global(DISPATCH_BATCH_SIZE=1)
+
+    def _push_channels(self):
+        notification_svc = NotificationService()
+
+        for channel in self.channels:
+            notification_svc.push_queue(
+                self.protocol_vo, channel, "INFO", self.message, "domain-1"
+            )
+
+        notification_svc.flush_queue()
+
+    def test_dispatch_task_per_channel(self, push_dispatch_task, *args):
+        self.assertEqual(1, config.get_global("DISPATCH_BATCH_SIZE"))
+
+        self._push_channels()
+
+        self.assertEqual(5, push_dispatch_task.call_count)
+        for call, channel in zip(push_dispatch_task.call_args_list, self.channels):
+            method, params = call.args
+            self.assertEqual("dispatch_notification", method)
+            self.assertEqual(channel, params["channel_data"])
+            self.assertEqual(self.message, params["message"])
+
+    def test_dispatch_batch(self, push_dispatch_task, *args):
+        config.set_global(DISPATCH_BATCH_SIZE=2)
+
+        self._push_channels()
+
+        calls = [call.args for call in push_dispatch_task.call_args_list]
+        self.assertEqual(
+            [
+                "dispatch_notification_batch",
+                "dispatch_notification_batch",
+                "dispatch_notification",
+            ],
+            [method for method, params in calls],
+        )
+        self.assertEqual(self.channels[:2], calls[0][1]["channels"])
+        self.assertEqual(self.channels[2:4], calls[1][1]["channels"])
+        self.assertEqual(self.channels[4], calls[2][1]["channel_data"])
+
+    @patch.object(NotificationService, "_acquire_quota", side_effect=lambda _, n: n)
+    @patch.object(NotificationService, "_release_quota")
+    @patch.object(NotificationService, "increment_fail_count")
+    @patch.object(NotificationService, "increment_usage")
+    @patch.object(PluginManager, "__init__", return_value=None)
+    def test_dispatch_batch_with_plugin_error(
+        self,
+        _,
+        increment_usage,
+        increment_fail_count,
+        release_quota,
+        *args,
+    ):
+        self.protocol_vo.plugin_info.to_dict.return_value = {
+            "options": {},
+            "metadata": {"supports_batch_dispatch": True, "max_batch_size": 2},
+        }
+        plugin_mgr = PluginManager()
+        plugin_mgr.noti_plugin_connector = MagicMock()
+        plugin_mgr.noti_plugin_connector.dispatch_notification_batch.side_effect = [
+            {"results": [{"index": 0, "success": True}, {"index": 1, "success": True}]},
+            RuntimeError("plugin error"),
+            {"results": [{"index": 0, "success": True}]},
+        ]
+
+        NotificationService()._dispatch_notification_batch(
+            self.protocol_vo,
+            {},
+            self.channels,
+            "INFO",
+            self.message,
+            plugin_mgr,
+            "domain-1",
+        )
+
+        increment_usage.assert_called_once_with(self.protocol_vo, 3)
+        release_quota.assert_called_once_with(self.protocol_vo, 2)
+        increment_fail_count.assert_called_once_with(self.protocol_vo, 2)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,257 @@
+import json
+import threading
+import unittest
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.transaction import get_transaction
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.manager.identity_manager import IdentityManager
+from spaceone.notification.manager.notification_event_manager import (
+    NotificationEventManager,
+)
+from spaceone.notification.model.notification_event_model import NotificationEvent
+from spaceone.notification.service.notification_service import NotificationService
+
+
+@patch("spaceone.notification.service.notification_service.queue.put")
+class TestNotificationFanOut(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.notification")
+        config.set_service_config()
+        config.set_global_force(CACHES={})
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        cls.metadata = {"token": "system-token", "x_domain_id": cls.domain_id}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.users = [{"user_id": f"user-{i}", "state": "ENABLED"} for i in range(5)]
+
+    def tearDown(self) -> None:
+        config.set_global_force(QUEUES={})
+        config.set_global(
+            NOTIFICATION_FANOUT="SYNC",
+            NOTIFICATION_FANOUT_CHUNK_SIZE=100,
+            NOTIFICATION_BROADCAST_CHECKPOINT_SIZE=20,
+        )
+        NotificationEvent.objects.filter().delete()
+
+    def _list_users_in_domain(self, query: dict, domain_id: str) -> dict:
+        users = self.users
+        for condition in query.get("filter", []):
+            users = [user for user in users if user["user_id"] > condition["v"]]
+
+        return {"results": users[: query["page"]["limit"]]}
+
+    def _create_event(self, resource_type: str = "identity.Domain"):
+        return NotificationEvent(
+            resource_type=resource_type,
+            resource_id=self.domain_id,
+            topic="topic-a",
+            message={"title": "test"},
+            domain_id=self.domain_id,
+        ).save()
+
+    @staticmethod
+    def _run_in_worker_thread(func, *args):
+        # Worker tasks run in threads without a transaction of a request
+        results = []
+
+        def _run():
+            try:
+                func(*args)
+                results.append(len(get_transaction()._rollbacks))
+            except Exception as e:
+                results.append(e)
+
+        thread = threading.Thread(target=_run)
+        thread.start()
+        thread.join()
+
+        return results[0]
+
+    def test_fan_out_notification_task_metadata(self, queue_put):
+        event_vo = self._create_event()
+        notification_svc = NotificationService(metadata=self.metadata)
+
+        rollback_count = self._run_in_worker_thread(
+            notification_svc.fan_out_notification, event_vo.event_id, self.domain_id
+        )
+
+        self.assertEqual(0, rollback_count)
+        self.assertEqual(
+            config.get_global("NOTIFICATION_BROADCAST_PARALLEL"), queue_put.call_count
+        )
+
+        for call in queue_put.call_args_list:
+            queue_name, task = call.args
+            stage = json.loads(task)["stages"][0]
+
+            self.assertEqual("notification_q", queue_name)
+            self.assertEqual("dispatch_domain_chunk", stage["method"])
+            self.assertEqual(self.metadata, stage["metadata"])
+
+        self.assertEqual("IN_PROGRESS", event_vo.reload().state)
+
+    @patch.object(IdentityManager, "__init__", return_value=None)
+    @patch.object(NotificationService, "dispatch_user_channels")
+    def test_dispatch_domain_without_queue(self, dispatch_user_channels, _, queue_put):
+        config.set_global(NOTIFICATION_FANOUT_CHUNK_SIZE=2)
+
+        with patch.object(
+            IdentityManager,
+            "list_users_in_domain",
+            side_effect=self._list_users_in_domain,
+        ):
+            NotificationService(metadata=self.metadata).dispatch_domain(
+                {
+                    "resource_type": "identity.Domain",
+                    "resource_id": self.domain_id,
+                    "topic": "topic-a",
+                    "message": {"title": "test"},
+                    "domain_id": self.domain_id,
+                }
+            )
+
+        self.assertEqual(
+            [["user-0", "user-1"], ["user-2", "user-3"], ["user-4"]],
+            [call.args[1] for call in dispatch_user_channels.call_args_list],
+        )
+        self.assertEqual(0, NotificationEvent.objects.count())
+        queue_put.assert_not_called()
+
+    @patch.object(IdentityManager, "__init__", return_value=None)
+    @patch.object(NotificationService, "dispatch_user_channels")
+    def test_dispatch_domain_with_queue(self, dispatch_user_channels, _, queue_put):
+        config.set_global_force(QUEUES={"notification_q": {}})
+        config.set_global(NOTIFICATION_FANOUT_CHUNK_SIZE=2)
+        notification_svc = NotificationService(metadata=self.metadata)
+
+        def _dispatch_user_channels(params, user_ids):
+            # Users removed in the middle of the job do not shift the next pages
+            if user_ids == ["user-0", "user-1"]:
+                del self.users[0]
+
+        dispatch_user_channels.side_effect = _dispatch_user_channels
+
+        with patch.object(
+            IdentityManager,
+            "list_users_in_domain",
+            side_effect=self._list_users_in_domain,
+        ):
+            notification_svc.dispatch_domain(
+                {
+                    "resource_type": "identity.Domain",
+                    "resource_id": self.domain_id,
+                    "topic": "topic-a",
+                    "message": {"title": "test"},
+                    "domain_id": self.domain_id,
+                }
+            )
+
+            event_vo = NotificationEvent.objects.get()
+            self.assertEqual("IN_PROGRESS", event_vo.state)
+            self.assertEqual(
+                config.get_global("NOTIFICATION_BROADCAST_PARALLEL"),
+                queue_put.call_count,
+            )
+
+            while event_vo.reload().state == "IN_PROGRESS":
+                notification_svc.dispatch_domain_chunk(
+                    event_vo.event_id, self.domain_id
+                )
+
+        self.assertEqual(
+            [["user-0", "user-1"], ["user-2", "user-3"], ["user-4"]],
+            [call.args[1] for call in dispatch_user_channels.call_args_list],
+        )
+        self.assertEqual(3, event_vo.total_pages)
+        self.assertEqual([0, 1, 2], sorted(event_vo.completed_pages))
+        self.assertEqual(
+            {
+                "0": [None, "user-1"],
+                "1": ["user-1", "user-3"],
+                "2": ["user-3", "user-4"],
+            },
+            event_vo.page_ranges,
+        )
+
+    def test_claim_broadcast_page(self, *args):
+        event_vo = self._create_event()
+        event_mgr = NotificationEventManager()
+        event_vo = event_mgr.start_broadcast_job(event_vo, 2)
+
+        self.assertTrue(event_mgr.claim_broadcast_page(event_vo, 0, "user-1"))
+        # The page was claimed by another task
+        self.assertFalse(event_mgr.claim_broadcast_page(event_vo, 0, "user-1"))
+
+        event_vo.reload()
+        self.assertEqual(1, event_vo.next_page)
+        self.assertEqual("user-1", event_vo.last_user_id)
+
+    @patch.object(IdentityManager, "__init__", return_value=None)
+    @patch.object(NotificationService, "dispatch_user_channels")
+    def test_resume_interrupted_page(self, dispatch_user_channels, *args):
+        config.set_global(NOTIFICATION_BROADCAST_CHECKPOINT_SIZE=2)
+        event_vo = self._create_event()
+        event_vo.update(
+            {
+                "state": "IN_PROGRESS",
+                "chunk_size": 5,
+                "next_page": 1,
+                "total_pages": 1,
+                "last_user_id": "user-4",
+                "page_ranges": {"0": [None, "user-4"]},
+            }
+        )
+        # Users added after the page was claimed belong to the next pages
+        self.users.append({"user_id": "user-5", "state": "ENABLED"})
+        dispatch_user_channels.side_effect = [None, RuntimeError("worker is killed")]
+
+        with patch.object(
+            IdentityManager,
+            "list_users_in_domain",
+            side_effect=self._list_users_in_domain,
+        ):
+            notification_svc = NotificationService(metadata=self.metadata)
+
+            with self.assertRaises(RuntimeError):
+                notification_svc.dispatch_domain_chunk(
+                    event_vo.event_id, self.domain_id, page=0
+                )
+
+            self.assertEqual({"0": "user-1"}, event_vo.reload().page_cursors)
+
+            dispatch_user_channels.reset_mock(side_effect=True)
+            notification_svc.dispatch_domain_chunk(
+                event_vo.event_id, self.domain_id, page=0
+            )
+
+        self.assertEqual(
+            [["user-2", "user-3"], ["user-4"]],
+            [call.args[1] for call in dispatch_user_channels.call_args_list],
+        )
+
+        event_vo.reload()
+        self.assertEqual([0], event_vo.completed_pages)
+        self.assertEqual({}, event_vo.page_cursors)
+        self.assertEqual("DONE", event_vo.state)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
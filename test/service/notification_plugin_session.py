@@ -0,0 +1,73 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from spaceone.core import config
+from spaceone.core import utils
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.manager.protocol_manager import ProtocolManager
+from spaceone.notification.model.project_channel_model import ProjectChannel
+from spaceone.notification.model.protocol_model import Protocol
+from spaceone.notification.service.notification_service import NotificationService
+from test.factory.project_channel_factory import ProjectChannelFactory
+from test.factory.protocol_factory import ProtocolFactory
+
+
+class TestNotificationPluginSession(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.notification")
+        config.set_service_config()
+        config.set_global_force(CACHES={})
+        connect(
+            "test", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def tearDown(self) -> None:
+        Protocol.objects.filter().delete()
+        ProjectChannel.objects.filter().delete()
+
+    def test_init_plugin_session_with_new_metadata(self):
+        protocol_vo = ProtocolFactory(domain_id=self.domain_id)
+        project_channel_vo = ProjectChannelFactory(
+            protocol_id=protocol_vo.protocol_id,
+            domain_id=self.domain_id,
+            protocol_snapshot=ProtocolManager.make_protocol_snapshot(protocol_vo),
+        )
+        plugin_mgr = MagicMock()
+        plugin_mgr.get_plugin_session.return_value = {
+            "metadata": {"data_type": "SECRET"}
+        }
+
+        def _init_plugin_session():
+            # Worker tasks run in threads without a transaction of a request
+            NotificationService()._init_plugin_session(
+                protocol_vo, plugin_mgr, self.domain_id
+            )
+
+        thread = threading.Thread(target=_init_plugin_session)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(
+            "SECRET", protocol_vo.reload().plugin_info.metadata["data_type"]
+        )
+        self.assertEqual(
+            "SECRET", project_channel_vo.reload().protocol_snapshot.data_type
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
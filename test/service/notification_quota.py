@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.notification.manager.quota_manager import QuotaManager
+from spaceone.notification.service.notification_service import NotificationService
+
+
+@patch.object(QuotaManager, "acquire_quota", side_effect=ConnectionError("redis"))
+class TestNotificationQuota(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.notification")
+        config.set_service_config()
+        super().setUpClass()
+
+    def setUp(self) -> None:
+        self.protocol_vo = MagicMock(protocol_id="protocol-1", domain_id="domain-1")
+
+    def tearDown(self) -> None:
+        config.set_global(QUOTA_FAIL_OPEN=True)
+
+    def test_acquire_quota_fail_open(self, *args):
+        with self.assertLogs(
+            "spaceone.notification.service.notification_service", "ERROR"
+        ):
+            granted = NotificationService()._acquire_quota(self.protocol_vo, 3)
+
+        self.assertEqual(3, granted)
+
+    def test_acquire_quota_fail_closed(self, *args):
+        config.set_global(QUOTA_FAIL_OPEN=False)
+
+        with self.assertLogs(
+            "spaceone.notification.service.notification_service", "ERROR"
+        ):
+            granted = NotificationService()._acquire_quota(self.protocol_vo, 3)
+
+        self.assertEqual(0, granted)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)